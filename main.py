@@ -10,5 +10,7 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
     # Crea una instancia de PersonaServicio, que ahora maneja vntEvaluacion
     vnt_evaluacion = PersonaServicio()
+    # Cerrar las conexiones del backend de almacenamiento al salir de la aplicación
+    app.aboutToQuit.connect(vnt_evaluacion.gestor.dao.cerrar)
     vnt_evaluacion.show()
     sys.exit(app.exec())
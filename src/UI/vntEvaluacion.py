@@ -21,8 +21,8 @@ from PySide6.QtWidgets import (QAbstractItemView, QApplication, QComboBox, QDate
     QHBoxLayout, QHeaderView, QLabel, QLineEdit,
     QMainWindow, QMenu, QMenuBar, QPushButton,
     QSizePolicy, QSpacerItem, QSpinBox, QStackedWidget,
-    QStatusBar, QTabWidget, QTableWidget, QTableWidgetItem,
-    QTextEdit, QVBoxLayout, QWidget)
+    QStatusBar, QTabWidget, QTableView, QTextEdit,
+    QVBoxLayout, QWidget)
 
 class Ui_vntEvaluacion(object):
     def setupUi(self, vntEvaluacion):
@@ -267,25 +267,13 @@ class Ui_vntEvaluacion(object):
 
         self.verticalLayout_lista.addLayout(self.horizontalLayout_filtros)
 
-        self.tableWidget_evaluaciones = QTableWidget(self.tab_lista)
-        if (self.tableWidget_evaluaciones.columnCount() < 5):
-            self.tableWidget_evaluaciones.setColumnCount(5)
-        __qtablewidgetitem = QTableWidgetItem()
-        self.tableWidget_evaluaciones.setHorizontalHeaderItem(0, __qtablewidgetitem)
-        __qtablewidgetitem1 = QTableWidgetItem()
-        self.tableWidget_evaluaciones.setHorizontalHeaderItem(1, __qtablewidgetitem1)
-        __qtablewidgetitem2 = QTableWidgetItem()
-        self.tableWidget_evaluaciones.setHorizontalHeaderItem(2, __qtablewidgetitem2)
-        __qtablewidgetitem3 = QTableWidgetItem()
-        self.tableWidget_evaluaciones.setHorizontalHeaderItem(3, __qtablewidgetitem3)
-        __qtablewidgetitem4 = QTableWidgetItem()
-        self.tableWidget_evaluaciones.setHorizontalHeaderItem(4, __qtablewidgetitem4)
-        self.tableWidget_evaluaciones.setObjectName(u"tableWidget_evaluaciones")
-        self.tableWidget_evaluaciones.setAlternatingRowColors(True)
-        self.tableWidget_evaluaciones.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.tableWidget_evaluaciones.setSortingEnabled(True)
-
-        self.verticalLayout_lista.addWidget(self.tableWidget_evaluaciones)
+        self.tableView_evaluaciones = QTableView(self.tab_lista)
+        self.tableView_evaluaciones.setObjectName(u"tableView_evaluaciones")
+        self.tableView_evaluaciones.setAlternatingRowColors(True)
+        self.tableView_evaluaciones.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.tableView_evaluaciones.setSortingEnabled(True)
+
+        self.verticalLayout_lista.addWidget(self.tableView_evaluaciones)
 
         self.horizontalLayout_botones_lista = QHBoxLayout()
         self.horizontalLayout_botones_lista.setObjectName(u"horizontalLayout_botones_lista")
@@ -460,16 +448,6 @@ class Ui_vntEvaluacion(object):
         self.cbFiltro.setItemText(3, QCoreApplication.translate("vntEvaluacion", u"Presentaci\u00f3n", None))
 
         self.btnActualizar.setText(QCoreApplication.translate("vntEvaluacion", u"Actualizar", None))
-        ___qtablewidgetitem = self.tableWidget_evaluaciones.horizontalHeaderItem(0)
-        ___qtablewidgetitem.setText(QCoreApplication.translate("vntEvaluacion", u"Nombre", None));
-        ___qtablewidgetitem1 = self.tableWidget_evaluaciones.horizontalHeaderItem(1)
-        ___qtablewidgetitem1.setText(QCoreApplication.translate("vntEvaluacion", u"Tipo", None));
-        ___qtablewidgetitem2 = self.tableWidget_evaluaciones.horizontalHeaderItem(2)
-        ___qtablewidgetitem2.setText(QCoreApplication.translate("vntEvaluacion", u"Fecha", None));
-        ___qtablewidgetitem3 = self.tableWidget_evaluaciones.horizontalHeaderItem(3)
-        ___qtablewidgetitem3.setText(QCoreApplication.translate("vntEvaluacion", u"Puntaje", None));
-        ___qtablewidgetitem4 = self.tableWidget_evaluaciones.horizontalHeaderItem(4)
-        ___qtablewidgetitem4.setText(QCoreApplication.translate("vntEvaluacion", u"Nota Calculada", None));
         self.btnVerDetalle.setText(QCoreApplication.translate("vntEvaluacion", u"Ver Detalle", None))
         self.btnEditar.setText(QCoreApplication.translate("vntEvaluacion", u"Editar", None))
         self.btnEliminar.setText(QCoreApplication.translate("vntEvaluacion", u"Eliminar", None))
@@ -0,0 +1,349 @@
+# src/datos/backend_evaluaciones.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import json
+import os
+from abc import ABC, abstractmethod
+
+from src.dominio.examen import Examen
+from src.dominio.presentacion import Presentacion
+from src.dominio.trabajo import Trabajo
+
+# Motor por defecto de crear_backend() y base de datos SQLite que usa si no se indica otra
+BACKEND_POR_DEFECTO = os.environ.get("EVALUACIONES_BACKEND", "sqlserver")
+RUTA_SQLITE_POR_DEFECTO = os.environ.get("EVALUACIONES_SQLITE", "evaluaciones.sqlite3")
+
+
+def crear_backend(nombre=None, **opciones):
+    """
+    Crea el backend de almacenamiento indicado: "sqlserver" (EvaluacionDAO) o "sqlite"
+    (EvaluacionDAOSQLite, que acepta ruta=...). Sin nombre se usa la variable de entorno
+    EVALUACIONES_BACKEND. Cada módulo se importa solo al elegirlo, así que SQLite no
+    necesita pyodbc ni el driver ODBC.
+    """
+    nombre = (nombre or BACKEND_POR_DEFECTO).lower()
+    if nombre == "sqlserver":
+        from src.datos.evaluacion_dao import EvaluacionDAO
+        return EvaluacionDAO(**opciones)
+    if nombre == "sqlite":
+        from src.datos.evaluacion_dao_sqlite import EvaluacionDAOSQLite
+        opciones.setdefault('ruta', RUTA_SQLITE_POR_DEFECTO)
+        return EvaluacionDAOSQLite(**opciones)
+    raise ValueError(f"Backend de almacenamiento desconocido: '{nombre}'.")
+
+
+class BackendEvaluaciones(ABC):
+    """
+    Interfaz de almacenamiento que usan GestorEvaluaciones y la escritura diferida.
+    Ambos motores comparten el esquema (Evaluaciones más una tabla por subtipo) y la
+    forma de las filas leídas, así que aquí viven las partes comunes: la validación de
+    unicidad, el alta individual, el borrado por nombre y la actualización por diferencias.
+    Cada subclase aporta su conexión (self.conexion con prestarCursor() y prestarSentencias())
+    y las operaciones propias de su dialecto (lotes, paginación, seguimiento de cambios).
+    Las operaciones de texto fijo que se repiten usan prestarSentencias(), así que cada
+    conexión del pool las prepara una sola vez. Las operaciones propias son abstractas: un
+    motor al que le falte alguna no se puede instanciar. El seguimiento de cambios es opcional
+    y solo se usa si el motor declara SOPORTA_CAMBIOS.
+    """
+    # True si el motor ofrece leer_marca_agua()/leer_cambios() para la caché local
+    SOPORTA_CAMBIOS = False
+    # Excepción del driver que se traduce a un mensaje en las operaciones comunes
+    ERROR_BD = Exception
+    # Errores del driver por datos que la base de datos rechaza (restricciones, desbordamientos) y
+    # por conexiones perdidas: _traducir() los convierte en ValueError y ConnectionError, para que
+    # quien llama distinga un rechazo definitivo de un fallo que vale la pena reintentar
+    ERRORES_DATOS = ()
+    ERRORES_CONEXION = ()
+
+    # Columnas de la tabla base y de cada tabla de subtipo, con el atributo de dominio que guardan
+    _COLUMNAS_BASE = (('Nombre', 'nombre'), ('Fecha', 'fecha'), ('Puntaje', 'puntaje'))
+    _TABLAS_SUBTIPO = {
+        'Examen': ('Examenes', (('Duracion', 'duracion_min'), ('NumPreguntas', 'num_preguntas'))),
+        'Trabajo': ('Trabajos', (('NumPaginas', 'num_paginas'), ('Tema', 'tema'))),
+        'Presentacion': ('Presentaciones', (('Duracion', 'duracion_min'), ('TamanoAudiencia', 'tamano_audiencia'))),
+    }
+
+    # Consulta de leer_evaluaciones_por_nombre(): las columnas de iterar_evaluaciones() para los
+    # nombres de un parámetro JSON, en el dialecto de cada motor
+    SQL_EVALUACIONES_POR_NOMBRE = None
+
+    # Consulta de leer_estadisticas() sobre VW_NotasEvaluaciones, en el dialecto de cada motor: una
+    # fila por tipo con (TipoEvaluacion, Cantidad, SumaNotas, EvaluacionID, Nombre, Nota de la mejor)
+    SQL_ESTADISTICAS_POR_TIPO = None
+
+    # --- Operaciones de cada motor ---
+    @abstractmethod
+    def guardar_evaluaciones_lote(self, evaluaciones, omitir_existentes=False):
+        """Inserta un lote en una transacción y retorna {nombre: EvaluacionID}."""
+
+    @abstractmethod
+    def iterar_evaluaciones(self, tamano_pagina=500, desde_id=0):
+        """Genera (EvaluacionID, evaluacion) en orden de ID, leyendo página a página."""
+
+    @abstractmethod
+    def eliminar_evaluaciones_lote(self, nombres):
+        """Elimina por nombre en una sentencia y retorna {nombre: EvaluacionID} de las borradas."""
+
+    @abstractmethod
+    def limpiar_todas_las_evaluaciones_bd(self):
+        """Elimina todas las evaluaciones (las filas de subtipo caen por ON DELETE CASCADE)."""
+
+    @abstractmethod
+    def cerrar(self):
+        """Cierra las conexiones del motor."""
+
+    @abstractmethod
+    def _insertar_fila_base(self, cursor, evaluacion):
+        """Inserta la fila de Evaluaciones y retorna el EvaluacionID generado."""
+
+    # --- Seguimiento de cambios (opcional: solo se llama si el motor declara SOPORTA_CAMBIOS) ---
+    def leer_marca_agua(self):
+        raise NotImplementedError(f"{type(self).__name__} no ofrece seguimiento de cambios.")
+
+    def leer_cambios(self, desde_marca):
+        raise NotImplementedError(f"{type(self).__name__} no ofrece seguimiento de cambios.")
+
+    def leer_horizonte_eliminadas(self):
+        """
+        Version más alta de los borrados anotados que ya se purgaron, o None si el motor no
+        purga: una copia local con una marca que no la supera puede haber perdido borrados.
+        """
+        return None
+
+    def estadisticas_sentencias(self):
+        """Aciertos, fallos y tasa de aciertos de las sentencias preparadas (ver RegistroSentencias)."""
+        return self.conexion.estadisticasSentencias()
+
+    def _ejecutar_sentencias(self, cursor, sentencias):
+        """Ejecuta una lista de (sql, parametros) dentro de la transacción del cursor."""
+        for sql, parametros in sentencias:
+            cursor.execute(sql, parametros)
+
+    def _error(self, ex, accion):
+        """Traduce un error del driver en una excepción con mensaje legible."""
+        print(f"Error de base de datos al {accion}: {ex}")
+        return self._traducir(ex, f"No se pudo {accion}: {ex}")
+
+    def _traducir(self, ex, mensaje):
+        """ValueError si la base de datos rechazó los datos, ConnectionError si se perdió la conexión."""
+        if isinstance(ex, self.ERRORES_DATOS):
+            return ValueError(mensaje)
+        if isinstance(ex, self.ERRORES_CONEXION):
+            return ConnectionError(mensaje)
+        return Exception(mensaje)
+
+    # --- Operaciones comunes ---
+    def insertar_evaluacion(self, evaluacion):
+        """
+        Inserta una evaluación (fila base y de subtipo) en una transacción y retorna su
+        EvaluacionID. Levanta ValueError si el nombre o el tema de un Trabajo ya existen.
+        """
+        try:
+            with self.conexion.prestarSentencias() as cursor:
+                self._comprobar_unicidad(cursor, evaluacion)
+                evaluacion_id = self._insertar_fila_base(cursor, evaluacion)
+                tabla, columnas = self._TABLAS_SUBTIPO[evaluacion.__class__.__name__]
+                cursor.execute(f"INSERT INTO {tabla} (EvaluacionID, {', '.join(c for c, _ in columnas)}) "
+                               f"VALUES (?{', ?' * len(columnas)})",
+                               (evaluacion_id,) + tuple(getattr(evaluacion, a) for _, a in columnas))
+                cursor.connection.commit()
+            return evaluacion_id
+        except self.ERROR_BD as ex:
+            raise self._error(ex, "guardar la evaluación")
+
+    def eliminar_evaluacion_bd(self, nombre, evaluacion_id=None):
+        """
+        Elimina una evaluación (las filas de subtipo caen por ON DELETE CASCADE). Si no se
+        conoce su EvaluacionID se busca por nombre. Retorna el EvaluacionID eliminado, o None
+        si no existía.
+        """
+        try:
+            with self.conexion.prestarSentencias() as cursor:
+                if evaluacion_id is None:
+                    evaluacion_id = self._buscar_id(cursor, nombre)
+                    if evaluacion_id is None:
+                        return None
+                cursor.execute("DELETE FROM Evaluaciones WHERE EvaluacionID = ?", (evaluacion_id,))
+                eliminadas = cursor.rowcount
+                cursor.connection.commit()
+            return evaluacion_id if eliminadas else None
+        except self.ERROR_BD as ex:
+            raise self._error(ex, "eliminar la evaluación")
+
+    def cambios_evaluacion(self, anterior, nueva):
+        """
+        Columnas que cambian al pasar de 'anterior' a 'nueva': (cambios_base, cambios_subtipo),
+        listas de (columna, valor). Con anterior None (o distinto tipo) se consideran todas.
+        """
+        tipo_nuevo = nueva.__class__.__name__
+        mismo_tipo = anterior is not None and anterior.__class__.__name__ == tipo_nuevo
+        cambios_base = self._columnas_cambiadas(self._COLUMNAS_BASE, anterior, nueva)
+        if not mismo_tipo:
+            cambios_base.append(('TipoEvaluacion', tipo_nuevo))
+        cambios_subtipo = self._columnas_cambiadas(
+            self._TABLAS_SUBTIPO[tipo_nuevo][1], anterior if mismo_tipo else None, nueva)
+        return cambios_base, cambios_subtipo
+
+    def actualizar_evaluacion_bd(self, nombre_original, anterior, nueva, evaluacion_id=None):
+        """
+        Actualiza en una transacción solo las columnas que cambiaron entre 'anterior' (la
+        versión en memoria, o None si no se conoce) y 'nueva'; si cambia el tipo, la fila de
+        subtipo se traslada de tabla. Retorna el EvaluacionID, o None si la original no existe.
+        Levanta ValueError si el nuevo nombre o tema ya los usa otra evaluación.
+        """
+        cambios_base, cambios_subtipo = self.cambios_evaluacion(anterior, nueva)
+        try:
+            with self.conexion.prestarSentencias() as cursor:
+                if evaluacion_id is None:
+                    evaluacion_id = self._buscar_id(cursor, nombre_original)
+                    if evaluacion_id is None:
+                        return None
+                # Verificar el nuevo nombre y el tema solo si cambiaron
+                self._comprobar_unicidad(cursor, nueva, excepto_id=evaluacion_id,
+                                         nombre=nombre_original != nueva.nombre,
+                                         tema=any(columna == 'Tema' for columna, _ in cambios_subtipo))
+                self._ejecutar_sentencias(cursor, self._sentencias_actualizacion(
+                    evaluacion_id, anterior, nueva, cambios_base, cambios_subtipo))
+                cursor.connection.commit()
+            return evaluacion_id
+        except self.ERROR_BD as ex:
+            raise self._error(ex, "actualizar la evaluación")
+
+    def actualizar_evaluaciones_lote(self, cambios):
+        """
+        Aplica en una transacción una lista de (nombre_original, evaluacion), reescribiendo la
+        fila completa. Las que ya no existen con su nombre original se ignoran, así que
+        reaplicar un cambio es inocuo. Levanta ValueError (sin aplicar ninguna) si un nuevo
+        nombre o tema ya los usa otra evaluación.
+        """
+        cambios = list(cambios)
+        if not cambios:
+            return
+        try:
+            with self.conexion.prestarSentencias() as cursor:
+                for nombre_original, evaluacion in cambios:
+                    evaluacion_id = self._buscar_id(cursor, nombre_original)
+                    if evaluacion_id is not None:
+                        self._comprobar_unicidad(cursor, evaluacion, excepto_id=evaluacion_id)
+                        cambios_base, cambios_subtipo = self.cambios_evaluacion(None, evaluacion)
+                        self._ejecutar_sentencias(cursor, self._sentencias_actualizacion(
+                            evaluacion_id, None, evaluacion, cambios_base, cambios_subtipo))
+                cursor.connection.commit()
+        except self.ERROR_BD as ex:
+            raise self._error(ex, "actualizar las evaluaciones")
+
+    def leer_estadisticas(self):
+        """
+        Agrega las notas en el servidor (GROUP BY TipoEvaluacion) sin traer las filas.
+        Retorna {tipo: (cantidad, suma_notas, mejor_id, mejor_nombre, mejor_nota)} solo con
+        los tipos que tienen evaluaciones; la mejor es la de nota más alta y, a igualdad,
+        la de menor EvaluacionID.
+        """
+        try:
+            with self.conexion.prestarSentencias() as cursor:
+                cursor.execute(self.SQL_ESTADISTICAS_POR_TIPO)
+                filas = cursor.fetchall()
+        except self.ERROR_BD as ex:
+            raise self._error(ex, "calcular las estadísticas")
+        return {fila[0]: (fila[1], float(fila[2]), fila[3], fila[4], float(fila[5])) for fila in filas}
+
+    def leer_evaluaciones_por_nombre(self, nombres):
+        """Lee las evaluaciones con esos nombres en una consulta: {nombre: (EvaluacionID, evaluacion)}."""
+        nombres = list(dict.fromkeys(nombres))
+        if not nombres:
+            return {}
+        try:
+            with self.conexion.prestarSentencias() as cursor:
+                cursor.execute(self.SQL_EVALUACIONES_POR_NOMBRE, (json.dumps(nombres),))
+                filas = cursor.fetchall()
+        except self.ERROR_BD as ex:
+            raise self._error(ex, "leer las evaluaciones")
+        leidas = {}
+        for fila in filas:
+            evaluacion = self._evaluacion_desde_fila(fila)
+            if evaluacion is not None:
+                leidas[evaluacion.nombre] = (fila[0], evaluacion)
+        return leidas
+
+    def obtener_evaluacion_bd(self, evaluacion_id):
+        """Lee una evaluación por su EvaluacionID (una página de una fila), o None si no existe."""
+        for encontrada_id, evaluacion in self.iterar_evaluaciones(1, evaluacion_id - 1):
+            return evaluacion if encontrada_id == evaluacion_id else None
+        return None
+
+    # --- Auxiliares ---
+    @staticmethod
+    def _buscar_id(cursor, nombre):
+        cursor.execute("SELECT EvaluacionID FROM Evaluaciones WHERE Nombre = ?", (nombre,))
+        fila = cursor.fetchone()
+        return None if fila is None else fila[0]
+
+    @staticmethod
+    def _comprobar_unicidad(cursor, evaluacion, excepto_id=None, nombre=True, tema=True):
+        """Levanta ValueError si otra evaluación ya usa el nombre o (si es un Trabajo) el tema."""
+        excepto_id = -1 if excepto_id is None else excepto_id
+        if nombre:
+            cursor.execute("SELECT COUNT(*) FROM Evaluaciones WHERE Nombre = ? AND EvaluacionID <> ?",
+                           (evaluacion.nombre, excepto_id))
+            if cursor.fetchone()[0] > 0:
+                raise ValueError(f"Ya existe una evaluación con el nombre '{evaluacion.nombre}'.")
+        if tema and isinstance(evaluacion, Trabajo):
+            cursor.execute("SELECT COUNT(*) FROM Trabajos WHERE Tema = ? AND EvaluacionID <> ?",
+                           (evaluacion.tema, excepto_id))
+            if cursor.fetchone()[0] > 0:
+                raise ValueError(f"Ya existe un Trabajo con el tema '{evaluacion.tema}'.")
+
+    def _sentencias_actualizacion(self, evaluacion_id, anterior, nueva, cambios_base, cambios_subtipo):
+        """Lista de (sql, parametros) que lleva la fila 'evaluacion_id' de 'anterior' a 'nueva'."""
+        sentencias = []
+        if cambios_base:
+            sentencias.append((f"UPDATE Evaluaciones SET {', '.join(f'{c} = ?' for c, _ in cambios_base)} "
+                               f"WHERE EvaluacionID = ?;",
+                               [valor for _, valor in cambios_base] + [evaluacion_id]))
+        tipo_nuevo = nueva.__class__.__name__
+        tipo_anterior = anterior.__class__.__name__ if anterior is not None else None
+        tabla = self._TABLAS_SUBTIPO[tipo_nuevo][0]
+        if tipo_nuevo == tipo_anterior:
+            if cambios_subtipo:
+                sentencias.append((f"UPDATE {tabla} SET {', '.join(f'{c} = ?' for c, _ in cambios_subtipo)} "
+                                   f"WHERE EvaluacionID = ?;",
+                                   [valor for _, valor in cambios_subtipo] + [evaluacion_id]))
+        else:
+            # Cambio de tipo: la fila se traslada de tabla (si no se conoce el tipo anterior,
+            # se limpian todas las tablas de subtipo)
+            if tipo_anterior is None:
+                tablas_anteriores = [t for t, _ in self._TABLAS_SUBTIPO.values()]
+            else:
+                tablas_anteriores = [self._TABLAS_SUBTIPO[tipo_anterior][0]]
+            for tabla_anterior in tablas_anteriores:
+                sentencias.append((f"DELETE FROM {tabla_anterior} WHERE EvaluacionID = ?;", [evaluacion_id]))
+            sentencias.append((f"INSERT INTO {tabla} (EvaluacionID, {', '.join(c for c, _ in cambios_subtipo)}) "
+                               f"VALUES (?{', ?' * len(cambios_subtipo)});",
+                               [evaluacion_id] + [valor for _, valor in cambios_subtipo]))
+        return sentencias
+
+    @staticmethod
+    def _columnas_cambiadas(columnas, anterior, nueva):
+        """Lista de (columna, valor nuevo) que difieren; con anterior None se consideran todas."""
+        return [(columna, getattr(nueva, atributo)) for columna, atributo in columnas
+                if anterior is None or getattr(anterior, atributo) != getattr(nueva, atributo)]
+
+    @staticmethod
+    def _evaluacion_desde_fila(row):
+        """
+        Construye la evaluación de una fila (EvaluacionID, Nombre, Fecha, Puntaje, TipoEvaluacion,
+        columnas de Examen, de Trabajo y de Presentacion), o None si está incompleta.
+        """
+        nombre, fecha, puntaje, tipo_evaluacion = row[1], row[2], float(row[3]), row[4]
+        if tipo_evaluacion == 'Examen':
+            duracion_min, num_preguntas = row[5], row[6]
+            if duracion_min is not None and num_preguntas is not None:
+                return Examen(nombre, fecha, puntaje, duracion_min, num_preguntas)
+        elif tipo_evaluacion == 'Trabajo':
+            num_paginas, tema = row[7], row[8]
+            if num_paginas is not None and tema is not None:
+                return Trabajo(nombre, fecha, puntaje, num_paginas, tema)
+        elif tipo_evaluacion == 'Presentacion':
+            duracion_min, tamano_audiencia = row[9], row[10]
+            if duracion_min is not None and tamano_audiencia is not None:
+                return Presentacion(nombre, fecha, puntaje, duracion_min, tamano_audiencia)
+        return None
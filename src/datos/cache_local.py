@@ -0,0 +1,110 @@
+# src/datos/cache_local.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import sqlite3
+from contextlib import closing
+from datetime import date
+
+from src.dominio.examen import Examen
+from src.dominio.presentacion import Presentacion
+from src.dominio.trabajo import Trabajo
+
+
+class CacheEvaluaciones:
+    """
+    Copia local (SQLite) de las evaluaciones leídas de SQL Server, sellada con la marca de
+    agua de la última lectura. Al iniciar se carga la copia y solo se piden al servidor los
+    cambios posteriores a la marca (ver EvaluacionDAO.leer_cambios).
+    Cada método abre y cierra su propia conexión, así que puede usarse desde cualquier hilo.
+    """
+    VERSION_FORMATO = 1
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+
+    def _conectar(self):
+        conexion = sqlite3.connect(self.ruta)
+        conexion.executescript("""
+        CREATE TABLE IF NOT EXISTS meta (clave TEXT PRIMARY KEY, valor);
+        CREATE TABLE IF NOT EXISTS evaluaciones (
+            id INTEGER PRIMARY KEY,
+            nombre TEXT NOT NULL,
+            fecha TEXT NOT NULL,
+            puntaje REAL NOT NULL,
+            tipo TEXT NOT NULL,
+            duracion_min INTEGER,
+            num_preguntas INTEGER,
+            num_paginas INTEGER,
+            tema TEXT,
+            tamano_audiencia INTEGER
+        );
+        """)
+        return conexion
+
+    def cargar(self):
+        """
+        Retorna (marca, filas) con la marca de agua guardada y la lista de
+        (EvaluacionID, evaluacion) en orden de ID, o None si no hay una copia válida.
+        """
+        with closing(self._conectar()) as conexion:
+            marca = self._marca(conexion)
+            if marca is None:
+                return None
+            filas = [(fila[0], self._evaluacion_desde_fila(fila))
+                     for fila in conexion.execute("SELECT * FROM evaluaciones ORDER BY id")]
+            return marca, filas
+
+    def leer_marca(self):
+        """Marca de agua con la que está sellada la copia, o None si no hay una copia válida."""
+        with closing(self._conectar()) as conexion:
+            return self._marca(conexion)
+
+    def guardar(self, marca, filas):
+        """Sustituye la copia entera por 'filas' ((EvaluacionID, evaluacion)) sellada con 'marca'."""
+        with closing(self._conectar()) as conexion, conexion:
+            conexion.execute("DELETE FROM evaluaciones")
+            conexion.executemany("INSERT INTO evaluaciones VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                 (self._fila_desde_evaluacion(i, e) for i, e in filas))
+            self._sellar(conexion, marca)
+
+    def aplicar_cambios(self, marca, cambiadas, eliminadas):
+        """Aplica a la copia un delta de EvaluacionDAO.leer_cambios() y la sella con la nueva marca."""
+        with closing(self._conectar()) as conexion, conexion:
+            conexion.executemany("DELETE FROM evaluaciones WHERE id = ?", ((i,) for i in eliminadas))
+            conexion.executemany("INSERT OR REPLACE INTO evaluaciones VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                 (self._fila_desde_evaluacion(i, e) for i, e in cambiadas))
+            self._sellar(conexion, marca)
+
+    def invalidar(self):
+        """Descarta la copia: la próxima carga será completa desde el servidor."""
+        with closing(self._conectar()) as conexion, conexion:
+            conexion.execute("DELETE FROM meta")
+            conexion.execute("DELETE FROM evaluaciones")
+
+    def _marca(self, conexion):
+        meta = dict(conexion.execute("SELECT clave, valor FROM meta"))
+        if meta.get('formato') != self.VERSION_FORMATO or meta.get('marca') is None:
+            return None
+        return bytes(meta['marca'])
+
+    def _sellar(self, conexion, marca):
+        conexion.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                             [('formato', self.VERSION_FORMATO), ('marca', marca)])
+
+    @staticmethod
+    def _fila_desde_evaluacion(evaluacion_id, evaluacion):
+        base = (evaluacion_id, evaluacion.nombre, evaluacion.fecha.isoformat(), float(evaluacion.puntaje))
+        if isinstance(evaluacion, Examen):
+            return base + ('Examen', evaluacion.duracion_min, evaluacion.num_preguntas, None, None, None)
+        if isinstance(evaluacion, Trabajo):
+            return base + ('Trabajo', None, None, evaluacion.num_paginas, evaluacion.tema, None)
+        return base + ('Presentacion', evaluacion.duracion_min, None, None, None, evaluacion.tamano_audiencia)
+
+    @staticmethod
+    def _evaluacion_desde_fila(fila):
+        _, nombre, fecha, puntaje, tipo, duracion_min, num_preguntas, num_paginas, tema, tamano_audiencia = fila
+        fecha = date.fromisoformat(fecha)
+        if tipo == 'Examen':
+            return Examen(nombre, fecha, puntaje, duracion_min, num_preguntas)
+        if tipo == 'Trabajo':
+            return Trabajo(nombre, fecha, puntaje, num_paginas, tema)
+        return Presentacion(nombre, fecha, puntaje, duracion_min, tamano_audiencia)
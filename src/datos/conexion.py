@@ -1,74 +1,118 @@
 # src/datos/conexion.py
 import sys
 #nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import threading
+
 import pyodbc as bd
 
+from src.datos.pool_conexiones import ConnectionPool
+
+
 class Conexion:
     _SERVIDOR = 'WILLIAM-PC\\VELEZSQLSERVER'
     _BBDD = 'GestionEvaluaciones'
     _USUARIO = 'Evaluaciones'
     _PASSWORD = '1234'
 
-    _conexion = None
-    _cursor = None
+    _pool = None
+    _lock_pool = threading.Lock()
+
+    # Parámetros del pool de conexiones compartido por el DAO y el gestor
+    _POOL_MIN = 1
+    _POOL_MAX = 5
+    _POOL_MAX_INACTIVIDAD = 300.0  # segundos antes de desalojar una conexión ociosa
+
+    @classmethod
+    def _crearConexion(cls):
+        """
+        Abre una conexión física nueva contra SQL Server.
+        Levanta ConnectionError si no se puede conectar.
+        """
+        try:
+            # Modificado para usar un tiempo de espera más corto para la conexión
+            # connect_timeout=5 significa 5 segundos. Ajusta si es necesario.
+            conexion = bd.connect(
+                f'DRIVER={{ODBC Driver 17 for SQL Server}};'
+                f'SERVER={cls._SERVIDOR};'
+                f'DATABASE={cls._BBDD};'
+                f'UID={cls._USUARIO};'
+                f'PWD={cls._PASSWORD};'
+                f'CONNECT TIMEOUT=5;' # Añadir un timeout para no esperar indefinidamente
+            )
+            print("Conexión a SQL Server establecida exitosamente.")
+            return conexion
+        except bd.Error as ex:
+            sqlstate = ex.args[0]
+            print(f"Error de conexión a SQL Server (SQLSTATE: {sqlstate}): {ex.args[1]}")
+            # En lugar de sys.exit(1), levantamos una excepción.
+            # Puedes crear una excepción custom si quieres, o usar una genérica.
+            raise ConnectionError(f"No se pudo conectar a la base de datos: {ex.args[1]}")
+        except Exception as e:
+            print(f"Error inesperado al intentar conectar: {e}")
+            raise ConnectionError(f"Error inesperado al conectar a la base de datos: {e}")
+
+    @classmethod
+    def obtenerPool(cls):
+        """Devuelve el pool compartido, creándolo en el primer uso."""
+        if cls._pool is None:
+            with cls._lock_pool:
+                if cls._pool is None:
+                    cls._pool = ConnectionPool(cls._crearConexion,
+                                               min_size=cls._POOL_MIN,
+                                               max_size=cls._POOL_MAX,
+                                               max_inactividad=cls._POOL_MAX_INACTIVIDAD)
+        return cls._pool
+
+    @classmethod
+    def prestarConexion(cls):
+        """
+        Context manager que presta una conexión del pool:
+
+            with Conexion.prestarConexion() as conexion:
+                cursor = conexion.cursor()
+        """
+        return cls.obtenerPool().conexion()
+
+    @classmethod
+    def prestarCursor(cls):
+        """
+        Context manager que presta un cursor sobre una conexión del pool.
+        La transacción se confirma con cursor.commit(); si el bloque falla se revierte.
+        """
+        return cls.obtenerPool().cursor()
 
     @classmethod
-    def obtenerConexion(cls):
-        if cls._conexion is None:
-            try:
-                # Modificado para usar un tiempo de espera más corto para la conexión
-                # connect_timeout=5 significa 5 segundos. Ajusta si es necesario.
-                cls._conexion = bd.connect(
-                    f'DRIVER={{ODBC Driver 17 for SQL Server}};'
-                    f'SERVER={cls._SERVIDOR};'
-                    f'DATABASE={cls._BBDD};'
-                    f'UID={cls._USUARIO};'
-                    f'PWD={cls._PASSWORD};'
-                    f'CONNECT TIMEOUT=5;' # Añadir un timeout para no esperar indefinidamente
-                )
-                print("Conexión a SQL Server establecida exitosamente.")
-            except bd.Error as ex:
-                sqlstate = ex.args[0]
-                print(f"Error de conexión a SQL Server (SQLSTATE: {sqlstate}): {ex.args[1]}")
-                # En lugar de sys.exit(1), levantamos una excepción.
-                # Puedes crear una excepción custom si quieres, o usar una genérica.
-                raise ConnectionError(f"No se pudo conectar a la base de datos: {ex.args[1]}")
-            except Exception as e:
-                print(f"Error inesperado al intentar conectar: {e}")
-                raise ConnectionError(f"Error inesperado al conectar a la base de datos: {e}")
-        return cls._conexion
+    def prestarSentencias(cls):
+        """
+        Context manager como prestarCursor(), pero con las sentencias preparadas de la
+        conexión: repetir un mismo texto SQL reutiliza su plan en lugar de volver a compilarlo.
+        """
+        return cls.obtenerPool().sentencias()
 
     @classmethod
-    def obtenerCursor(cls):
-        if cls._cursor is None:
-            # Asegurarse de que la conexión exista antes de obtener el cursor
-            cls.obtenerConexion() # Esto intentará conectar si no lo está
-            cls._cursor = cls._conexion.cursor()
-        return cls._cursor
+    def estadisticasSentencias(cls):
+        """Aciertos y fallos del registro de sentencias preparadas del pool."""
+        return cls.obtenerPool().registro_sentencias.estadisticas()
 
     @classmethod
-    def cerrarConexion(cls):
-        if cls._cursor:
-            cls._cursor.close()
-            cls._cursor = None
-        if cls._conexion:
-            cls._conexion.close()
-            cls._conexion = None
-            print("Conexión a SQL Server cerrada.")
+    def cerrarPool(cls):
+        with cls._lock_pool:
+            if cls._pool is not None:
+                cls._pool.cerrar()
+                cls._pool = None
+                print("Pool de conexiones a SQL Server cerrado.")
 
-# El bloque __main__ para pruebas puede seguir como está, pero ten en cuenta que ahora
-# levantará una excepción en lugar de salir directamente si falla la conexión.
+# Prueba de conexión: levanta una excepción en lugar de salir directamente si falla la conexión.
 if __name__ == '__main__':
     print("Intentando probar la conexión a la base de datos...")
     try:
-        conn = Conexion.obtenerConexion()
-        cursor = Conexion.obtenerCursor()
-        cursor.execute("SELECT GETDATE() AS CurrentDateTime;")
-        result = cursor.fetchone()
+        with Conexion.prestarCursor() as cursor:
+            cursor.execute("SELECT GETDATE() AS CurrentDateTime;")
+            result = cursor.fetchone()
         print(f"Consulta de prueba exitosa. Fecha/Hora del servidor: {result[0]}")
     except ConnectionError as ce:
         print(f"Falló la prueba de conexión (controlado): {ce}")
     except Exception as e:
         print(f"Falló la prueba de conexión (inesperado): {e}")
     finally:
-        Conexion.cerrarConexion()
\ No newline at end of file
+        Conexion.cerrarPool()
\ No newline at end of file
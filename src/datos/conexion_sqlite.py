@@ -0,0 +1,62 @@
+# src/datos/conexion_sqlite.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import sqlite3
+
+from src.datos.pool_conexiones import ConnectionPool
+
+
+class ConexionSQLite:
+    """
+    Conexiones a una base de datos SQLite local, prestadas desde un ConnectionPool igual que
+    las de SQL Server. Cada conexión abre la base en modo WAL (los lectores no bloquean al
+    escritor), con claves foráneas activas para el ON DELETE CASCADE del esquema y una caché
+    de sentencias preparadas por conexión.
+    """
+    _POOL_MIN = 1
+    _POOL_MAX = 5
+    _POOL_MAX_INACTIVIDAD = 300.0
+    _TIMEOUT = 10.0               # segundos de espera si otra conexión tiene la base bloqueada
+    _SENTENCIAS_EN_CACHE = 256    # sentencias preparadas que conserva cada conexión
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self._pool = ConnectionPool(self._crearConexion,
+                                    min_size=self._POOL_MIN,
+                                    max_size=self._POOL_MAX,
+                                    max_inactividad=self._POOL_MAX_INACTIVIDAD)
+
+    def _crearConexion(self):
+        """Abre una conexión nueva. Levanta ConnectionError si no se puede abrir la base."""
+        try:
+            # check_same_thread=False: el pool garantiza que cada conexión la usa un hilo a la vez.
+            # uri=True permite rutas como 'file:prueba?mode=memory&cache=shared'.
+            conexion = sqlite3.connect(self.ruta, timeout=self._TIMEOUT, check_same_thread=False,
+                                       cached_statements=self._SENTENCIAS_EN_CACHE,
+                                       uri=self.ruta.startswith('file:'))
+            conexion.execute("PRAGMA journal_mode = WAL")
+            conexion.execute("PRAGMA synchronous = NORMAL")  # Con WAL sigue siendo seguro ante caídas de la aplicación
+            conexion.execute("PRAGMA foreign_keys = ON")
+            return conexion
+        except sqlite3.Error as ex:
+            print(f"Error al abrir la base de datos SQLite '{self.ruta}': {ex}")
+            raise ConnectionError(f"No se pudo abrir la base de datos SQLite: {ex}")
+
+    def prestarConexion(self):
+        return self._pool.conexion()
+
+    def prestarCursor(self):
+        """
+        Context manager que presta un cursor sobre una conexión del pool.
+        La transacción se confirma con cursor.connection.commit(); si el bloque falla se revierte.
+        """
+        return self._pool.cursor()
+
+    def prestarSentencias(self):
+        """Como prestarCursor(), con un cursor preparado por sentencia y conexión (ver RegistroSentencias)."""
+        return self._pool.sentencias()
+
+    def estadisticasSentencias(self):
+        return self._pool.registro_sentencias.estadisticas()
+
+    def cerrarPool(self):
+        self._pool.cerrar()
@@ -1,232 +1,451 @@
 # src/datos/evaluacion_dao.py
 #nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import json
 import pyodbc
+from src.datos.backend_evaluaciones import BackendEvaluaciones
 from src.datos.conexion import Conexion # <--- Importación corregida
-from src.dominio.evaluacion import Evaluacion
 from src.dominio.examen import Examen
 from src.dominio.trabajo import Trabajo
 from src.dominio.presentacion import Presentacion
-from datetime import date
 
-class EvaluacionDAO:
+class EvaluacionDAO(BackendEvaluaciones):
     """
     Data Access Object (DAO) para la entidad Evaluacion.
     Maneja la persistencia de objetos Evaluacion en la base de datos SQL Server.
     """
+    SOPORTA_CAMBIOS = True
+    ERROR_BD = pyodbc.Error
+    ERRORES_DATOS = (pyodbc.IntegrityError, pyodbc.DataError)  # Restricciones, DECIMAL desbordado
+    ERRORES_CONEXION = (pyodbc.OperationalError, pyodbc.InterfaceError)
+
     def __init__(self):
-        self.conexion = Conexion()
+        # Conexion solo tiene métodos de clase sobre el pool compartido: se usa la clase directamente
+        self.conexion = Conexion
+
+    def cerrar(self):
+        self.conexion.cerrarPool()
+
+    def _error(self, ex, accion):
+        sqlstate = ex.args[0]
+        print(f"Error SQLSTATE al {accion}: {sqlstate}. Mensaje: {ex.args[1]}")
+        return self._traducir(ex, f"No se pudo {accion}: {ex.args[1]}")
+
+    def _traducir(self, ex, mensaje):
+        # SQLSTATE de clase 08: la conexión se cortó o no se pudo abrir, sea cual sea la excepción de pyodbc
+        if str(ex.args[0]).startswith('08'):
+            return ConnectionError(mensaje)
+        return super()._traducir(ex, mensaje)
+
+    def _insertar_fila_base(self, cursor, evaluacion):
+        cursor.execute("""
+        INSERT INTO Evaluaciones (Nombre, Fecha, Puntaje, TipoEvaluacion)
+        OUTPUT INSERTED.EvaluacionID
+        VALUES (?, ?, ?, ?)
+        """, (evaluacion.nombre, evaluacion.fecha, evaluacion.puntaje, evaluacion.__class__.__name__))
+        return cursor.fetchone()[0]
+
+    def _ejecutar_sentencias(self, cursor, sentencias):
+        # Un solo batch: una ida y vuelta al servidor para todas las sentencias
+        if sentencias:
+            cursor.execute("SET NOCOUNT ON;\n" + "\n".join(sql for sql, _ in sentencias),
+                           [valor for _, parametros in sentencias for valor in parametros])
 
     def _ejecutar_consulta(self, query, params=None, fetch=False, commit=False):
         """
         Método auxiliar para ejecutar consultas SQL.
         """
-        conn = None
-        cursor = None
         result = None
         try:
-            conn = self.conexion.obtenerConexion()
-            cursor = conn.cursor()
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
+            with self.conexion.prestarCursor() as cursor:
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
 
-            if fetch:
-                result = cursor.fetchall()
-            if commit:
-                conn.commit()
+                if fetch:
+                    result = cursor.fetchall()
+                if commit:
+                    cursor.commit()
             return result
         except pyodbc.Error as ex:
             sqlstate = ex.args[0]
             print(f"Error SQLSTATE: {sqlstate}. Mensaje: {ex.args[1]}")
             raise Exception(f"Error en la operación de base de datos: {ex.args[1]}")
-        finally:
-            if cursor:
-                cursor.close()
 
-    def guardar_evaluacion(self, evaluacion: Evaluacion):
+    def guardar_evaluaciones_lote(self, evaluaciones, omitir_existentes=False):
         """
-        Guarda una evaluación (y sus detalles específicos si aplica) en la base de datos.
+        Guarda un lote de evaluaciones en una sola transacción.
+        Las filas se envían de una vez a una tabla temporal con fast_executemany; la
+        unicidad de nombres y temas se comprueba con una consulta por conjuntos y las
+        filas base y de subtipo se insertan en un único batch que recupera los IDs
+        generados mediante OUTPUT ... INTO una variable de tabla.
+        Con omitir_existentes=True las evaluaciones cuyo nombre ya está en la base de datos se
+        descartan en lugar de rechazar el lote (reenvío idempotente desde el diario de escrituras).
+        Retorna un diccionario {nombre: EvaluacionID} de las insertadas. Levanta una excepción si hay un error.
         """
-        conn = None
-        cursor = None
-        try:
-            conn = self.conexion.obtenerConexion()
-            cursor = conn.cursor()
+        filas = []
+        nombres_lote = set()
+        temas_lote = set()
+        for evaluacion in evaluaciones:
+            # Duplicados dentro del propio lote (la base de datos no los vería hasta el INSERT)
+            if evaluacion.nombre in nombres_lote:
+                raise ValueError(f"El lote contiene más de una evaluación con el nombre '{evaluacion.nombre}'.")
+            nombres_lote.add(evaluacion.nombre)
 
-            sql_base = """
-            INSERT INTO Evaluaciones (Nombre, Fecha, Puntaje, TipoEvaluacion)
-            OUTPUT INSERTED.EvaluacionID
-            VALUES (?, ?, ?, ?)
-            """
-            eval_fecha = getattr(evaluacion, 'fecha', date.today()) # Asume que Evaluacion tiene 'fecha', si no, usa today()
+            duracion = num_preguntas = num_paginas = tema = tamano_audiencia = None
+            if isinstance(evaluacion, Examen):
+                duracion, num_preguntas = evaluacion.duracion_min, evaluacion.num_preguntas
+            elif isinstance(evaluacion, Trabajo):
+                if evaluacion.tema in temas_lote:
+                    raise ValueError(f"El lote contiene más de un Trabajo con el tema '{evaluacion.tema}'.")
+                temas_lote.add(evaluacion.tema)
+                num_paginas, tema = evaluacion.num_paginas, evaluacion.tema
+            elif isinstance(evaluacion, Presentacion):
+                duracion, tamano_audiencia = evaluacion.duracion_min, evaluacion.tamano_audiencia
 
-            params_base = (
+            filas.append((
+                len(filas),
                 evaluacion.nombre,
-                eval_fecha,
-                evaluacion.calcular_nota(),
-                evaluacion.__class__.__name__
-            )
+                evaluacion.fecha,
+                float(evaluacion.puntaje),
+                evaluacion.__class__.__name__,
+                duracion,
+                num_preguntas,
+                num_paginas,
+                tema,
+                tamano_audiencia
+            ))
 
-            cursor.execute(sql_base, params_base)
-            evaluacion_id = cursor.fetchone()[0] # Obtener el ID generado
+        if not filas:
+            return {}
 
-            if isinstance(evaluacion, Examen):
-                sql_subclase = """
-                INSERT INTO Examenes (EvaluacionID, Duracion)
-                VALUES (?, ?)
-                """
-                duracion = getattr(evaluacion, 'duracion_min', 0) # Asegúrate de que Examen tenga este atributo
-                params_subclase = (evaluacion_id, duracion)
-                cursor.execute(sql_subclase, params_subclase)
-            elif isinstance(evaluacion, Trabajo):
-                sql_subclase = """
-                INSERT INTO Trabajos (EvaluacionID, FechaEntrega)
-                VALUES (?, ?)
-                """
-                fecha_entrega = getattr(evaluacion, 'fecha_entrega', date.today()) # Asegúrate de que Trabajo tenga este atributo
-                params_subclase = (evaluacion_id, fecha_entrega)
-                cursor.execute(sql_subclase, params_subclase)
-            elif isinstance(evaluacion, Presentacion):
-                sql_subclase = """
-                INSERT INTO Presentaciones (EvaluacionID, NumIntegrantes)
-                VALUES (?, ?)
-                """
-                num_integrantes = getattr(evaluacion, 'tamano_audiencia', 0) # Asegúrate de que Presentacion tenga este atributo
-                params_subclase = (evaluacion_id, num_integrantes)
-                cursor.execute(sql_subclase, params_subclase)
+        try:
+            with self.conexion.prestarCursor() as cursor:
+                # 1. Tabla temporal de staging (vive en la sesión de la conexión prestada)
+                cursor.execute("""
+                IF OBJECT_ID('tempdb..#LoteEvaluaciones') IS NOT NULL DROP TABLE #LoteEvaluaciones;
+                CREATE TABLE #LoteEvaluaciones (
+                    Orden INT PRIMARY KEY,
+                    Nombre NVARCHAR(255) NOT NULL,
+                    Fecha DATE NOT NULL,
+                    Puntaje FLOAT NOT NULL,
+                    TipoEvaluacion VARCHAR(50) NOT NULL,
+                    Duracion INT NULL,
+                    NumPreguntas INT NULL,
+                    NumPaginas INT NULL,
+                    Tema NVARCHAR(500) NULL,
+                    TamanoAudiencia INT NULL
+                );
+                """)
+
+                # 2. Envío de todas las filas en un único array de parámetros
+                cursor.fast_executemany = True
+                # Tamaños explícitos: con fast_executemany pyodbc los deduce de la primera fila,
+                # lo que falla si esa fila trae NULL en una columna de texto.
+                cursor.setinputsizes([
+                    (pyodbc.SQL_INTEGER, 0, 0),
+                    (pyodbc.SQL_WVARCHAR, 255, 0),
+                    (pyodbc.SQL_TYPE_DATE, 0, 0),
+                    (pyodbc.SQL_DOUBLE, 0, 0),
+                    (pyodbc.SQL_VARCHAR, 50, 0),
+                    (pyodbc.SQL_INTEGER, 0, 0),
+                    (pyodbc.SQL_INTEGER, 0, 0),
+                    (pyodbc.SQL_INTEGER, 0, 0),
+                    (pyodbc.SQL_WVARCHAR, 500, 0),
+                    (pyodbc.SQL_INTEGER, 0, 0)
+                ])
+                cursor.executemany("""
+                INSERT INTO #LoteEvaluaciones (Orden, Nombre, Fecha, Puntaje, TipoEvaluacion,
+                                               Duracion, NumPreguntas, NumPaginas, Tema, TamanoAudiencia)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, filas)
+                cursor.fast_executemany = False
+                cursor.setinputsizes(None)
+
+                # 3. Verificación de unicidad por conjuntos contra los datos existentes
+                cursor.execute("""
+                SELECT l.Nombre FROM #LoteEvaluaciones AS l
+                JOIN Evaluaciones AS e ON e.Nombre = l.Nombre
+                """)
+                nombres_existentes = [row[0] for row in cursor.fetchall()]
+                if nombres_existentes and omitir_existentes:
+                    cursor.execute("""
+                    DELETE l FROM #LoteEvaluaciones AS l
+                    JOIN Evaluaciones AS e ON e.Nombre = l.Nombre
+                    """)
+                elif nombres_existentes:
+                    raise ValueError(f"Ya existen evaluaciones con los nombres: {', '.join(nombres_existentes)}.")
+
+                cursor.execute("""
+                SELECT l.Tema FROM #LoteEvaluaciones AS l
+                JOIN Trabajos AS t ON t.Tema = l.Tema
+                WHERE l.TipoEvaluacion = 'Trabajo'
+                """)
+                temas_existentes = [row[0] for row in cursor.fetchall()]
+                if temas_existentes:
+                    raise ValueError(f"Ya existen Trabajos con los temas: {', '.join(temas_existentes)}.")
+
+                # 4. Inserción base + subtipos en un solo batch; los IDs generados se recogen con OUTPUT
+                cursor.execute("""
+                SET NOCOUNT ON;
+                DECLARE @Ids TABLE (EvaluacionID INT PRIMARY KEY, Nombre NVARCHAR(255) NOT NULL);
+
+                INSERT INTO Evaluaciones (Nombre, Fecha, Puntaje, TipoEvaluacion)
+                OUTPUT INSERTED.EvaluacionID, INSERTED.Nombre INTO @Ids (EvaluacionID, Nombre)
+                SELECT Nombre, Fecha, Puntaje, TipoEvaluacion
+                FROM #LoteEvaluaciones
+                ORDER BY Orden;
+
+                INSERT INTO Examenes (EvaluacionID, Duracion, NumPreguntas)
+                SELECT i.EvaluacionID, l.Duracion, l.NumPreguntas
+                FROM #LoteEvaluaciones AS l JOIN @Ids AS i ON i.Nombre = l.Nombre
+                WHERE l.TipoEvaluacion = 'Examen';
+
+                INSERT INTO Trabajos (EvaluacionID, NumPaginas, Tema)
+                SELECT i.EvaluacionID, l.NumPaginas, l.Tema
+                FROM #LoteEvaluaciones AS l JOIN @Ids AS i ON i.Nombre = l.Nombre
+                WHERE l.TipoEvaluacion = 'Trabajo';
+
+                INSERT INTO Presentaciones (EvaluacionID, Duracion, TamanoAudiencia)
+                SELECT i.EvaluacionID, l.Duracion, l.TamanoAudiencia
+                FROM #LoteEvaluaciones AS l JOIN @Ids AS i ON i.Nombre = l.Nombre
+                WHERE l.TipoEvaluacion = 'Presentacion';
+
+                DROP TABLE #LoteEvaluaciones;
+
+                SELECT Nombre, EvaluacionID FROM @Ids;
+                """)
+                ids = {nombre: evaluacion_id for nombre, evaluacion_id in cursor.fetchall()}
 
-            conn.commit()
-            print(f"Evaluación '{evaluacion.nombre}' ({evaluacion.__class__.__name__}) guardada en la base de datos con ID: {evaluacion_id}.")
+                cursor.commit()
+                print(f"Lote de {len(ids)} evaluaciones guardado en la base de datos.")
+                return ids
 
         except pyodbc.Error as ex:
-            if conn:
-                conn.rollback()
             sqlstate = ex.args[0]
-            print(f"Error SQLSTATE al guardar evaluación: {sqlstate}. Mensaje: {ex.args[1]}")
-            raise Exception(f"No se pudo guardar la evaluación: {ex.args[1]}")
-        finally:
-            if cursor:
-                cursor.close()
+            print(f"Error SQLSTATE al guardar el lote de evaluaciones: {sqlstate}. Mensaje: {ex.args[1]}")
+            raise self._traducir(ex, f"No se pudo guardar el lote de evaluaciones: {ex.args[1]}")
 
-    def cargar_evaluaciones(self):
+    # Consulta de una página de la carga por keyset: las filas con EvaluacionID mayor que el
+    # último ya leído, en orden de ID, de modo que cada página usa el índice de la clave primaria
+    # en lugar de recorrer (OFFSET) las filas anteriores.
+    SQL_PAGINA_EVALUACIONES = """
+    SELECT TOP (?)
+        e.EvaluacionID,
+        e.Nombre,
+        e.Fecha,
+        e.Puntaje,
+        e.TipoEvaluacion,
+        ex.Duracion AS Examen_duracion_min,
+        ex.NumPreguntas AS Examen_num_preguntas,
+        t.NumPaginas AS Trabajo_num_paginas,
+        t.Tema AS Trabajo_tema,
+        p.Duracion AS Presentacion_duracion_min,
+        p.TamanoAudiencia AS Presentacion_tamano_audiencia
+    FROM Evaluaciones AS e
+    LEFT JOIN Examenes AS ex ON e.EvaluacionID = ex.EvaluacionID AND e.TipoEvaluacion = 'Examen'
+    LEFT JOIN Trabajos AS t ON e.EvaluacionID = t.EvaluacionID AND e.TipoEvaluacion = 'Trabajo'
+    LEFT JOIN Presentaciones AS p ON e.EvaluacionID = p.EvaluacionID AND e.TipoEvaluacion = 'Presentacion'
+    WHERE e.EvaluacionID > ?
+    ORDER BY e.EvaluacionID
+    """
+
+    def iterar_evaluaciones(self, tamano_pagina=500, desde_id=0):
         """
-        Carga todas las evaluaciones desde la base de datos, incluyendo detalles de subclase,
-        y las retorna como una lista de objetos Evaluacion.
+        Generador que recorre las evaluaciones en orden de EvaluacionID, página a página
+        (paginación por keyset con WHERE EvaluacionID > ?). Cada página presta una conexión
+        del pool solo mientras la lee, así que el consumidor puede detenerse entre páginas
+        sin retener la conexión.
+        Produce tuplas (EvaluacionID, evaluacion). Levanta una excepción si hay un error.
         """
-        evaluaciones_cargadas = []
-        conn = None
-        cursor = None
-        try:
-            conn = self.conexion.obtenerConexion()
-            cursor = conn.cursor()
-
-            query = """
-            SELECT
-                e.EvaluacionID, e.Nombre, e.Fecha, e.Puntaje, e.TipoEvaluacion,
-                ex.Duracion AS Examen_Duracion,
-                tr.FechaEntrega AS Trabajo_FechaEntrega,
-                pr.NumIntegrantes AS Presentacion_NumIntegrantes
-            FROM Evaluaciones e
-            LEFT JOIN Examenes ex ON e.EvaluacionID = ex.EvaluacionID
-            LEFT JOIN Trabajos tr ON e.EvaluacionID = tr.EvaluacionID
-            LEFT JOIN Presentaciones pr ON e.EvaluacionID = pr.EvaluacionID
-            ORDER BY e.EvaluacionID
-            """
-            cursor.execute(query)
-
-            for row in cursor.fetchall():
-                eval_id, nombre, fecha, puntaje, tipo_evaluacion = \
-                    row.EvaluacionID, row.Nombre, row.Fecha, row.Puntaje, row.TipoEvaluacion
-
-                eval_obj = None
-                if tipo_evaluacion == "Examen":
-                    duracion = row.Examen_Duracion
-                    eval_obj = Examen(nombre, puntaje)
-                    eval_obj.duracion_min = duracion if duracion is not None else 0
-                elif tipo_evaluacion == "Trabajo":
-                    fecha_entrega = row.Trabajo_FechaEntrega
-                    eval_obj = Trabajo(nombre, puntaje)
-                    eval_obj.fecha_entrega = fecha_entrega if fecha_entrega is not None else date.today()
-                elif tipo_evaluacion == "Presentacion":
-                    num_integrantes = row.Presentacion_NumIntegrantes
-                    eval_obj = Presentacion(nombre, puntaje)
-                    eval_obj.tamano_audiencia = num_integrantes if num_integrantes is not None else 0
-                else:
-                    print(f"Tipo de evaluación desconocido '{tipo_evaluacion}' para '{nombre}'. Saltando.")
-                    continue
+        ultimo_id = desde_id
+        while True:
+            try:
+                with self.conexion.prestarSentencias() as cursor:
+                    cursor.execute(self.SQL_PAGINA_EVALUACIONES, tamano_pagina, ultimo_id)
+                    filas = cursor.fetchmany(tamano_pagina)
+            except pyodbc.Error as ex:
+                sqlstate = ex.args[0]
+                print(f"Error SQLSTATE al cargar evaluaciones: {sqlstate}. Mensaje: {ex.args[1]}")
+                raise self._traducir(ex, f"No se pudieron cargar las evaluaciones: {ex.args[1]}")
 
-                if eval_obj:
-                    eval_obj.nombre = nombre
-                    eval_obj.puntaje = float(puntaje)
-                    eval_obj.fecha = fecha
-                    evaluaciones_cargadas.append(eval_obj)
+            for fila in filas:
+                evaluacion = self._evaluacion_desde_fila(fila)
+                if evaluacion is not None:
+                    yield fila[0], evaluacion
+            if len(filas) < tamano_pagina:
+                return
+            ultimo_id = filas[-1][0]
 
-            print(f"Cargadas {len(evaluaciones_cargadas)} evaluaciones desde la base de datos.")
-            return evaluaciones_cargadas
+    # Filas cambiadas desde una marca de agua: los IDs cuya Version (en la tabla base o en la de
+    # su subtipo) es mayor o igual que la marca, con las mismas columnas que SQL_PAGINA_EVALUACIONES.
+    SQL_CAMBIOS_EVALUACIONES = """
+    WITH Cambiadas AS (
+        SELECT EvaluacionID FROM Evaluaciones WHERE Version >= ?
+        UNION SELECT EvaluacionID FROM Examenes WHERE Version >= ?
+        UNION SELECT EvaluacionID FROM Trabajos WHERE Version >= ?
+        UNION SELECT EvaluacionID FROM Presentaciones WHERE Version >= ?
+    )
+    SELECT
+        e.EvaluacionID,
+        e.Nombre,
+        e.Fecha,
+        e.Puntaje,
+        e.TipoEvaluacion,
+        ex.Duracion AS Examen_duracion_min,
+        ex.NumPreguntas AS Examen_num_preguntas,
+        t.NumPaginas AS Trabajo_num_paginas,
+        t.Tema AS Trabajo_tema,
+        p.Duracion AS Presentacion_duracion_min,
+        p.TamanoAudiencia AS Presentacion_tamano_audiencia
+    FROM Cambiadas AS c
+    JOIN Evaluaciones AS e ON e.EvaluacionID = c.EvaluacionID
+    LEFT JOIN Examenes AS ex ON e.EvaluacionID = ex.EvaluacionID AND e.TipoEvaluacion = 'Examen'
+    LEFT JOIN Trabajos AS t ON e.EvaluacionID = t.EvaluacionID AND e.TipoEvaluacion = 'Trabajo'
+    LEFT JOIN Presentaciones AS p ON e.EvaluacionID = p.EvaluacionID AND e.TipoEvaluacion = 'Presentacion'
+    ORDER BY e.EvaluacionID
+    """
+
+    # Evaluaciones por nombre (ver leer_evaluaciones_por_nombre): los nombres llegan en un parámetro
+    # JSON que OPENJSON convierte en conjunto, con las mismas columnas que SQL_PAGINA_EVALUACIONES.
+    SQL_EVALUACIONES_POR_NOMBRE = """
+    SELECT
+        e.EvaluacionID,
+        e.Nombre,
+        e.Fecha,
+        e.Puntaje,
+        e.TipoEvaluacion,
+        ex.Duracion AS Examen_duracion_min,
+        ex.NumPreguntas AS Examen_num_preguntas,
+        t.NumPaginas AS Trabajo_num_paginas,
+        t.Tema AS Trabajo_tema,
+        p.Duracion AS Presentacion_duracion_min,
+        p.TamanoAudiencia AS Presentacion_tamano_audiencia
+    FROM Evaluaciones AS e
+    LEFT JOIN Examenes AS ex ON e.EvaluacionID = ex.EvaluacionID AND e.TipoEvaluacion = 'Examen'
+    LEFT JOIN Trabajos AS t ON e.EvaluacionID = t.EvaluacionID AND e.TipoEvaluacion = 'Trabajo'
+    LEFT JOIN Presentaciones AS p ON e.EvaluacionID = p.EvaluacionID AND e.TipoEvaluacion = 'Presentacion'
+    WHERE e.Nombre IN (SELECT Nombre FROM OPENJSON(?) WITH (Nombre NVARCHAR(255) '$'))
+    """
 
+    # Estadísticas por tipo sobre las vistas indexadas de notas (ver tablas.sql): la cantidad, la
+    # suma y la mejor (TOP (1), sin ordenar toda la vista) salen del índice agrupado de cada vista,
+    # sin leer las tablas.
+    SQL_ESTADISTICAS_POR_TIPO = """
+    SELECT g.TipoEvaluacion, g.Cantidad, g.SumaNotas, m.EvaluacionID, m.Nombre, m.Nota
+    FROM (
+        SELECT TipoEvaluacion, COUNT_BIG(*) AS Cantidad, SUM(Nota) AS SumaNotas
+        FROM VW_NotasEvaluaciones
+        GROUP BY TipoEvaluacion
+    ) AS g
+    CROSS APPLY (
+        SELECT TOP (1) n.EvaluacionID, n.Nombre, n.Nota
+        FROM VW_NotasEvaluaciones AS n
+        WHERE n.TipoEvaluacion = g.TipoEvaluacion
+        ORDER BY n.Nota DESC, n.EvaluacionID
+    ) AS m
+    """
+
+    def leer_marca_agua(self):
+        """
+        Marca de agua actual (MIN_ACTIVE_ROWVERSION, 8 bytes): toda fila con una Version menor ya
+        está confirmada, así que leyendo la marca antes que los datos no se pierde ningún cambio.
+        Levanta una excepción si hay un error.
+        """
+        try:
+            with self.conexion.prestarSentencias() as cursor:
+                cursor.execute("SELECT CAST(MIN_ACTIVE_ROWVERSION() AS BINARY(8))")
+                return bytes(cursor.fetchone()[0])
         except pyodbc.Error as ex:
             sqlstate = ex.args[0]
-            print(f"Error SQLSTATE al cargar evaluaciones: {sqlstate}. Mensaje: {ex.args[1]}")
-            raise Exception(f"No se pudieron cargar las evaluaciones: {ex.args[1]}")
-        finally:
-            if cursor:
-                cursor.close()
+            print(f"Error SQLSTATE al leer la marca de agua: {sqlstate}. Mensaje: {ex.args[1]}")
+            raise self._traducir(ex, f"No se pudo leer la marca de agua: {ex.args[1]}")
 
-    def eliminar_evaluacion_bd(self, nombre: str):
+    def leer_cambios(self, desde_marca):
         """
-        Elimina una evaluación y sus detalles asociados de la base de datos por nombre.
+        Lee lo que cambió desde 'desde_marca' (obtenida antes con leer_marca_agua()).
+        Retorna (cambiadas, eliminadas): una lista de (EvaluacionID, evaluacion) con las filas
+        nuevas o modificadas y una lista con los EvaluacionID borrados.
+        Levanta una excepción si hay un error (p. ej. si el esquema no tiene las columnas Version).
         """
-        conn = None
-        cursor = None
+        marca = pyodbc.Binary(desde_marca)
         try:
-            conn = self.conexion.obtenerConexion()
-            cursor = conn.cursor()
-
-            sql_get_id = "SELECT EvaluacionID FROM Evaluaciones WHERE Nombre = ?"
-            cursor.execute(sql_get_id, (nombre,))
-            result = cursor.fetchone()
-
-            if result:
-                evaluacion_id = result[0]
-                sql_delete = "DELETE FROM Evaluaciones WHERE EvaluacionID = ?"
-                cursor.execute(sql_delete, (evaluacion_id,))
-                conn.commit()
-                print(f"Evaluación '{nombre}' (ID: {evaluacion_id}) eliminada de la base de datos.")
-                return True
-            else:
-                print(f"No se encontró la evaluación con el nombre '{nombre}' en la base de datos para eliminar.")
-                return False
+            with self.conexion.prestarCursor() as cursor:
+                cursor.execute(self.SQL_CAMBIOS_EVALUACIONES, marca, marca, marca, marca)
+                cambiadas = []
+                for fila in cursor.fetchall():
+                    evaluacion = self._evaluacion_desde_fila(fila)
+                    if evaluacion is not None:
+                        cambiadas.append((fila[0], evaluacion))
+                cursor.execute("SELECT DISTINCT EvaluacionID FROM EvaluacionesEliminadas WHERE Version >= ?", marca)
+                eliminadas = [fila[0] for fila in cursor.fetchall()]
+                return cambiadas, eliminadas
+        except pyodbc.Error as ex:
+            sqlstate = ex.args[0]
+            print(f"Error SQLSTATE al leer los cambios: {sqlstate}. Mensaje: {ex.args[1]}")
+            raise self._traducir(ex, f"No se pudieron leer los cambios desde la marca de agua: {ex.args[1]}")
+
+    def leer_horizonte_eliminadas(self):
+        """
+        Version más alta de los borrados ya purgados por PurgarEvaluacionesEliminadas (ver tablas.sql):
+        los anteriores ya no aparecen en leer_cambios(). Levanta una excepción si hay un error
+        (p. ej. si el esquema no tiene la tabla HorizonteEliminadas).
+        """
+        try:
+            with self.conexion.prestarSentencias() as cursor:
+                cursor.execute("SELECT Version FROM HorizonteEliminadas WHERE Id = 1")
+                fila = cursor.fetchone()
+                return bytes(fila[0]) if fila else None
+        except pyodbc.Error as ex:
+            sqlstate = ex.args[0]
+            print(f"Error SQLSTATE al leer el horizonte de eliminaciones: {sqlstate}. Mensaje: {ex.args[1]}")
+            raise self._traducir(ex, f"No se pudo leer el horizonte de eliminaciones: {ex.args[1]}")
+
+    def eliminar_evaluaciones_lote(self, nombres):
+        """
+        Elimina varias evaluaciones por nombre con una única sentencia DELETE. Los nombres
+        viajan en un solo parámetro JSON que OPENJSON convierte en conjunto, y las filas de
+        Examenes/Trabajos/Presentaciones se borran por el ON DELETE CASCADE del esquema.
+        Retorna un diccionario {nombre: EvaluacionID} de las evaluaciones eliminadas.
+        Levanta una excepción si hay un error.
+        """
+        nombres = list(dict.fromkeys(nombres))  # Sin repetidos, conservando el orden
+        if not nombres:
+            return {}
+        try:
+            with self.conexion.prestarCursor() as cursor:
+                # OUTPUT sin INTO no se admite en una tabla con trigger (TR_Evaluaciones_Eliminadas):
+                # las filas borradas pasan por una variable de tabla y se leen al final
+                cursor.execute("""
+                SET NOCOUNT ON;
+                DECLARE @Eliminadas TABLE (Nombre NVARCHAR(255), EvaluacionID INT);
+                DELETE e
+                OUTPUT DELETED.Nombre, DELETED.EvaluacionID INTO @Eliminadas (Nombre, EvaluacionID)
+                FROM Evaluaciones AS e
+                WHERE e.Nombre IN (SELECT Nombre FROM OPENJSON(?) WITH (Nombre NVARCHAR(255) '$'));
+                SELECT Nombre, EvaluacionID FROM @Eliminadas;
+                """, json.dumps(nombres))
+                eliminadas = {nombre: evaluacion_id for nombre, evaluacion_id in cursor.fetchall()}
+                cursor.commit()
+                print(f"{len(eliminadas)} evaluaciones eliminadas de la base de datos.")
+                return eliminadas
 
         except pyodbc.Error as ex:
-            if conn:
-                conn.rollback()
             sqlstate = ex.args[0]
-            print(f"Error SQLSTATE al eliminar evaluación: {sqlstate}. Mensaje: {ex.args[1]}")
-            raise Exception(f"No se pudo eliminar la evaluación: {ex.args[1]}")
-        finally:
-            if cursor:
-                cursor.close()
+            print(f"Error SQLSTATE al eliminar el lote de evaluaciones: {sqlstate}. Mensaje: {ex.args[1]}")
+            raise self._traducir(ex, f"No se pudieron eliminar las evaluaciones: {ex.args[1]}")
 
     def limpiar_todas_las_evaluaciones_bd(self):
         """
         Elimina todas las evaluaciones de la base de datos.
         """
-        conn = None
-        cursor = None
         try:
-            conn = self.conexion.obtenerConexion()
-            cursor = conn.cursor()
-            query = "DELETE FROM Evaluaciones"
-            cursor.execute(query)
-            conn.commit()
-            print("Todas las evaluaciones han sido limpiadas de la base de datos.")
+            with self.conexion.prestarCursor() as cursor:
+                query = "DELETE FROM Evaluaciones"
+                cursor.execute(query)
+                cursor.commit()
+                print("Todas las evaluaciones han sido limpiadas de la base de datos.")
         except pyodbc.Error as ex:
-            if conn:
-                conn.rollback()
             sqlstate = ex.args[0]
             print(f"Error SQLSTATE al limpiar evaluaciones: {sqlstate}. Mensaje: {ex.args[1]}")
-            raise Exception(f"No se pudieron limpiar las evaluaciones en la base de datos: {ex.args[1]}")
-        finally:
-            if cursor:
-                cursor.close()
\ No newline at end of file
+            raise self._traducir(ex, f"No se pudieron limpiar las evaluaciones en la base de datos: {ex.args[1]}")
\ No newline at end of file
@@ -0,0 +1,320 @@
+# src/datos/evaluacion_dao_sqlite.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import json
+import sqlite3
+from datetime import date
+
+from src.datos.backend_evaluaciones import BackendEvaluaciones
+from src.datos.conexion_sqlite import ConexionSQLite
+from src.dominio.examen import Examen
+from src.dominio.presentacion import Presentacion
+from src.dominio.trabajo import Trabajo
+
+# Mismo esquema que tablas.sql (tablas, claves, restricciones e índices) en el dialecto de SQLite.
+# AUTOINCREMENT evita reutilizar IDs borrados, como IDENTITY en SQL Server.
+ESQUEMA_SQLITE = """
+CREATE TABLE IF NOT EXISTS Evaluaciones (
+    EvaluacionID INTEGER PRIMARY KEY AUTOINCREMENT,
+    Nombre TEXT NOT NULL UNIQUE,
+    Fecha TEXT NOT NULL,
+    Puntaje REAL NOT NULL,
+    TipoEvaluacion TEXT NOT NULL,
+    CONSTRAINT CK_Puntaje CHECK (Puntaje >= 0.00 AND Puntaje <= 100.00)
+);
+
+CREATE TABLE IF NOT EXISTS Examenes (
+    ExamenID INTEGER PRIMARY KEY AUTOINCREMENT,
+    EvaluacionID INTEGER UNIQUE NOT NULL,
+    Duracion INTEGER NOT NULL,
+    NumPreguntas INTEGER NOT NULL,
+    CONSTRAINT FK_Examenes_Evaluaciones FOREIGN KEY (EvaluacionID)
+        REFERENCES Evaluaciones(EvaluacionID) ON DELETE CASCADE,
+    CONSTRAINT CK_DuracionExamen CHECK (Duracion > 0),
+    CONSTRAINT CK_NumPreguntas CHECK (NumPreguntas > 0)
+);
+
+CREATE TABLE IF NOT EXISTS Trabajos (
+    TrabajoID INTEGER PRIMARY KEY AUTOINCREMENT,
+    EvaluacionID INTEGER UNIQUE NOT NULL,
+    NumPaginas INTEGER NOT NULL,
+    Tema TEXT NOT NULL,
+    CONSTRAINT FK_Trabajos_Evaluaciones FOREIGN KEY (EvaluacionID)
+        REFERENCES Evaluaciones(EvaluacionID) ON DELETE CASCADE,
+    CONSTRAINT CK_NumPaginas CHECK (NumPaginas > 0)
+);
+
+CREATE TABLE IF NOT EXISTS Presentaciones (
+    PresentacionID INTEGER PRIMARY KEY AUTOINCREMENT,
+    EvaluacionID INTEGER UNIQUE NOT NULL,
+    Duracion INTEGER NOT NULL,
+    TamanoAudiencia INTEGER NOT NULL,
+    CONSTRAINT FK_Presentaciones_Evaluaciones FOREIGN KEY (EvaluacionID)
+        REFERENCES Evaluaciones(EvaluacionID) ON DELETE CASCADE,
+    CONSTRAINT CK_DuracionPresentacion CHECK (Duracion > 0),
+    CONSTRAINT CK_TamanoAudiencia CHECK (TamanoAudiencia > 0)
+);
+
+-- Notas con la fórmula de calcular_nota() (ver VW_NotasEvaluaciones en tablas.sql). SQLite no
+-- materializa vistas: se calculan al consultar, sin traer las filas a Python.
+CREATE VIEW IF NOT EXISTS VW_NotasEvaluaciones AS
+SELECT 'Examen' AS TipoEvaluacion, e.EvaluacionID, e.Nombre,
+       (e.Puntaje * x.NumPreguntas / 100) / (x.Duracion / 60.0) AS Nota
+FROM Evaluaciones AS e JOIN Examenes AS x ON x.EvaluacionID = e.EvaluacionID
+WHERE e.TipoEvaluacion = 'Examen'
+UNION ALL
+SELECT 'Trabajo', e.EvaluacionID, e.Nombre, e.Puntaje * (1 + (t.NumPaginas / 100.0))
+FROM Evaluaciones AS e JOIN Trabajos AS t ON t.EvaluacionID = e.EvaluacionID
+WHERE e.TipoEvaluacion = 'Trabajo'
+UNION ALL
+SELECT 'Presentacion', e.EvaluacionID, e.Nombre, e.Puntaje * (1 + (p.TamanoAudiencia / 200.0))
+FROM Evaluaciones AS e JOIN Presentaciones AS p ON p.EvaluacionID = e.EvaluacionID
+WHERE e.TipoEvaluacion = 'Presentacion';
+"""
+
+
+class EvaluacionDAOSQLite(BackendEvaluaciones):
+    """
+    Backend de almacenamiento sobre SQLite: la misma interfaz que EvaluacionDAO sin servidor
+    ni red, para pruebas de rendimiento, trabajo sin conexión y como referencia para medir
+    el costo de red del camino de SQL Server. Todas las consultas son cadenas constantes con
+    parámetros '?', así que cada conexión reutiliza sus sentencias preparadas.
+    """
+    ERROR_BD = sqlite3.Error
+    ERRORES_DATOS = (sqlite3.IntegrityError, sqlite3.DataError)
+    ERRORES_CONEXION = (sqlite3.OperationalError,)  # Base bloqueada, disco lleno, archivo inaccesible
+
+    SQL_PAGINA_EVALUACIONES = """
+    SELECT
+        e.EvaluacionID,
+        e.Nombre,
+        e.Fecha,
+        e.Puntaje,
+        e.TipoEvaluacion,
+        ex.Duracion,
+        ex.NumPreguntas,
+        t.NumPaginas,
+        t.Tema,
+        p.Duracion,
+        p.TamanoAudiencia
+    FROM Evaluaciones AS e
+    LEFT JOIN Examenes AS ex ON e.EvaluacionID = ex.EvaluacionID AND e.TipoEvaluacion = 'Examen'
+    LEFT JOIN Trabajos AS t ON e.EvaluacionID = t.EvaluacionID AND e.TipoEvaluacion = 'Trabajo'
+    LEFT JOIN Presentaciones AS p ON e.EvaluacionID = p.EvaluacionID AND e.TipoEvaluacion = 'Presentacion'
+    WHERE e.EvaluacionID > ?
+    ORDER BY e.EvaluacionID
+    LIMIT ?
+    """
+
+    SQL_EVALUACIONES_POR_NOMBRE = """
+    SELECT
+        e.EvaluacionID,
+        e.Nombre,
+        e.Fecha,
+        e.Puntaje,
+        e.TipoEvaluacion,
+        ex.Duracion,
+        ex.NumPreguntas,
+        t.NumPaginas,
+        t.Tema,
+        p.Duracion,
+        p.TamanoAudiencia
+    FROM Evaluaciones AS e
+    LEFT JOIN Examenes AS ex ON e.EvaluacionID = ex.EvaluacionID AND e.TipoEvaluacion = 'Examen'
+    LEFT JOIN Trabajos AS t ON e.EvaluacionID = t.EvaluacionID AND e.TipoEvaluacion = 'Trabajo'
+    LEFT JOIN Presentaciones AS p ON e.EvaluacionID = p.EvaluacionID AND e.TipoEvaluacion = 'Presentacion'
+    WHERE e.Nombre IN (SELECT value FROM json_each(?))
+    """
+
+    SQL_ESTADISTICAS_POR_TIPO = """
+    WITH Notas AS (SELECT * FROM VW_NotasEvaluaciones)
+    SELECT g.TipoEvaluacion, g.Cantidad, g.SumaNotas, m.EvaluacionID, m.Nombre, m.Nota
+    FROM (
+        SELECT TipoEvaluacion, COUNT(*) AS Cantidad, SUM(Nota) AS SumaNotas
+        FROM Notas
+        GROUP BY TipoEvaluacion
+    ) AS g
+    JOIN Notas AS m ON m.EvaluacionID = (
+        SELECT n.EvaluacionID FROM Notas AS n
+        WHERE n.TipoEvaluacion = g.TipoEvaluacion
+        ORDER BY n.Nota DESC, n.EvaluacionID
+        LIMIT 1
+    )
+    """
+
+    def __init__(self, ruta="evaluaciones.sqlite3"):
+        self.conexion = ConexionSQLite(ruta)
+        try:
+            with self.conexion.prestarConexion() as conexion:
+                conexion.executescript(ESQUEMA_SQLITE)
+        except sqlite3.Error as ex:
+            raise ConnectionError(f"No se pudo crear el esquema en la base de datos SQLite: {ex}")
+
+    def cerrar(self):
+        self.conexion.cerrarPool()
+
+    def _insertar_fila_base(self, cursor, evaluacion):
+        cursor.execute("INSERT INTO Evaluaciones (Nombre, Fecha, Puntaje, TipoEvaluacion) VALUES (?, ?, ?, ?)",
+                       (evaluacion.nombre, evaluacion.fecha.isoformat(), float(evaluacion.puntaje),
+                        evaluacion.__class__.__name__))
+        return cursor.lastrowid
+
+    def _sentencias_actualizacion(self, evaluacion_id, anterior, nueva, cambios_base, cambios_subtipo):
+        # SQLite guarda la fecha como texto ISO
+        cambios_base = [(c, v.isoformat() if isinstance(v, date) else v) for c, v in cambios_base]
+        return super()._sentencias_actualizacion(evaluacion_id, anterior, nueva, cambios_base, cambios_subtipo)
+
+    @classmethod
+    def _evaluacion_desde_fila(cls, row):
+        return super()._evaluacion_desde_fila(row[:2] + (date.fromisoformat(row[2]),) + tuple(row[3:]))
+
+    def guardar_evaluaciones_lote(self, evaluaciones, omitir_existentes=False):
+        """
+        Guarda un lote de evaluaciones en una sola transacción: la unicidad de nombres y temas
+        se comprueba por conjuntos (json_each) y cada tabla se llena con un único executemany.
+        Con omitir_existentes=True se descartan las evaluaciones cuyo nombre ya existe.
+        Retorna un diccionario {nombre: EvaluacionID} de las insertadas.
+        """
+        evaluaciones = list(evaluaciones)
+        nombres = [e.nombre for e in evaluaciones]
+        if len(set(nombres)) != len(nombres):
+            raise ValueError("El lote contiene más de una evaluación con el mismo nombre.")
+        temas = [e.tema for e in evaluaciones if isinstance(e, Trabajo)]
+        if len(set(temas)) != len(temas):
+            raise ValueError("El lote contiene más de un Trabajo con el mismo tema.")
+        if not evaluaciones:
+            return {}
+
+        try:
+            with self.conexion.prestarCursor() as cursor:
+                cursor.execute("SELECT value FROM json_each(?) WHERE value IN (SELECT Nombre FROM Evaluaciones)",
+                               (json.dumps(nombres),))
+                nombres_existentes = [fila[0] for fila in cursor.fetchall()]
+                if nombres_existentes and omitir_existentes:
+                    existentes = set(nombres_existentes)
+                    evaluaciones = [e for e in evaluaciones if e.nombre not in existentes]
+                    temas = [e.tema for e in evaluaciones if isinstance(e, Trabajo)]
+                elif nombres_existentes:
+                    raise ValueError(f"Ya existen evaluaciones con los nombres: {', '.join(nombres_existentes)}.")
+
+                cursor.execute("SELECT value FROM json_each(?) WHERE value IN (SELECT Tema FROM Trabajos)",
+                               (json.dumps(temas),))
+                temas_existentes = [fila[0] for fila in cursor.fetchall()]
+                if temas_existentes:
+                    raise ValueError(f"Ya existen Trabajos con los temas: {', '.join(temas_existentes)}.")
+
+                cursor.executemany(
+                    "INSERT INTO Evaluaciones (Nombre, Fecha, Puntaje, TipoEvaluacion) VALUES (?, ?, ?, ?)",
+                    [(e.nombre, e.fecha.isoformat(), float(e.puntaje), e.__class__.__name__) for e in evaluaciones])
+                cursor.execute("SELECT e.Nombre, e.EvaluacionID FROM json_each(?) AS j "
+                               "JOIN Evaluaciones AS e ON e.Nombre = j.value",
+                               (json.dumps([e.nombre for e in evaluaciones]),))
+                ids = dict(cursor.fetchall())
+
+                cursor.executemany("INSERT INTO Examenes (EvaluacionID, Duracion, NumPreguntas) VALUES (?, ?, ?)",
+                                   [(ids[e.nombre], e.duracion_min, e.num_preguntas)
+                                    for e in evaluaciones if isinstance(e, Examen)])
+                cursor.executemany("INSERT INTO Trabajos (EvaluacionID, NumPaginas, Tema) VALUES (?, ?, ?)",
+                                   [(ids[e.nombre], e.num_paginas, e.tema)
+                                    for e in evaluaciones if isinstance(e, Trabajo)])
+                cursor.executemany("INSERT INTO Presentaciones (EvaluacionID, Duracion, TamanoAudiencia) VALUES (?, ?, ?)",
+                                   [(ids[e.nombre], e.duracion_min, e.tamano_audiencia)
+                                    for e in evaluaciones if isinstance(e, Presentacion)])
+                cursor.connection.commit()
+                print(f"Lote de {len(ids)} evaluaciones guardado en la base de datos SQLite.")
+                return ids
+        except sqlite3.Error as ex:
+            raise self._error(ex, "guardar el lote de evaluaciones")
+
+    def iterar_evaluaciones(self, tamano_pagina=500, desde_id=0):
+        """
+        Generador que recorre las evaluaciones en orden de EvaluacionID, página a página
+        (WHERE EvaluacionID > ? ... LIMIT ?). Produce tuplas (EvaluacionID, evaluacion).
+        """
+        ultimo_id = desde_id
+        while True:
+            try:
+                with self.conexion.prestarSentencias() as cursor:
+                    cursor.execute(self.SQL_PAGINA_EVALUACIONES, (ultimo_id, tamano_pagina))
+                    filas = cursor.fetchall()
+            except sqlite3.Error as ex:
+                raise self._error(ex, "cargar las evaluaciones")
+
+            for fila in filas:
+                evaluacion = self._evaluacion_desde_fila(fila)
+                if evaluacion is not None:
+                    yield fila[0], evaluacion
+            if len(filas) < tamano_pagina:
+                return
+            ultimo_id = filas[-1][0]
+
+    def eliminar_evaluaciones_lote(self, nombres):
+        """
+        Elimina varias evaluaciones por nombre con una única sentencia DELETE ... RETURNING;
+        las filas de subtipo caen por ON DELETE CASCADE.
+        Retorna un diccionario {nombre: EvaluacionID} de las evaluaciones eliminadas.
+        """
+        nombres = list(dict.fromkeys(nombres))
+        if not nombres:
+            return {}
+        try:
+            with self.conexion.prestarCursor() as cursor:
+                cursor.execute("DELETE FROM Evaluaciones WHERE Nombre IN (SELECT value FROM json_each(?)) "
+                               "RETURNING Nombre, EvaluacionID", (json.dumps(nombres),))
+                eliminadas = dict(cursor.fetchall())
+                cursor.connection.commit()
+                print(f"{len(eliminadas)} evaluaciones eliminadas de la base de datos SQLite.")
+                return eliminadas
+        except sqlite3.Error as ex:
+            raise self._error(ex, "eliminar las evaluaciones")
+
+    def limpiar_todas_las_evaluaciones_bd(self):
+        try:
+            with self.conexion.prestarCursor() as cursor:
+                cursor.execute("DELETE FROM Evaluaciones")
+                cursor.connection.commit()
+                print("Todas las evaluaciones han sido limpiadas de la base de datos SQLite.")
+        except sqlite3.Error as ex:
+            raise self._error(ex, "limpiar las evaluaciones en la base de datos")
+
+
+# Comprobación de ida y vuelta con nombres y temas fuera de Latin-1 (los mismos caminos que en SQL
+# Server pasan por #LoteEvaluaciones y OPENJSON): guardar, leer por nombre, actualizar y eliminar.
+if __name__ == '__main__':
+    import os
+    import tempfile
+    from datetime import date
+
+    from src.dominio.examen import Examen
+    from src.dominio.presentacion import Presentacion
+    from src.dominio.trabajo import Trabajo
+
+    nombres = ["Évaluación de cálculo ñandú", "数学期中考试", "Контрольная работа", "Ελληνικά 🎓"]
+    evaluaciones = [
+        Examen(nombres[0], date(2025, 3, 1), 88.5, 90, 25),
+        Trabajo(nombres[1], date(2025, 3, 2), 91.0, 12, "関数と微分 — análisis"),
+        Presentacion(nombres[2], date(2025, 3, 3), 76.25, 20, 40),
+        Trabajo(nombres[3], date(2025, 3, 4), 64.0, 7, "Θέμα ελληνικό"),
+    ]
+    with tempfile.TemporaryDirectory() as directorio:
+        dao = EvaluacionDAOSQLite(os.path.join(directorio, 'evaluaciones.sqlite3'))
+        try:
+            ids = dao.guardar_evaluaciones_lote(evaluaciones)
+            assert set(ids) == set(nombres)
+            leidas = dao.leer_evaluaciones_por_nombre(nombres)
+            for original in evaluaciones:
+                evaluacion_id, leida = leidas[original.nombre]
+                assert evaluacion_id == ids[original.nombre]
+                assert leida.to_dict() == original.to_dict(), (leida.to_dict(), original.to_dict())
+            assert [e.nombre for _, e in dao.iterar_evaluaciones()] == nombres
+
+            renombrada = Trabajo("Ελληνικά 🎓 — revisado", date(2025, 3, 4), 64.0, 7, "Θέμα ελληνικό")
+            dao.actualizar_evaluacion_bd(nombres[3], evaluaciones[3], renombrada, ids[nombres[3]])
+            assert dao.leer_evaluaciones_por_nombre([renombrada.nombre])[renombrada.nombre][1].to_dict() == \
+                renombrada.to_dict()
+
+            eliminadas = dao.eliminar_evaluaciones_lote([nombres[1], renombrada.nombre, "no existe ø"])
+            assert eliminadas == {nombres[1]: ids[nombres[1]], renombrada.nombre: ids[nombres[3]]}
+            assert set(dao.leer_evaluaciones_por_nombre(nombres + [renombrada.nombre])) == {nombres[0], nombres[2]}
+        finally:
+            dao.cerrar()
+    print("Nombres y temas con acentos y caracteres no latinos: ida y vuelta correcta.")
@@ -28,110 +28,94 @@ if project_root_for_src not in sys.path:
 
 def insertar_ejemplo_evaluacion(nombre, fecha, puntaje, tipo, **kwargs):
     """
-    Inserta una evaluación de ejemplo en la base de datos usando la conexión existente,
+    Inserta una evaluación de ejemplo en la base de datos con una conexión prestada del pool,
     dividiendo los datos en las tablas base y de subclase.
     """
-    conexion = None
-    cursor = None
     try:
-        conexion = Conexion.obtenerConexion()
-        cursor = Conexion.obtenerCursor()
-
-        # 1. Insertar en la tabla base 'Evaluaciones'
-        sql_base = """
-        INSERT INTO Evaluaciones (Nombre, Fecha, Puntaje, TipoEvaluacion)
-        OUTPUT INSERTED.EvaluacionID
-        VALUES (?, ?, ?, ?)
-        """
-        parametros_base = (
-            nombre,
-            fecha,
-            puntaje,
-            tipo
-        )
-        cursor.execute(sql_base, parametros_base)
-        evaluacion_id = cursor.fetchone()[0] # Obtener el ID generado
-
-        # 2. Insertar en la tabla específica del tipo de evaluación
-        if tipo == "Examen":
-            sql_tipo = """
-            INSERT INTO Examenes (EvaluacionID, DuracionMinutos, NumeroPreguntas)
-            VALUES (?, ?, ?)
+        with Conexion.prestarConexion() as conexion:
+            cursor = conexion.cursor()
+
+            # 1. Insertar en la tabla base 'Evaluaciones'
+            sql_base = """
+            INSERT INTO Evaluaciones (Nombre, Fecha, Puntaje, TipoEvaluacion)
+            OUTPUT INSERTED.EvaluacionID
+            VALUES (?, ?, ?, ?)
             """
-            parametros_tipo = (
-                evaluacion_id,
-                kwargs.get('duracion_min'),
-                kwargs.get('num_preguntas')
+            parametros_base = (
+                nombre,
+                fecha,
+                puntaje,
+                tipo
             )
-            cursor.execute(sql_tipo, parametros_tipo)
-        elif tipo == "Trabajo":
-            sql_tipo = """
-            INSERT INTO Trabajos (EvaluacionID, NumeroPaginas, Tema)
-            VALUES (?, ?, ?)
-            """
-            parametros_tipo = (
-                evaluacion_id,
-                kwargs.get('num_paginas'),
-                kwargs.get('tema')
-            )
-            cursor.execute(sql_tipo, parametros_tipo)
-        elif tipo == "Presentacion":
-            sql_tipo = """
-            INSERT INTO Presentaciones (EvaluacionID, DuracionMinutos, TamanoAudiencia)
-            VALUES (?, ?, ?)
-            """
-            parametros_tipo = (
-                evaluacion_id,
-                kwargs.get('duracion_min'),
-                kwargs.get('tamano_audiencia')
-            )
-            cursor.execute(sql_tipo, parametros_tipo)
-
-        conexion.commit()
+            cursor.execute(sql_base, parametros_base)
+            evaluacion_id = cursor.fetchone()[0] # Obtener el ID generado
+
+            # 2. Insertar en la tabla específica del tipo de evaluación
+            if tipo == "Examen":
+                sql_tipo = """
+                INSERT INTO Examenes (EvaluacionID, Duracion, NumPreguntas)
+                VALUES (?, ?, ?)
+                """
+                parametros_tipo = (
+                    evaluacion_id,
+                    kwargs.get('duracion_min'),
+                    kwargs.get('num_preguntas')
+                )
+                cursor.execute(sql_tipo, parametros_tipo)
+            elif tipo == "Trabajo":
+                sql_tipo = """
+                INSERT INTO Trabajos (EvaluacionID, NumPaginas, Tema)
+                VALUES (?, ?, ?)
+                """
+                parametros_tipo = (
+                    evaluacion_id,
+                    kwargs.get('num_paginas'),
+                    kwargs.get('tema')
+                )
+                cursor.execute(sql_tipo, parametros_tipo)
+            elif tipo == "Presentacion":
+                sql_tipo = """
+                INSERT INTO Presentaciones (EvaluacionID, Duracion, TamanoAudiencia)
+                VALUES (?, ?, ?)
+                """
+                parametros_tipo = (
+                    evaluacion_id,
+                    kwargs.get('duracion_min'),
+                    kwargs.get('tamano_audiencia')
+                )
+                cursor.execute(sql_tipo, parametros_tipo)
+
+            # Sin commit, el pool revierte la transacción al recuperar la conexión
+            conexion.commit()
         print(f"'{nombre}' ({tipo}) insertada con éxito. ID: {evaluacion_id}")
 
     except bd.Error as ex:
         sqlstate = ex.args[0]
-        if conexion:
-            conexion.rollback()
         print(f"Error SQLSTATE al insertar evaluación '{nombre}': {sqlstate}. Mensaje: {ex.args[1]}")
     except Exception as e:
-        if conexion:
-            conexion.rollback()
         print(f"Error inesperado al insertar evaluación '{nombre}': {e}")
-    finally:
-        # Asegúrate de cerrar la conexión si se abrió
-        if 'conexion' in locals() and conexion:
-            Conexion.cerrarConexion()
 
 
 def limpiar_tablas():
     """
     Limpia todas las tablas de evaluaciones en la base de datos.
     """
-    conn_temp = None
     try:
-        conn_temp = Conexion.obtenerConexion()
-        cursor_temp = conn_temp.cursor()
-        print("Limpiando tablas existentes...")
-        # Orden de eliminación para respetar claves foráneas
-        cursor_temp.execute("DELETE FROM Examenes")
-        cursor_temp.execute("DELETE FROM Trabajos")
-        cursor_temp.execute("DELETE FROM Presentaciones")
-        cursor_temp.execute("DELETE FROM Evaluaciones")
-        conn_temp.commit()
+        with Conexion.prestarConexion() as conexion:
+            cursor = conexion.cursor()
+            print("Limpiando tablas existentes...")
+            # Orden de eliminación para respetar claves foráneas
+            cursor.execute("DELETE FROM Examenes")
+            cursor.execute("DELETE FROM Trabajos")
+            cursor.execute("DELETE FROM Presentaciones")
+            cursor.execute("DELETE FROM Evaluaciones")
+            conexion.commit()
         print("Tablas limpiadas correctamente.")
     except bd.Error as ex:
         sqlstate = ex.args[0]
-        if conn_temp:
-            conn_temp.rollback()
         print(f"Error SQLSTATE al limpiar tablas: {sqlstate}. Mensaje: {ex.args[1]}")
     except Exception as e:
         print(f"Error inesperado al limpiar tablas: {e}")
-    finally:
-        # Asegúrate de cerrar la conexión si se abrió, incluso si hubo un error en DELETE
-        if 'conn_temp' in locals() and conn_temp:
-            Conexion.cerrarConexion()
 
 
 if __name__ == '__main__':
@@ -171,4 +155,7 @@ if __name__ == '__main__':
         tipo='Examen',
         duracion_min=90,
         num_preguntas=30
-    )
\ No newline at end of file
+    )
+
+    # Las funciones comparten el pool de conexiones; se cierra una sola vez al terminar
+    Conexion.cerrarPool()
@@ -0,0 +1,190 @@
+# src/datos/pool_conexiones.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import threading
+import time
+from contextlib import contextmanager
+
+from src.datos.registro_sentencias import RegistroSentencias
+
+
+class ConnectionPool:
+    """
+    Pool de conexiones thread-safe.
+    Reutiliza conexiones abiertas en lugar de repetir el handshake ODBC en cada operación.
+    Las conexiones se verifican al prestarlas y se desalojan si pasan demasiado tiempo ociosas.
+    Cada conexión conserva sus sentencias preparadas (ver sentencias()) mientras siga abierta.
+    """
+    def __init__(self, fabrica, min_size=1, max_size=5, max_inactividad=300.0,
+                 intervalo_verificacion=30.0, timeout=10.0, consulta_salud="SELECT 1"):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Los tamaños del pool deben cumplir 0 <= min_size <= max_size y max_size >= 1.")
+        self._fabrica = fabrica
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_inactividad = max_inactividad
+        self.intervalo_verificacion = intervalo_verificacion
+        self.timeout = timeout
+        self.consulta_salud = consulta_salud
+
+        self._condicion = threading.Condition()
+        self._libres = []  # Pila de (conexion, instante_devolucion); la última devuelta sale primero
+        self._total = 0    # Conexiones abiertas (libres + prestadas)
+        self._cerrado = False
+        self.registro_sentencias = RegistroSentencias()
+
+        for _ in range(min_size):
+            self._libres.append((self._fabrica(), time.monotonic()))
+            self._total += 1
+
+    def obtener(self):
+        """
+        Presta una conexión sana del pool, abriendo una nueva si hay capacidad.
+        Levanta ConnectionError si no se puede conectar o si se agota el tiempo de espera.
+        """
+        limite = time.monotonic() + self.timeout
+        desalojadas = []
+        try:
+            with self._condicion:
+                while True:
+                    if self._cerrado:
+                        raise ConnectionError("El pool de conexiones está cerrado.")
+                    desalojadas.extend(self._desalojar_inactivas())
+                    if self._libres:
+                        conexion, devuelta_en = self._libres.pop()
+                        break
+                    if self._total < self.max_size:
+                        # Reservamos el hueco y conectamos fuera del candado
+                        self._total += 1
+                        conexion = None
+                        break
+                    restante = limite - time.monotonic()
+                    if restante <= 0:
+                        raise ConnectionError("Tiempo de espera agotado al obtener una conexión del pool.")
+                    self._condicion.wait(restante)
+        finally:
+            # Fuera del candado: un close() lento no bloquea al resto de hilos que piden conexión
+            for inactiva in desalojadas:
+                self._cerrar_silenciosamente(inactiva)
+
+        if conexion is None:
+            try:
+                return self._fabrica()
+            except Exception:
+                self._liberar_hueco()
+                raise
+
+        if time.monotonic() - devuelta_en >= self.intervalo_verificacion and not self._esta_sana(conexion):
+            # La conexión murió mientras estaba ociosa: se descarta y se abre otra
+            self._cerrar_silenciosamente(conexion)
+            try:
+                return self._fabrica()
+            except Exception:
+                self._liberar_hueco()
+                raise
+        return conexion
+
+    def devolver(self, conexion, descartar=False):
+        """Devuelve una conexión prestada. Si descartar es True, se cierra en lugar de reutilizarse."""
+        if descartar or self._cerrado:
+            self._cerrar_silenciosamente(conexion)
+            self._liberar_hueco()
+            return
+        with self._condicion:
+            self._libres.append((conexion, time.monotonic()))
+            self._condicion.notify()
+
+    @contextmanager
+    def conexion(self):
+        """
+        Presta una conexión durante el bloque `with`.
+        Al salir, con o sin error, se revierte lo que no se haya confirmado, para que
+        una transacción abierta (y sus bloqueos) no pase al siguiente préstamo; si ni
+        siquiera el rollback funciona, la conexión se considera rota y se descarta.
+        """
+        conexion = self.obtener()
+        try:
+            yield conexion
+        finally:
+            try:
+                conexion.rollback()
+                descartar = False
+            except Exception:
+                descartar = True
+            self.devolver(conexion, descartar)
+
+    @contextmanager
+    def cursor(self):
+        """
+        Presta una conexión y entrega un cursor sobre ella; el cursor se cierra
+        antes de devolver la conexión para que el siguiente préstamo la reciba limpia.
+        """
+        with self.conexion() as conexion:
+            cursor = conexion.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+
+    @contextmanager
+    def sentencias(self):
+        """
+        Como cursor(), pero cada sentencia se ejecuta en un cursor preparado que la conexión
+        conserva para la próxima vez (ver RegistroSentencias). Pensado para las sentencias
+        de texto fijo que se repiten; al salir se descartan los resultados pendientes.
+        """
+        with self.conexion() as conexion:
+            cursor = self.registro_sentencias.cursor(conexion)
+            try:
+                yield cursor
+            finally:
+                cursor.liberar()
+
+    def cerrar(self):
+        """Cierra todas las conexiones libres y rechaza nuevos préstamos."""
+        with self._condicion:
+            self._cerrado = True
+            libres, self._libres = self._libres, []
+            self._total -= len(libres)
+            self._condicion.notify_all()
+        for conexion, _ in libres:
+            self._cerrar_silenciosamente(conexion)
+
+    def estadisticas(self):
+        """Devuelve el número de conexiones abiertas, libres y prestadas."""
+        with self._condicion:
+            libres = len(self._libres)
+            return {'abiertas': self._total, 'libres': libres, 'prestadas': self._total - libres}
+
+    def _desalojar_inactivas(self):
+        # Debe llamarse con el candado tomado. Las más antiguas están al fondo de la pila.
+        # Devuelve las conexiones sacadas del pool; quien llama las cierra tras soltar el candado.
+        ahora = time.monotonic()
+        desalojadas = []
+        while (self._libres and self._total > self.min_size
+               and ahora - self._libres[0][1] > self.max_inactividad):
+            conexion, _ = self._libres.pop(0)
+            self._total -= 1
+            desalojadas.append(conexion)
+        return desalojadas
+
+    def _liberar_hueco(self):
+        with self._condicion:
+            self._total -= 1
+            self._condicion.notify()
+
+    def _esta_sana(self, conexion):
+        try:
+            cursor = conexion.cursor()
+            cursor.execute(self.consulta_salud)
+            cursor.fetchall()
+            cursor.close()
+            return True
+        except Exception:
+            return False
+
+    def _cerrar_silenciosamente(self, conexion):
+        self.registro_sentencias.olvidar(conexion)
+        try:
+            conexion.close()
+        except Exception:
+            pass
@@ -0,0 +1,137 @@
+# src/datos/registro_sentencias.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import threading
+from collections import OrderedDict
+
+
+class RegistroSentencias:
+    """
+    Sentencias preparadas por conexión del pool. Cada texto SQL recibe su propio cursor en
+    cada conexión y ese cursor se conserva entre préstamos: pyodbc no vuelve a llamar a
+    SQLPrepare cuando un cursor ejecuta el mismo texto que la vez anterior, y el driver de
+    SQL Server convierte esas ejecuciones en sp_execute sobre el handle que creó
+    sp_prepexec, así que el servidor no vuelve a analizar ni compilar la sentencia.
+    Con SQLite el efecto es el mismo sobre la caché de sentencias de la conexión.
+
+    Un acierto es una ejecución que encontró su cursor ya preparado en la conexión; un
+    fallo, una que tuvo que crearlo. Cada conexión guarda como máximo 'max_por_conexion'
+    sentencias y descarta la usada hace más tiempo.
+    """
+    def __init__(self, max_por_conexion=64):
+        self.max_por_conexion = max_por_conexion
+        self._candado = threading.Lock()
+        self._por_conexion = {}   # id(conexion) -> OrderedDict texto SQL -> cursor
+        self._contadores = {}     # texto SQL -> [aciertos, fallos]
+
+    def cursor(self, conexion):
+        """Cursor de préstamo sobre 'conexion' que ejecuta cada sentencia en su cursor preparado."""
+        return CursorPreparado(self, conexion)
+
+    def _cursor_para(self, conexion, sql):
+        with self._candado:
+            cursores = self._por_conexion.setdefault(id(conexion), OrderedDict())
+            contador = self._contadores.setdefault(sql, [0, 0])
+            cursor = cursores.get(sql)
+            if cursor is not None:
+                cursores.move_to_end(sql)
+                contador[0] += 1
+                return cursor
+            contador[1] += 1
+            descartado = cursores.popitem(last=False)[1] if len(cursores) >= self.max_por_conexion else None
+        if descartado is not None:
+            self._cerrar_cursor(descartado)
+        cursor = conexion.cursor()
+        with self._candado:
+            self._por_conexion.setdefault(id(conexion), OrderedDict())[sql] = cursor
+        return cursor
+
+    def olvidar(self, conexion):
+        """Cierra los cursores de una conexión que el pool va a cerrar."""
+        with self._candado:
+            cursores = self._por_conexion.pop(id(conexion), {})
+        for cursor in cursores.values():
+            self._cerrar_cursor(cursor)
+
+    def estadisticas(self):
+        """
+        Aciertos, fallos y tasa de aciertos totales, cursores preparados abiertos y el detalle
+        por sentencia ({texto SQL: (aciertos, fallos)}).
+        """
+        with self._candado:
+            aciertos = sum(a for a, _ in self._contadores.values())
+            fallos = sum(f for _, f in self._contadores.values())
+            return {
+                'aciertos': aciertos,
+                'fallos': fallos,
+                'tasa_aciertos': aciertos / (aciertos + fallos) if aciertos + fallos else 0.0,
+                'preparadas': sum(len(c) for c in self._por_conexion.values()),
+                'por_sentencia': {sql: tuple(c) for sql, c in self._contadores.items()},
+            }
+
+    @staticmethod
+    def _liberar(cursor):
+        """
+        Descarta los resultados pendientes sin perder la preparación, para que la conexión
+        quede libre para otra sentencia (sin MARS, SQL Server no admite dos a la vez).
+        """
+        try:
+            if hasattr(cursor, 'nextset'):
+                while cursor.nextset():  # pyodbc libera el resultado conservando lo preparado
+                    pass
+            else:
+                cursor.fetchall()  # sqlite3: terminar el recorrido reinicia la sentencia
+        except Exception:
+            pass
+
+    @staticmethod
+    def _cerrar_cursor(cursor):
+        try:
+            cursor.close()
+        except Exception:
+            pass
+
+
+class CursorPreparado:
+    """
+    Fachada de cursor para un préstamo del pool: execute() elige el cursor preparado de esa
+    sentencia en la conexión y las lecturas se hacen sobre el último usado. La transacción es
+    la de la conexión (cursor.connection.commit()).
+    """
+    def __init__(self, registro, conexion):
+        self._registro = registro
+        self.connection = conexion
+        self._actual = None
+
+    def execute(self, sql, *parametros):
+        cursor = self._registro._cursor_para(self.connection, sql)
+        if self._actual is not None and self._actual is not cursor:
+            self._registro._liberar(self._actual)
+        self._actual = cursor
+        cursor.execute(sql, *parametros)
+        return self
+
+    def commit(self):
+        self.connection.commit()
+
+    def liberar(self):
+        """Deja la conexión sin resultados pendientes antes de devolverla al pool."""
+        if self._actual is not None:
+            self._registro._liberar(self._actual)
+            self._actual = None
+
+    def fetchone(self):
+        return self._actual.fetchone()
+
+    def fetchmany(self, cantidad):
+        return self._actual.fetchmany(cantidad)
+
+    def fetchall(self):
+        return self._actual.fetchall()
+
+    @property
+    def rowcount(self):
+        return self._actual.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._actual.lastrowid
@@ -0,0 +1,130 @@
+# src/dominio/calculo_notas.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+from operator import attrgetter
+
+from src.dominio.evaluacion import CampoNota
+
+try:
+    import numpy as np  # Opcional: sin NumPy las notas se calculan una a una con calcular_nota()
+except ImportError:
+    np = None
+
+_NOTA_MEMORIZADA = attrgetter('_nota')
+
+
+def calcular_notas_columnas(clase, puntaje, *campos):
+    """
+    Aplica la fórmula de nota de 'clase' a columnas enteras (arreglos NumPy alineados con
+    clase.CAMPOS_NOTA). Usa la misma expresión que el método escalar, así que cada elemento
+    es idéntico bit a bit a clase.calcular_nota().
+    """
+    return np.asarray(clase.formula_nota(np.asarray(puntaje, dtype=np.float64),
+                                         *(np.asarray(c, dtype=np.int64) for c in campos)),
+                      dtype=np.float64)
+
+
+def _extraer(grupo, clase, campo, dtype):
+    # Lee el atributo donde CampoNota guarda el valor, sin pasar por el descriptor en Python
+    descriptor = getattr(clase, campo, None)
+    atributo = descriptor.atributo if isinstance(descriptor, CampoNota) else campo
+    return np.fromiter(map(attrgetter(atributo), grupo), dtype=dtype, count=len(grupo))
+
+
+def calcular_notas(evaluaciones):
+    """
+    Calcula la nota de todas las evaluaciones de una vez y la retorna como arreglo float64
+    en el mismo orden de entrada. Las notas ya memorizadas se reutilizan; el resto se agrupa
+    por clase, se evalúa cada fórmula como una única expresión NumPy sobre las columnas del
+    subtipo y se memoriza en cada evaluación, como haría calcular_nota().
+    Levanta ValueError si NumPy no está instalado.
+    """
+    if np is None:
+        raise ValueError("El cálculo de notas por lotes requiere el paquete 'numpy' (pip install numpy).")
+    evaluaciones = evaluaciones if isinstance(evaluaciones, (list, tuple)) else list(evaluaciones)
+    memorizadas = list(map(_NOTA_MEMORIZADA, evaluaciones))
+    if None not in memorizadas:
+        return np.array(memorizadas, dtype=np.float64)
+
+    posiciones_por_clase = {}
+    for posicion, nota in enumerate(memorizadas):
+        if nota is None:
+            posiciones_por_clase.setdefault(type(evaluaciones[posicion]), []).append(posicion)
+
+    for clase, posiciones in posiciones_por_clase.items():
+        grupo = [evaluaciones[p] for p in posiciones]
+        puntaje = _extraer(grupo, clase, 'puntaje', np.float64)
+        campos = [_extraer(grupo, clase, campo, np.int64) for campo in clase.CAMPOS_NOTA]
+        for posicion, evaluacion, nota in zip(posiciones, grupo,
+                                              calcular_notas_columnas(clase, puntaje, *campos).tolist()):
+            evaluacion._nota = memorizadas[posicion] = nota
+    return np.array(memorizadas, dtype=np.float64)
+
+
+def lista_notas(evaluaciones):
+    """
+    Notas de las evaluaciones como lista de float, en el mismo orden: con calcular_notas() si
+    NumPy está disponible y, si no, llamando a calcular_nota() de cada una. Ambas vías dan
+    los mismos valores bit a bit.
+    """
+    if np is None:
+        return [e.calcular_nota() for e in evaluaciones]
+    return calcular_notas(evaluaciones).tolist()
+
+
+# Comprobación: el cálculo por lotes debe coincidir bit a bit con el método escalar.
+if __name__ == '__main__':
+    import random
+    import time
+    from datetime import date
+
+    from src.dominio.examen import Examen
+    from src.dominio.presentacion import Presentacion
+    from src.dominio.trabajo import Trabajo
+
+    rnd = random.Random(0)
+    fecha = date(2025, 1, 1)
+    evaluaciones = []
+    for i in range(300_000):
+        puntaje = rnd.choice([rnd.uniform(0, 100), round(rnd.uniform(0, 100), 2), rnd.randint(0, 100)])
+        tipo = i % 3
+        if tipo == 0:
+            evaluaciones.append(Examen(f"E{i}", fecha, puntaje, rnd.randint(15, 300), rnd.randint(1, 100)))
+        elif tipo == 1:
+            evaluaciones.append(Trabajo(f"E{i}", fecha, puntaje, rnd.randint(1, 100), f"Tema {i}"))
+        else:
+            evaluaciones.append(Presentacion(f"E{i}", fecha, puntaje, rnd.randint(5, 60), rnd.randint(1, 1000)))
+
+    inicio = time.perf_counter()
+    escalares = np.array([e._calcular_nota() for e in evaluaciones], dtype=np.float64)
+    t_escalar = time.perf_counter() - inicio
+
+    # Columnas ya armadas (como las de AlmacenColumnar): solo se mide la fórmula sobre ellas
+    grupos = {}
+    for posicion, evaluacion in enumerate(evaluaciones):
+        grupos.setdefault(type(evaluacion), []).append(posicion)
+    columnas = {clase: (np.array(posiciones),
+                        np.array([evaluaciones[p].puntaje for p in posiciones], dtype=np.float64),
+                        [np.array([getattr(evaluaciones[p], campo) for p in posiciones], dtype=np.int64)
+                         for campo in clase.CAMPOS_NOTA])
+                for clase, posiciones in grupos.items()}
+    lote = np.empty(len(evaluaciones), dtype=np.float64)
+    inicio = time.perf_counter()
+    for clase, (posiciones, puntaje, campos) in columnas.items():
+        lote[posiciones] = calcular_notas_columnas(clase, puntaje, *campos)
+    t_lote = time.perf_counter() - inicio
+
+    assert np.array_equal(escalares.view(np.int64), lote.view(np.int64)), "Las notas no son idénticas bit a bit"
+
+    inicio = time.perf_counter()
+    objetos = calcular_notas(evaluaciones)
+    t_objetos = time.perf_counter() - inicio
+    assert np.array_equal(escalares.view(np.int64), objetos.view(np.int64)), "Las notas no son idénticas bit a bit"
+    # calcular_notas() deja las notas memorizadas: la segunda pasada y calcular_nota() las reutilizan
+    inicio = time.perf_counter()
+    memorizadas = calcular_notas(evaluaciones)
+    t_memorizadas = time.perf_counter() - inicio
+    assert np.array_equal(objetos.view(np.int64), memorizadas.view(np.int64))
+    assert all(e.calcular_nota() == nota for e, nota in zip(evaluaciones, objetos.tolist()))
+    print(f"{len(evaluaciones)} notas idénticas bit a bit: escalar {t_escalar * 1000:.0f} ms, "
+          f"calcular_notas {t_objetos * 1000:.0f} ms (memorizadas {t_memorizadas * 1000:.0f} ms), "
+          f"columnas {t_lote * 1000:.1f} ms")
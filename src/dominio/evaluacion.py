@@ -1,9 +1,57 @@
 # src/dominio/evaluacion.py
 #nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import math
 from datetime import date
 
+
+def redondear_puntaje(valor):
+    """
+    Redondea a centésimas como la columna Puntaje DECIMAL(5,2) de la base de datos, con la
+    mitad alejándose del cero. round() lleva la mitad al par; solo difiere en los valores con
+    un 5 en la tercera cifra decimal que un double representa sin error (múltiplos impares de 1/8).
+    """
+    redondeado = round(valor, 2)
+    if math.isfinite(redondeado) and valor.as_integer_ratio()[1] == 8:
+        redondeado = math.copysign(math.floor(abs(valor) * 100 + 0.5) / 100, valor)
+    return redondeado
+
+
+class CampoNota:
+    """
+    Atributo del que depende calcular_nota(): al asignarlo se descarta la nota memorizada.
+    El valor se guarda en el atributo '_<nombre>' de la instancia, pasado antes por 'redondeo'
+    si se indica (p. ej. el puntaje, para tener en memoria el mismo valor que guarda la base de datos).
+    """
+    def __init__(self, redondeo=None):
+        self.redondeo = redondeo
+
+    def __set_name__(self, owner, name):
+        self.atributo = '_' + name
+
+    def __get__(self, instancia, owner=None):
+        if instancia is None:
+            return self
+        return getattr(instancia, self.atributo)
+
+    def __set__(self, instancia, valor):
+        if self.redondeo is not None:
+            valor = self.redondeo(valor)
+        setattr(instancia, self.atributo, valor)
+        instancia._nota = None
+
+
 class Evaluacion:
+    # __slots__ en toda la jerarquía: sin __dict__ por instancia, que era la mayor parte
+    # de la memoria al cargar cientos de miles de evaluaciones
+    __slots__ = ('nombre', 'fecha', '_puntaje', 'tipo', '_nota')
+
+    puntaje = CampoNota(redondear_puntaje)  # Centésimas, como Puntaje DECIMAL(5,2) en la base de datos
+
+    # Atributos, además del puntaje, que recibe formula_nota (en ese orden)
+    CAMPOS_NOTA = ()
+
     def __init__(self, nombre: str, fecha: date, puntaje: float, tipo: str): # Añadir 'tipo' aquí
+        self._nota = None  # Nota memorizada; CampoNota la invalida al cambiar un dato de la fórmula
         self.nombre = nombre
         self.fecha = fecha
         self.puntaje = puntaje
@@ -18,6 +66,18 @@ class Evaluacion:
             raise ValueError("El puntaje debe estar entre 0.0 y 100.0.")
 
     def calcular_nota(self) -> float:
+        # La nota se memoriza: tablas, estadísticas y rankings la piden muchas veces
+        # y solo cambia cuando se asigna alguno de los CampoNota.
+        nota = self._nota
+        if nota is None:
+            nota = self._nota = self._calcular_nota()
+        return nota
+
+    @staticmethod
+    def formula_nota(puntaje):
+        return puntaje
+
+    def _calcular_nota(self) -> float:
         # Este método podría ser abstracto o tener una implementación por defecto
         # que las subclases sobrescribirán.
         # Por ahora, simplemente devolvemos el puntaje tal como está si no hay otra lógica.
@@ -1,9 +1,17 @@
 # src/dominio/examen.py
 #nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
-from src.dominio.evaluacion import Evaluacion
+from src.dominio.evaluacion import Evaluacion, CampoNota
 from datetime import date
 
 class Examen(Evaluacion):
+    __slots__ = ('_duracion_min', '_num_preguntas')
+
+    duracion_min = CampoNota()
+    num_preguntas = CampoNota()
+
+    # Atributos, además del puntaje, que recibe formula_nota (en ese orden)
+    CAMPOS_NOTA = ('duracion_min', 'num_preguntas')
+
     def __init__(self, nombre: str, fecha: date, puntaje: float, duracion_min: int, num_preguntas: int):
         # Pasar el tipo "Examen" al constructor de la clase base
         super().__init__(nombre, fecha, puntaje, "Examen")
@@ -14,10 +22,15 @@ class Examen(Evaluacion):
         if not (1 <= self.num_preguntas <= 100):
             raise ValueError("El número de preguntas debe estar entre 1 y 100.")
 
-    def calcular_nota(self) -> float:
+    @staticmethod
+    def formula_nota(puntaje, duracion_min, num_preguntas):
+        # Misma expresión para un escalar o para columnas NumPy enteras (ver calculo_notas.py)
+        return (puntaje * num_preguntas / 100) / (duracion_min / 60)
+
+    def _calcular_nota(self) -> float:
         # Lógica específica para calcular la nota de un examen
         # Por ejemplo, podrías dar más peso a las preguntas o la duración
-        return (self.puntaje * self.num_preguntas / 100) / (self.duracion_min / 60) # Ejemplo: puedes ajustar esta fórmula
+        return self.formula_nota(self.puntaje, self.duracion_min, self.num_preguntas) # Ejemplo: puedes ajustar esta fórmula
         # O simplemente el puntaje, si esa es la lógica actual
         # return self.puntaje
 
@@ -31,4 +44,38 @@ class Examen(Evaluacion):
             "duracion_min": self.duracion_min,
             "num_preguntas": self.num_preguntas
         })
-        return data
\ No newline at end of file
+        return data
+
+# Benchmark de memoria: bytes por evaluación con __slots__ frente a la versión anterior con __dict__.
+if __name__ == '__main__':
+    import gc
+    import sys
+    import tracemalloc
+
+    class ExamenConDict:
+        """Réplica de la clase anterior: mismos atributos guardados en el __dict__ de la instancia."""
+        def __init__(self, nombre, fecha, puntaje, duracion_min, num_preguntas):
+            self.nombre = nombre
+            self.fecha = fecha
+            self.puntaje = puntaje
+            self.tipo = "Examen"
+            self.duracion_min = duracion_min
+            self.num_preguntas = num_preguntas
+
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    fecha = date(2025, 1, 1)
+    nombres = [f"Evaluacion {i}" for i in range(N)]  # compartidos: solo se mide el objeto
+
+    def medir(clase):
+        gc.collect()
+        tracemalloc.start()
+        objetos = [clase(nombre, fecha, 75.5, 60, 20) for nombre in nombres]
+        actual, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del objetos
+        return actual / N
+
+    antes = medir(ExamenConDict)
+    despues = medir(Examen)
+    print(f"{N} evaluaciones: {antes:.0f} bytes/evaluación con __dict__, "
+          f"{despues:.0f} bytes/evaluación con __slots__ ({100 * (1 - despues / antes):.0f}% menos)")
@@ -1,9 +1,16 @@
 # src/dominio/presentacion.py
 #nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
-from src.dominio.evaluacion import Evaluacion
+from src.dominio.evaluacion import Evaluacion, CampoNota
 from datetime import date
 
 class Presentacion(Evaluacion):
+    __slots__ = ('duracion_min', '_tamano_audiencia')
+
+    tamano_audiencia = CampoNota()
+
+    # Atributos, además del puntaje, que recibe formula_nota (en ese orden)
+    CAMPOS_NOTA = ('tamano_audiencia',)
+
     def __init__(self, nombre: str, fecha: date, puntaje: float, duracion_min: int, tamano_audiencia: int):
         # Pasar el tipo "Presentación" al constructor de la clase base
         super().__init__(nombre, fecha, puntaje, "Presentación") # Usar "Presentación" para coincidir con la UI
@@ -14,10 +21,15 @@ class Presentacion(Evaluacion):
         if not (1 <= self.tamano_audiencia <= 1000): # Ajusta el rango de audiencia si es necesario
             raise ValueError("El tamaño de la audiencia debe ser al menos 1.")
 
-    def calcular_nota(self) -> float:
+    @staticmethod
+    def formula_nota(puntaje, tamano_audiencia):
+        # Misma expresión para un escalar o para columnas NumPy enteras (ver calculo_notas.py)
+        return puntaje * (1 + (tamano_audiencia / 200))
+
+    def _calcular_nota(self) -> float:
         # Lógica específica para calcular la nota de una presentación
         # return self.puntaje # Si simplemente es el puntaje
-        return self.puntaje * (1 + (self.tamano_audiencia / 200)) # Ejemplo: más audiencia, mejor nota
+        return self.formula_nota(self.puntaje, self.tamano_audiencia) # Ejemplo: más audiencia, mejor nota
 
     def __str__(self):
         return f"Presentación: {self.nombre}, Fecha: {self.fecha}, Puntaje: {self.puntaje}, Duración: {self.duracion_min} min, Audiencia: {self.tamano_audiencia}"
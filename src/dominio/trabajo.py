@@ -1,9 +1,16 @@
 # src/dominio/trabajo.py
 #nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
-from src.dominio.evaluacion import Evaluacion
+from src.dominio.evaluacion import Evaluacion, CampoNota
 from datetime import date
 
 class Trabajo(Evaluacion):
+    __slots__ = ('_num_paginas', 'tema')
+
+    num_paginas = CampoNota()
+
+    # Atributos, además del puntaje, que recibe formula_nota (en ese orden)
+    CAMPOS_NOTA = ('num_paginas',)
+
     def __init__(self, nombre: str, fecha: date, puntaje: float, num_paginas: int, tema: str):
         # Pasar el tipo "Trabajo" al constructor de la clase base
         super().__init__(nombre, fecha, puntaje, "Trabajo")
@@ -14,10 +21,15 @@ class Trabajo(Evaluacion):
         if not tema:
             raise ValueError("El tema del trabajo no puede ser vacío.")
 
-    def calcular_nota(self) -> float:
+    @staticmethod
+    def formula_nota(puntaje, num_paginas):
+        # Misma expresión para un escalar o para columnas NumPy enteras (ver calculo_notas.py)
+        return puntaje * (1 + (num_paginas / 100))
+
+    def _calcular_nota(self) -> float:
         # Lógica específica para calcular la nota de un trabajo
         # return self.puntaje # Si simplemente es el puntaje
-        return self.puntaje * (1 + (self.num_paginas / 100)) # Ejemplo: más páginas, mejor nota
+        return self.formula_nota(self.puntaje, self.num_paginas) # Ejemplo: más páginas, mejor nota
 
     def __str__(self):
         return f"Trabajo: {self.nombre}, Fecha: {self.fecha}, Puntaje: {self.puntaje}, Páginas: {self.num_paginas}, Tema: {self.tema}"
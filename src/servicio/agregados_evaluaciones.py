@@ -0,0 +1,247 @@
+# src/servicio/agregados_evaluaciones.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+from fractions import Fraction
+from itertools import islice
+
+from src.dominio.calculo_notas import lista_notas
+from src.servicio.indices_evaluaciones import TIPOS_EVALUACION, tipo_de
+from src.servicio.lista_ordenada import ListaOrdenada
+
+# Todo double finito es múltiplo de 2**-1074, así que escalar por 2**1074 da enteros exactos
+_ESCALA = 1 << 1074
+
+
+def _a_entero_exacto(valor):
+    numerador, denominador = float(valor).as_integer_ratio()
+    return numerador * (_ESCALA // denominador)
+
+
+class _Acumulador:
+    """Cantidad, suma exacta y notas ordenadas de un grupo de evaluaciones."""
+    def __init__(self):
+        self.cantidad = 0
+        self.suma = 0  # suma de notas escalada a entero: sumar y restar no acumula error
+        self.notas = ListaOrdenada()  # entradas (nota, -secuencia, evaluacion)
+
+    def agregar(self, entrada):
+        self.cantidad += 1
+        self.suma += _a_entero_exacto(entrada[0])
+        self.notas.agregar(entrada)
+
+    def agregar_varios(self, entradas):
+        self.cantidad += len(entradas)
+        self.suma += sum(_a_entero_exacto(entrada[0]) for entrada in entradas)
+        self.notas.agregar_varios(entradas)
+
+    def eliminar(self, entrada):
+        self.cantidad -= 1
+        self.suma -= _a_entero_exacto(entrada[0])
+        self.notas.eliminar(entrada)
+
+    def eliminar_varios(self, entradas):
+        self.cantidad -= len(entradas)
+        self.suma -= sum(_a_entero_exacto(entrada[0]) for entrada in entradas)
+        self.notas.eliminar_varios(entradas)
+
+    def limpiar(self):
+        self.cantidad = 0
+        self.suma = 0
+        self.notas.limpiar()
+
+    def promedio(self):
+        if not self.cantidad:
+            return 0.0
+        # Media exacta redondeada una sola vez a double
+        return float(Fraction(self.suma, _ESCALA * self.cantidad))
+
+    def mejor(self):
+        """Entrada con la nota más alta; a igualdad de nota, la más antigua del almacén."""
+        return self.notas[-1] if self.cantidad else None
+
+
+class AgregadosEvaluaciones:
+    """
+    Índice de AlmacenEvaluaciones que mantiene, por tipo y en total, la cantidad, la suma
+    y las notas ordenadas. Cada mutación cuesta O(log n); las altas masivas (agregar_varios)
+    calculan sus notas en lote. El panel de estadísticas lee los valores ya calculados sin
+    recorrer las evaluaciones ni volver a llamar a calcular_nota().
+    Las notas ordenadas también responden las clasificaciones (mejores, peores, puesto y
+    percentil) sin ordenar la colección en cada consulta.
+    """
+    def __init__(self):
+        self._total = _Acumulador()
+        self._por_tipo = {tipo: _Acumulador() for tipo in TIPOS_EVALUACION}
+        self._entradas = {}  # secuencia -> (tipo, entrada) para retirar exactamente lo que se sumó
+
+    def agregar(self, secuencia, evaluacion):
+        tipo = tipo_de(evaluacion)
+        entrada = (evaluacion.calcular_nota(), -secuencia, evaluacion)
+        self._entradas[secuencia] = (tipo, entrada)
+        self._total.agregar(entrada)
+        self._por_tipo.setdefault(tipo, _Acumulador()).agregar(entrada)
+
+    def agregar_varios(self, pares):
+        """Agrega una lista de (secuencia, evaluacion) calculando todas sus notas en lote (ver calcular_notas)."""
+        entradas_por_tipo = {}
+        for (secuencia, evaluacion), nota in zip(pares, lista_notas([e for _, e in pares])):
+            tipo = tipo_de(evaluacion)
+            entrada = (nota, -secuencia, evaluacion)
+            self._entradas[secuencia] = (tipo, entrada)
+            entradas_por_tipo.setdefault(tipo, []).append(entrada)
+        self._total.agregar_varios([e for entradas in entradas_por_tipo.values() for e in entradas])
+        for tipo, entradas in entradas_por_tipo.items():
+            self._por_tipo.setdefault(tipo, _Acumulador()).agregar_varios(entradas)
+
+    def eliminar(self, secuencia, evaluacion):
+        tipo, entrada = self._entradas.pop(secuencia)
+        self._total.eliminar(entrada)
+        self._por_tipo[tipo].eliminar(entrada)
+
+    def eliminar_varios(self, pares):
+        entradas_por_tipo = {}
+        for secuencia, _ in pares:
+            tipo, entrada = self._entradas.pop(secuencia)
+            entradas_por_tipo.setdefault(tipo, []).append(entrada)
+        self._total.eliminar_varios([e for entradas in entradas_por_tipo.values() for e in entradas])
+        for tipo, entradas in entradas_por_tipo.items():
+            self._por_tipo[tipo].eliminar_varios(entradas)
+
+    def reemplazar(self, secuencia, anterior, nueva):
+        self.eliminar(secuencia, anterior)
+        self.agregar(secuencia, nueva)
+
+    def limpiar(self):
+        self._entradas.clear()
+        self._total.limpiar()
+        for acumulador in self._por_tipo.values():
+            acumulador.limpiar()
+
+    def promedio_general(self):
+        return self._total.promedio()
+
+    def mejor_evaluacion(self):
+        mejor = self._total.mejor()
+        return mejor[2] if mejor else None
+
+    # --- Clasificación: nota de mayor a menor y, a igualdad, la más antigua del almacén primero ---
+    def _acumulador(self, tipo):
+        return self._total if tipo is None else self._por_tipo.get(tipo) or _Acumulador()
+
+    def mejores(self, k, tipo=None):
+        """Las k evaluaciones con la nota más alta (del tipo indicado, o de todos con None), en O(k)."""
+        return [entrada[2] for entrada in islice(reversed(self._acumulador(tipo).notas), max(k, 0))]
+
+    def peores(self, k, tipo=None):
+        """Las k evaluaciones con la nota más baja, de menor a mayor: la clasificación recorrida al revés."""
+        return [entrada[2] for entrada in islice(self._acumulador(tipo).notas, max(k, 0))]
+
+    def posicion(self, secuencia, por_tipo=False):
+        """Puesto (1 = la mejor) de la evaluación con esa secuencia, entre todas o solo entre las de su tipo."""
+        tipo, entrada = self._entradas[secuencia]
+        acumulador = self._por_tipo[tipo] if por_tipo else self._total
+        return acumulador.notas.contar_mayores(entrada) + 1
+
+    def percentil(self, p, tipo=None):
+        """
+        Nota del percentil p (de 0 a 100), interpolando entre las dos notas más cercanas como
+        numpy.percentile. Retorna None si no hay evaluaciones. Levanta ValueError si p no es válido.
+        """
+        if not 0 <= p <= 100:
+            raise ValueError("El percentil debe estar entre 0 y 100.")
+        notas = self._acumulador(tipo).notas
+        if not notas:
+            return None
+        posicion = (len(notas) - 1) * p / 100
+        inferior = int(posicion)
+        nota = notas[inferior][0]
+        if posicion > inferior:
+            nota += (notas[inferior + 1][0] - nota) * (posicion - inferior)
+        return nota
+
+    def estadisticas_por_tipo(self):
+        """Mismo formato que GestorEvaluaciones.obtener_estadisticas_por_tipo."""
+        stats = {}
+        for tipo in TIPOS_EVALUACION:
+            acumulador = self._por_tipo[tipo]
+            mejor = acumulador.mejor()
+            if mejor:
+                stats[tipo] = {
+                    'count': acumulador.cantidad,
+                    'promedio': acumulador.promedio(),
+                    'best_name': mejor[2].nombre,
+                    'best_score': mejor[0]
+                }
+            else:
+                stats[tipo] = {
+                    'count': 0,
+                    'promedio': 0.0,
+                    'best_name': "N/A",
+                    'best_score': 0.0
+                }
+        return stats
+
+
+# Prueba basada en propiedades: tras cualquier secuencia aleatoria de altas, reemplazos y bajas,
+# los agregados incrementales deben coincidir exactamente con el recálculo completo. El contrato
+# del promedio es la media exacta de las notas redondeada una sola vez a double, así que se compara
+# con == contra esa media calculada con Fraction (la suma de floats del panel anterior redondeaba
+# en cada paso y difería en el último bit en algo más de un tercio de los casos).
+if __name__ == '__main__':
+    import random
+    from datetime import date
+
+    from src.dominio.examen import Examen
+    from src.dominio.presentacion import Presentacion
+    from src.dominio.trabajo import Trabajo
+    from src.servicio.almacen_evaluaciones import AlmacenEvaluaciones
+
+    def evaluacion_aleatoria(rnd, nombre):
+        fecha = date(2025, rnd.randint(1, 12), rnd.randint(1, 28))
+        puntaje = rnd.choice([0.0, 100.0, 50.0, round(rnd.uniform(0, 100), 2), rnd.uniform(0, 100)])
+        tipo = rnd.randrange(3)
+        if tipo == 0:
+            return Examen(nombre, fecha, puntaje, rnd.randint(15, 300), rnd.randint(1, 100))
+        if tipo == 1:
+            return Trabajo(nombre, fecha, puntaje, rnd.randint(1, 100), f"Tema {nombre}")
+        return Presentacion(nombre, fecha, puntaje, rnd.randint(5, 60), rnd.randint(1, 1000))
+
+    def recalcular(evaluaciones):
+        if not evaluaciones:
+            return 0, 0.0, None
+        promedio = float(sum(Fraction(e.calcular_nota()) for e in evaluaciones) / len(evaluaciones))
+        mejor = max(evaluaciones, key=lambda e: e.calcular_nota())  # primera de las máximas
+        return len(evaluaciones), promedio, mejor
+
+    for semilla in range(200):
+        rnd = random.Random(semilla)
+        almacen = AlmacenEvaluaciones()
+        agregados = AgregadosEvaluaciones()
+        almacen.registrar_indice(agregados)
+        for _ in range(rnd.randint(1, 300)):
+            operacion = rnd.random()
+            nombre = f"E{rnd.randrange(120)}"
+            if operacion < 0.55:
+                if nombre not in almacen:
+                    almacen.agregar(evaluacion_aleatoria(rnd, nombre))
+            elif operacion < 0.8:
+                nueva = evaluacion_aleatoria(rnd, f"E{rnd.randrange(120)}")
+                if nombre in almacen and (nueva.nombre == nombre or nueva.nombre not in almacen):
+                    almacen.reemplazar(nombre, nueva)
+            elif operacion < 0.93:
+                almacen.eliminar(nombre)
+            elif operacion < 0.98:
+                almacen.eliminar_varios(f"E{rnd.randrange(120)}" for _ in range(rnd.randint(1, 40)))
+            else:
+                almacen.limpiar()
+
+            lista = list(almacen)
+            cantidad, promedio, mejor = recalcular(lista)
+            assert agregados.promedio_general() == promedio, semilla
+            assert agregados.mejor_evaluacion() is mejor, semilla
+            stats = agregados.estadisticas_por_tipo()
+            for tipo in TIPOS_EVALUACION:
+                cantidad, promedio, mejor = recalcular([e for e in lista if tipo_de(e) == tipo])
+                assert stats[tipo]['count'] == cantidad, semilla
+                assert stats[tipo]['promedio'] == promedio, semilla
+                assert stats[tipo]['best_name'] == (mejor.nombre if mejor else "N/A"), semilla
+    print("Agregados incrementales coinciden exactamente con el recálculo completo en 200 secuencias aleatorias.")
@@ -0,0 +1,301 @@
+# src/servicio/almacen_columnar.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+from datetime import date
+
+import numpy as np
+
+from src.dominio.calculo_notas import calcular_notas_columnas
+from src.dominio.examen import Examen
+from src.dominio.presentacion import Presentacion
+from src.dominio.trabajo import Trabajo
+from src.servicio.indices_evaluaciones import TIPOS_EVALUACION, normalizar_tipo, tipo_de
+
+# Código numérico de cada tipo en la columna 'tipo'
+CODIGOS_TIPO = {tipo: codigo for codigo, tipo in enumerate(TIPOS_EVALUACION)}
+EXAMEN, TRABAJO, PRESENTACION = (CODIGOS_TIPO[t] for t in TIPOS_EVALUACION)
+
+SIN_TEMA = -1
+
+
+class AlmacenColumnar:
+    """
+    Almacén de evaluaciones por columnas para análisis sobre millones de filas.
+    Cada campo vive en un arreglo NumPy (puntaje float64, fecha como ordinal int32, código
+    de tipo int8 y los enteros de cada subtipo); nombre y tema se codifican como índices
+    a diccionarios de cadenas. Los objetos Examen/Trabajo/Presentacion solo se construyen
+    cuando se accede a una fila.
+
+    También implementa el protocolo de índice de AlmacenEvaluaciones, así que puede
+    registrarse en él para mantenerse sincronizado con el gestor.
+    """
+    CAPACIDAD_INICIAL = 1024
+
+    def __init__(self, capacidad=CAPACIDAD_INICIAL):
+        capacidad = max(1, capacidad)
+        self._longitud = 0
+        self._puntaje = np.empty(capacidad, dtype=np.float64)
+        self._fecha = np.empty(capacidad, dtype=np.int32)
+        self._tipo = np.empty(capacidad, dtype=np.int8)
+        self._duracion = np.zeros(capacidad, dtype=np.int32)          # Examen y Presentacion
+        self._num_preguntas = np.zeros(capacidad, dtype=np.int32)     # Examen
+        self._num_paginas = np.zeros(capacidad, dtype=np.int32)       # Trabajo
+        self._tamano_audiencia = np.zeros(capacidad, dtype=np.int32)  # Presentacion
+        self._nombre = np.empty(capacidad, dtype=np.int32)  # índice en self._nombres
+        self._tema = np.empty(capacidad, dtype=np.int32)    # índice en self._temas o SIN_TEMA
+        self._viva = np.zeros(capacidad, dtype=np.bool_)    # False = fila borrada pendiente de compactar
+
+        self._nombres = []
+        self._temas = []
+        self._codigo_tema = {}
+        self._fila_por_secuencia = {}
+        self._borradas = 0
+
+    @classmethod
+    def desde_evaluaciones(cls, evaluaciones):
+        evaluaciones = list(evaluaciones)
+        almacen = cls(len(evaluaciones))
+        for evaluacion in evaluaciones:
+            almacen.agregar_evaluacion(evaluacion)
+        return almacen
+
+    @classmethod
+    def desde_columnas(cls, puntaje, fecha, tipo, duracion, num_preguntas, num_paginas,
+                       tamano_audiencia, tema, nombres, temas):
+        """
+        Crea el almacén sobre arreglos ya armados (p. ej. las columnas de una instantánea binaria
+        abierta con mmap) sin copiarlos; 'tema' indexa 'temas' y la fila i se llama nombres[i].
+        Las columnas de solo lectura se copian la primera vez que se modifican.
+        """
+        almacen = cls.__new__(cls)
+        almacen._longitud = len(puntaje)
+        almacen._puntaje, almacen._fecha, almacen._tipo = puntaje, fecha, tipo
+        almacen._duracion, almacen._num_preguntas = duracion, num_preguntas
+        almacen._num_paginas, almacen._tamano_audiencia, almacen._tema = num_paginas, tamano_audiencia, tema
+        almacen._nombre = np.arange(len(puntaje), dtype=np.int32)
+        almacen._viva = np.ones(len(puntaje), dtype=np.bool_)
+        almacen._nombres = list(nombres)
+        almacen._temas = list(temas)
+        almacen._codigo_tema = {t: codigo for codigo, t in enumerate(almacen._temas)}
+        almacen._fila_por_secuencia = {}
+        almacen._borradas = 0
+        return almacen
+
+    # --- Carga ---
+    def agregar_fila(self, nombre, fecha, puntaje, tipo, duracion_min=0, num_preguntas=0,
+                     num_paginas=0, tema=None, tamano_audiencia=0):
+        """Agrega una fila a partir de valores sueltos (p. ej. una fila de la base de datos). Retorna su posición."""
+        if self._longitud == len(self._puntaje):
+            self._crecer(max(1, 2 * len(self._puntaje)))
+        i = self._longitud
+        self._nombres.append(nombre)
+        self._nombre[i] = len(self._nombres) - 1
+        self._escribir_fila(i, nombre, fecha, puntaje, tipo, duracion_min, num_preguntas,
+                            num_paginas, tema, tamano_audiencia)
+        self._viva[i] = True
+        self._longitud += 1
+        return i
+
+    def _escribir_fila(self, i, nombre, fecha, puntaje, tipo, duracion_min=0, num_preguntas=0,
+                       num_paginas=0, tema=None, tamano_audiencia=0):
+        self._nombres[self._nombre[i]] = nombre
+        self._puntaje[i] = puntaje
+        self._fecha[i] = fecha.toordinal()
+        self._tipo[i] = CODIGOS_TIPO[normalizar_tipo(tipo)]
+        self._duracion[i] = duracion_min or 0
+        self._num_preguntas[i] = num_preguntas or 0
+        self._num_paginas[i] = num_paginas or 0
+        self._tamano_audiencia[i] = tamano_audiencia or 0
+        self._tema[i] = self._codificar_tema(tema)
+
+    def agregar_evaluacion(self, evaluacion):
+        return self.agregar_fila(*self._valores(evaluacion))
+
+    # --- Protocolo de índice de AlmacenEvaluaciones ---
+    def agregar(self, secuencia, evaluacion):
+        self._fila_por_secuencia[secuencia] = self.agregar_evaluacion(evaluacion)
+
+    def eliminar(self, secuencia, evaluacion):
+        fila = self._fila_por_secuencia.pop(secuencia)
+        self._viva[fila] = False
+        self._borradas += 1
+        if self._borradas > self._longitud // 2:
+            self.compactar()
+
+    def eliminar_varios(self, pares):
+        filas = [self._fila_por_secuencia.pop(secuencia) for secuencia, _ in pares]
+        self._viva[filas] = False
+        self._borradas += len(filas)
+        if self._borradas > self._longitud // 2:
+            self.compactar()
+
+    def reemplazar(self, secuencia, anterior, nueva):
+        # Se sobrescribe la misma fila para conservar el orden, igual que el almacén principal
+        fila = self._fila_por_secuencia[secuencia]
+        self._hacer_escribible()
+        self._escribir_fila(fila, *self._valores(nueva))
+
+    def limpiar(self):
+        self._longitud = 0
+        self._viva[:] = False
+        self._nombres.clear()
+        self._temas.clear()
+        self._codigo_tema.clear()
+        self._fila_por_secuencia.clear()
+        self._borradas = 0
+
+    def compactar(self):
+        """Elimina físicamente las filas borradas conservando el orden de las demás."""
+        self._hacer_escribible()
+        vivas = np.flatnonzero(self._viva[:self._longitud])
+        nueva_posicion = np.full(self._longitud, -1, dtype=np.int64)
+        nueva_posicion[vivas] = np.arange(len(vivas))
+        for columna in ('_puntaje', '_fecha', '_tipo', '_duracion', '_num_preguntas',
+                        '_num_paginas', '_tamano_audiencia', '_nombre', '_tema'):
+            arreglo = getattr(self, columna)
+            arreglo[:len(vivas)] = arreglo[vivas]
+        self._viva[:len(vivas)] = True
+        self._viva[len(vivas):] = False
+        self._longitud = len(vivas)
+        self._borradas = 0
+        self._fila_por_secuencia = {secuencia: int(nueva_posicion[fila])
+                                    for secuencia, fila in self._fila_por_secuencia.items()}
+
+    # --- Columnas (vistas sin copia sobre las filas usadas) ---
+    @property
+    def puntaje(self):
+        return self._puntaje[:self._longitud]
+
+    @property
+    def fecha(self):
+        return self._fecha[:self._longitud]
+
+    @property
+    def tipo(self):
+        return self._tipo[:self._longitud]
+
+    def filas_vivas(self):
+        return self._viva[:self._longitud]
+
+    def notas(self):
+        """Nota calculada de cada fila, evaluando la fórmula de cada tipo sobre columnas enteras."""
+        n = self._longitud
+        puntaje, tipo = self._puntaje[:n], self._tipo[:n]
+        notas = np.empty(n, dtype=np.float64)
+
+        m = tipo == EXAMEN
+        notas[m] = calcular_notas_columnas(Examen, puntaje[m], self._duracion[:n][m], self._num_preguntas[:n][m])
+        m = tipo == TRABAJO
+        notas[m] = calcular_notas_columnas(Trabajo, puntaje[m], self._num_paginas[:n][m])
+        m = tipo == PRESENTACION
+        notas[m] = calcular_notas_columnas(Presentacion, puntaje[m], self._tamano_audiencia[:n][m])
+        return notas
+
+    # --- Consultas vectorizadas ---
+    def mascara(self, tipo=None, desde=None, hasta=None):
+        """Máscara booleana de las filas vivas que cumplen tipo y rango de fechas (inclusivo)."""
+        mascara = self.filas_vivas().copy()
+        if tipo is not None and tipo != "Todos":
+            mascara &= self.tipo == CODIGOS_TIPO[normalizar_tipo(tipo)]
+        if desde is not None:
+            mascara &= self.fecha >= desde.toordinal()
+        if hasta is not None:
+            mascara &= self.fecha <= hasta.toordinal()
+        return mascara
+
+    def filtrar(self, tipo=None, desde=None, hasta=None):
+        """Posiciones (arreglo de enteros) de las filas que cumplen el filtro, en orden de inserción."""
+        return np.flatnonzero(self.mascara(tipo, desde, hasta))
+
+    def calcular_promedio_general(self):
+        vivas = self.filas_vivas()
+        if not vivas.any():
+            return 0.0
+        return float(self.notas()[vivas].mean())
+
+    def obtener_estadisticas_por_tipo(self):
+        """Mismo formato que GestorEvaluaciones.obtener_estadisticas_por_tipo."""
+        notas = self.notas()
+        vivas = self.filas_vivas()
+        stats = {}
+        for tipo, codigo in CODIGOS_TIPO.items():
+            filas = np.flatnonzero(vivas & (self.tipo == codigo))
+            if len(filas):
+                notas_tipo = notas[filas]
+                mejor = int(np.argmax(notas_tipo))  # primera de las máximas, como max()
+                stats[tipo] = {
+                    'count': len(filas),
+                    'promedio': float(notas_tipo.mean()),
+                    'best_name': self._nombres[self._nombre[filas[mejor]]],
+                    'best_score': float(notas_tipo[mejor])
+                }
+            else:
+                stats[tipo] = {
+                    'count': 0,
+                    'promedio': 0.0,
+                    'best_name': "N/A",
+                    'best_score': 0.0
+                }
+        return stats
+
+    # --- Materialización perezosa ---
+    def evaluacion(self, fila):
+        """Construye el objeto de dominio de la fila indicada."""
+        nombre = self._nombres[self._nombre[fila]]
+        fecha = date.fromordinal(int(self._fecha[fila]))
+        puntaje = float(self._puntaje[fila])
+        codigo = self._tipo[fila]
+        if codigo == EXAMEN:
+            return Examen(nombre, fecha, puntaje, int(self._duracion[fila]), int(self._num_preguntas[fila]))
+        if codigo == TRABAJO:
+            return Trabajo(nombre, fecha, puntaje, int(self._num_paginas[fila]), self._temas[self._tema[fila]])
+        return Presentacion(nombre, fecha, puntaje, int(self._duracion[fila]), int(self._tamano_audiencia[fila]))
+
+    def evaluaciones(self, filas=None):
+        """Genera los objetos de dominio de las filas indicadas (por defecto, todas las vivas)."""
+        if filas is None:
+            filas = np.flatnonzero(self.filas_vivas())
+        for fila in filas:
+            yield self.evaluacion(int(fila))
+
+    def __len__(self):
+        return self._longitud - self._borradas
+
+    def __iter__(self):
+        return self.evaluaciones()
+
+    # --- Internos ---
+    @staticmethod
+    def _valores(evaluacion):
+        """Argumentos de agregar_fila para una evaluación de dominio."""
+        tipo = tipo_de(evaluacion)
+        base = (evaluacion.nombre, evaluacion.fecha, evaluacion.puntaje, tipo)
+        if tipo == "Examen":
+            return base + (evaluacion.duracion_min, evaluacion.num_preguntas, 0, None, 0)
+        if tipo == "Trabajo":
+            return base + (0, 0, evaluacion.num_paginas, evaluacion.tema, 0)
+        return base + (evaluacion.duracion_min, 0, 0, None, evaluacion.tamano_audiencia)
+
+    def _codificar_tema(self, tema):
+        if tema is None:
+            return SIN_TEMA
+        codigo = self._codigo_tema.get(tema)
+        if codigo is None:
+            codigo = self._codigo_tema[tema] = len(self._temas)
+            self._temas.append(tema)
+        return codigo
+
+    def _hacer_escribible(self):
+        # Columnas de solo lectura (ver desde_columnas): se copian antes de escribir en ellas
+        for columna in ('_puntaje', '_fecha', '_tipo', '_duracion', '_num_preguntas',
+                        '_num_paginas', '_tamano_audiencia', '_nombre', '_tema'):
+            arreglo = getattr(self, columna)
+            if not arreglo.flags.writeable:
+                setattr(self, columna, arreglo.copy())
+
+    def _crecer(self, capacidad):
+        for columna in ('_puntaje', '_fecha', '_tipo', '_duracion', '_num_preguntas',
+                        '_num_paginas', '_tamano_audiencia', '_nombre', '_tema', '_viva'):
+            anterior = getattr(self, columna)
+            nuevo = np.zeros(capacidad, dtype=anterior.dtype)
+            nuevo[:len(anterior)] = anterior
+            setattr(self, columna, nuevo)
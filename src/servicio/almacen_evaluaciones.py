@@ -0,0 +1,200 @@
+# src/servicio/almacen_evaluaciones.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+from itertools import count
+
+
+class AlmacenEvaluaciones:
+    """
+    Colección ordenada de evaluaciones en memoria con índice hash por nombre.
+    Mantiene el orden de inserción (como la lista anterior) y el EvaluacionID de cada
+    evaluación, de modo que buscar, reemplazar y eliminar por nombre cuesta O(1).
+    Los índices secundarios registrados reciben cada cambio para actualizarse de forma incremental.
+    """
+    def __init__(self):
+        self._secuencia = count()
+        self._filas = {}            # secuencia -> Evaluacion (el dict conserva el orden de inserción)
+        self._secuencia_por_nombre = {}  # nombre -> secuencia
+        self._ids = {}              # nombre -> EvaluacionID en la base de datos
+        self._indices = []          # índices secundarios sincronizados con cada mutación
+
+    def registrar_indice(self, indice):
+        """
+        Registra un índice secundario. Debe ofrecer agregar(secuencia, evaluacion),
+        eliminar(secuencia, evaluacion), reemplazar(secuencia, anterior, nueva) y limpiar().
+        Opcionalmente puede ofrecer agregar_varios(pares) y eliminar_varios(pares) con una
+        lista de (secuencia, evaluacion) para procesar un alta o un borrado masivo en una sola pasada.
+        """
+        self._indices.append(indice)
+        self._notificar_altas(indice, list(self._filas.items()))
+
+    def agregar(self, evaluacion, evaluacion_id=None):
+        """Agrega una evaluación al final. Levanta ValueError si el nombre ya existe."""
+        if evaluacion.nombre in self._secuencia_por_nombre:
+            raise ValueError(f"Ya existe una evaluación con el nombre '{evaluacion.nombre}' en memoria.")
+        secuencia = next(self._secuencia)
+        self._filas[secuencia] = evaluacion
+        self._secuencia_por_nombre[evaluacion.nombre] = secuencia
+        if evaluacion_id is not None:
+            self._ids[evaluacion.nombre] = evaluacion_id
+        for indice in self._indices:
+            indice.agregar(secuencia, evaluacion)
+
+    def agregar_varios(self, filas):
+        """
+        Agrega al final varias evaluaciones, dadas como pares (evaluacion, evaluacion_id), y
+        notifica a los índices una sola vez. Levanta ValueError (sin agregar ninguna) si algún
+        nombre ya existe o se repite en el lote.
+        """
+        filas = list(filas)
+        nuevos = set()
+        for evaluacion, _ in filas:
+            if evaluacion.nombre in self._secuencia_por_nombre or evaluacion.nombre in nuevos:
+                raise ValueError(f"Ya existe una evaluación con el nombre '{evaluacion.nombre}' en memoria.")
+            nuevos.add(evaluacion.nombre)
+        pares = []
+        for evaluacion, evaluacion_id in filas:
+            secuencia = next(self._secuencia)
+            self._filas[secuencia] = evaluacion
+            self._secuencia_por_nombre[evaluacion.nombre] = secuencia
+            if evaluacion_id is not None:
+                self._ids[evaluacion.nombre] = evaluacion_id
+            pares.append((secuencia, evaluacion))
+        if pares:
+            for indice in self._indices:
+                self._notificar_altas(indice, pares)
+
+    def eliminar(self, nombre):
+        """Quita la evaluación con ese nombre y la retorna, o None si no existe."""
+        secuencia = self._secuencia_por_nombre.pop(nombre, None)
+        if secuencia is None:
+            return None
+        self._ids.pop(nombre, None)
+        evaluacion = self._filas.pop(secuencia)
+        for indice in self._indices:
+            indice.eliminar(secuencia, evaluacion)
+        return evaluacion
+
+    def eliminar_varios(self, nombres):
+        """
+        Quita todas las evaluaciones indicadas y notifica a los índices una sola vez.
+        Retorna la lista de evaluaciones eliminadas (los nombres inexistentes se ignoran).
+        """
+        pares = []
+        for nombre in dict.fromkeys(nombres):
+            secuencia = self._secuencia_por_nombre.pop(nombre, None)
+            if secuencia is not None:
+                self._ids.pop(nombre, None)
+                pares.append((secuencia, self._filas.pop(secuencia)))
+        if pares:
+            for indice in self._indices:
+                eliminar_varios = getattr(indice, 'eliminar_varios', None)
+                if eliminar_varios is not None:
+                    eliminar_varios(pares)
+                else:
+                    for secuencia, evaluacion in pares:
+                        indice.eliminar(secuencia, evaluacion)
+        return [evaluacion for _, evaluacion in pares]
+
+    def reemplazar(self, nombre_original, evaluacion, evaluacion_id=None):
+        """
+        Sustituye la evaluación 'nombre_original' conservando su posición, aunque cambie el nombre.
+        Retorna la evaluación anterior, o None si no existía.
+        """
+        if evaluacion.nombre != nombre_original and evaluacion.nombre in self._secuencia_por_nombre:
+            raise ValueError(f"Ya existe una evaluación con el nombre '{evaluacion.nombre}' en memoria.")
+        secuencia = self._secuencia_por_nombre.pop(nombre_original, None)
+        if secuencia is None:
+            return None
+        anterior_id = self._ids.pop(nombre_original, None)
+        anterior = self._filas[secuencia]
+        self._filas[secuencia] = evaluacion
+        self._secuencia_por_nombre[evaluacion.nombre] = secuencia
+        evaluacion_id = evaluacion_id if evaluacion_id is not None else anterior_id
+        if evaluacion_id is not None:
+            self._ids[evaluacion.nombre] = evaluacion_id
+        for indice in self._indices:
+            indice.reemplazar(secuencia, anterior, evaluacion)
+        return anterior
+
+    def obtener(self, nombre):
+        secuencia = self._secuencia_por_nombre.get(nombre)
+        return None if secuencia is None else self._filas[secuencia]
+
+    def obtener_secuencia(self, nombre):
+        """Secuencia con la que los índices registrados conocen a esa evaluación, o None si no existe."""
+        return self._secuencia_por_nombre.get(nombre)
+
+    def obtener_id(self, nombre):
+        """EvaluacionID conocido para ese nombre, o None si no se ha cargado/guardado todavía."""
+        return self._ids.get(nombre)
+
+    def limpiar(self):
+        self._filas.clear()
+        self._secuencia_por_nombre.clear()
+        self._ids.clear()
+        for indice in self._indices:
+            indice.limpiar()
+
+    def __len__(self):
+        return len(self._filas)
+
+    @staticmethod
+    def _notificar_altas(indice, pares):
+        agregar_varios = getattr(indice, 'agregar_varios', None)
+        if agregar_varios is not None:
+            agregar_varios(pares)
+        else:
+            for secuencia, evaluacion in pares:
+                indice.agregar(secuencia, evaluacion)
+
+    def __iter__(self):
+        return iter(self._filas.values())
+
+    def __contains__(self, nombre):
+        return nombre in self._secuencia_por_nombre
+
+    def __bool__(self):
+        return bool(self._filas)
+
+
+# Benchmark: búsqueda y borrado por nombre con la lista anterior frente al almacén indexado.
+if __name__ == '__main__':
+    import random
+    import time
+    from datetime import date
+
+    from src.dominio.examen import Examen
+
+    N = 100_000
+    K = 1_000
+    evaluaciones = [Examen(f"Evaluacion {i}", date(2025, 1, 1), 50.0, 60, 10) for i in range(N)]
+    nombres = random.sample([e.nombre for e in evaluaciones], K)
+
+    lista = list(evaluaciones)
+    inicio = time.perf_counter()
+    for nombre in nombres:
+        next(e for e in lista if e.nombre == nombre)
+    t_lista_busqueda = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for nombre in nombres[:100]:
+        lista = [e for e in lista if e.nombre != nombre]
+    t_lista_borrado = (time.perf_counter() - inicio) * K / 100  # extrapolado a K borrados
+
+    almacen = AlmacenEvaluaciones()
+    for i, e in enumerate(evaluaciones):
+        almacen.agregar(e, i + 1)
+    inicio = time.perf_counter()
+    for nombre in nombres:
+        almacen.obtener(nombre)
+    t_almacen_busqueda = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for nombre in nombres:
+        almacen.eliminar(nombre)
+    t_almacen_borrado = time.perf_counter() - inicio
+
+    print(f"{K} búsquedas sobre {N} evaluaciones: lista {t_lista_busqueda * 1000:.1f} ms, "
+          f"almacén {t_almacen_busqueda * 1000:.3f} ms")
+    print(f"{K} borrados sobre {N} evaluaciones: lista ~{t_lista_borrado * 1000:.0f} ms, "
+          f"almacén {t_almacen_borrado * 1000:.3f} ms")
@@ -0,0 +1,179 @@
+# src/servicio/archivo_parquet.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import os
+
+from src.dominio.examen import Examen
+from src.dominio.presentacion import Presentacion
+from src.dominio.trabajo import Trabajo
+from src.servicio.indices_evaluaciones import normalizar_tipo, tipo_de
+
+try:
+    import pyarrow as pa  # Opcional: solo se necesita para las tablas Arrow y los archivos Parquet
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = ds = pq = None
+
+EXTENSION = '.parquet'
+
+# Columnas de la tabla: las de Evaluaciones y, como en el LEFT JOIN de SQL_PAGINA_EVALUACIONES,
+# las de cada subtipo con el prefijo de su tipo (nulas en las filas de los otros tipos)
+COLUMNAS = ('evaluacion_id', 'nombre', 'fecha', 'puntaje', 'tipo',
+            'examen_duracion_min', 'examen_num_preguntas',
+            'trabajo_num_paginas', 'trabajo_tema',
+            'presentacion_duracion_min', 'presentacion_tamano_audiencia')
+
+
+def _requerir_pyarrow():
+    if pa is None:
+        raise ValueError("Las tablas Arrow y los archivos Parquet requieren el paquete 'pyarrow' (pip install pyarrow).")
+
+
+def es_parquet(ruta):
+    return os.path.splitext(ruta)[1].lower() == EXTENSION
+
+
+def esquema_arrow():
+    _requerir_pyarrow()
+    return pa.schema([
+        ('evaluacion_id', pa.int64()),  # nulo si la evaluación aún no se guardó en la base de datos
+        ('nombre', pa.string()),
+        ('fecha', pa.date32()),
+        ('puntaje', pa.float64()),
+        ('tipo', pa.string()),  # Parquet lo guarda con codificación por diccionario
+        ('examen_duracion_min', pa.int32()),
+        ('examen_num_preguntas', pa.int32()),
+        ('trabajo_num_paginas', pa.int32()),
+        ('trabajo_tema', pa.string()),
+        ('presentacion_duracion_min', pa.int32()),
+        ('presentacion_tamano_audiencia', pa.int32()),
+    ])
+
+
+def lotes_arrow(evaluaciones, tamano_lote=100_000):
+    """
+    Genera RecordBatch de hasta 'tamano_lote' filas a partir de las evaluaciones (p. ej. el
+    almacén del gestor, que además aporta el EvaluacionID de cada una con obtener_id()).
+    Solo se arman en memoria las columnas del lote en curso.
+    """
+    esquema = esquema_arrow()
+    obtener_id = getattr(evaluaciones, 'obtener_id', None)
+    columnas = {columna: [] for columna in COLUMNAS}
+
+    def lote():
+        arreglos = [pa.array(columnas[campo.name], type=campo.type) for campo in esquema]
+        for valores in columnas.values():
+            valores.clear()
+        return pa.RecordBatch.from_arrays(arreglos, schema=esquema)
+
+    for evaluacion in evaluaciones:
+        tipo = tipo_de(evaluacion)
+        es_examen, es_trabajo, es_presentacion = tipo == "Examen", tipo == "Trabajo", tipo == "Presentacion"
+        columnas['evaluacion_id'].append(obtener_id(evaluacion.nombre) if obtener_id else None)
+        columnas['nombre'].append(evaluacion.nombre)
+        columnas['fecha'].append(evaluacion.fecha)
+        columnas['puntaje'].append(float(evaluacion.puntaje))
+        columnas['tipo'].append(tipo)
+        columnas['examen_duracion_min'].append(evaluacion.duracion_min if es_examen else None)
+        columnas['examen_num_preguntas'].append(evaluacion.num_preguntas if es_examen else None)
+        columnas['trabajo_num_paginas'].append(evaluacion.num_paginas if es_trabajo else None)
+        columnas['trabajo_tema'].append(evaluacion.tema if es_trabajo else None)
+        columnas['presentacion_duracion_min'].append(evaluacion.duracion_min if es_presentacion else None)
+        columnas['presentacion_tamano_audiencia'].append(evaluacion.tamano_audiencia if es_presentacion else None)
+        if len(columnas['nombre']) >= tamano_lote:
+            yield lote()
+    if columnas['nombre']:
+        yield lote()
+
+
+def tabla_arrow(evaluaciones, tamano_lote=100_000):
+    """Tabla Arrow con todas las evaluaciones (una fila por evaluación, subtipos nulos donde no aplican)."""
+    return pa.Table.from_batches(list(lotes_arrow(evaluaciones, tamano_lote)), schema=esquema_arrow())
+
+
+def guardar_parquet(evaluaciones, ruta, tamano_grupo=100_000, compresion='zstd', progreso=None, cancelado=None):
+    """
+    Escribe las evaluaciones en un archivo Parquet, un grupo de filas por cada 'tamano_grupo'
+    evaluaciones, sin tener nunca más de un grupo en memoria. Como la exportación JSON, escribe
+    junto al destino y solo lo reemplaza al terminar; progreso(escritas, totales) y cancelado()
+    se usan igual que en ExportadorEvaluaciones. Retorna el mismo resumen que este.
+    """
+    _requerir_pyarrow()
+    totales = len(evaluaciones) if hasattr(evaluaciones, '__len__') else None
+    resumen = {'exportadas': 0, 'cancelada': False}
+    temporal = ruta + '.tmp'
+    try:
+        with pq.ParquetWriter(temporal, esquema_arrow(), compression=compresion) as escritor:
+            for lote in lotes_arrow(evaluaciones, tamano_grupo):
+                if cancelado and cancelado():
+                    resumen['cancelada'] = True
+                    break
+                escritor.write_table(pa.Table.from_batches([lote]), row_group_size=tamano_grupo)
+                resumen['exportadas'] += lote.num_rows
+                if progreso:
+                    progreso(resumen['exportadas'], totales)
+        if resumen['cancelada']:
+            os.remove(temporal)
+        else:
+            os.replace(temporal, ruta)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+    return resumen
+
+
+def filtro_evaluaciones(tipo=None, desde=None, hasta=None):
+    """
+    Expresión de filtro con los mismos criterios que GestorEvaluaciones.filtrar (tipo y rango de
+    fechas inclusivo), o None si no hay ninguno. Parquet descarta con ella los grupos de filas
+    cuyas estadísticas (mínimo y máximo de cada columna) no pueden cumplirla, sin leerlos.
+    """
+    _requerir_pyarrow()
+    condiciones = []
+    if tipo is not None and tipo != "Todos":
+        condiciones.append(ds.field('tipo') == normalizar_tipo(tipo))
+    if desde is not None:
+        condiciones.append(ds.field('fecha') >= pa.scalar(desde, type=pa.date32()))
+    if hasta is not None:
+        condiciones.append(ds.field('fecha') <= pa.scalar(hasta, type=pa.date32()))
+    filtro = None
+    for condicion in condiciones:
+        filtro = condicion if filtro is None else filtro & condicion
+    return filtro
+
+
+def filas_parquet(ruta):
+    """Número de filas del archivo según sus metadatos, sin leer los datos."""
+    _requerir_pyarrow()
+    return pq.ParquetFile(ruta).metadata.num_rows
+
+
+def iterar_lotes_parquet(ruta, filtro=None, tamano_lote=100_000):
+    """
+    Lee el archivo por lotes de hasta 'tamano_lote' filas, aplicando 'filtro' (ver
+    filtro_evaluaciones) sobre los grupos de filas antes de leerlos. Genera listas de
+    diccionarios fila, uno por evaluación, con las claves de COLUMNAS.
+    """
+    _requerir_pyarrow()
+    dataset = ds.dataset(ruta, format='parquet')
+    for lote in dataset.to_batches(columns=list(COLUMNAS), filter=filtro, batch_size=tamano_lote):
+        yield lote.to_pylist()
+
+
+def evaluacion_desde_fila(fila):
+    """
+    Construye la evaluación de una fila leída del archivo. Levanta ValueError/TypeError si los
+    datos no superan las validaciones del dominio.
+    """
+    tipo = fila['tipo']
+    if tipo == "Examen":
+        return Examen(fila['nombre'], fila['fecha'], fila['puntaje'],
+                      fila['examen_duracion_min'], fila['examen_num_preguntas'])
+    if tipo == "Trabajo":
+        return Trabajo(fila['nombre'], fila['fecha'], fila['puntaje'],
+                       fila['trabajo_num_paginas'], fila['trabajo_tema'])
+    if tipo == "Presentacion":
+        return Presentacion(fila['nombre'], fila['fecha'], fila['puntaje'],
+                            fila['presentacion_duracion_min'], fila['presentacion_tamano_audiencia'])
+    raise ValueError(f"Tipo de evaluación desconocido '{tipo}'.")
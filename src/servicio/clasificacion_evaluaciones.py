@@ -0,0 +1,134 @@
+# src/servicio/clasificacion_evaluaciones.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import heapq
+from itertools import count
+
+from src.dominio.calculo_notas import calcular_notas
+
+try:
+    import numpy as np  # Opcional: sin NumPy se clasifica con un montículo sobre calcular_nota()
+except ImportError:
+    np = None
+
+
+def _primeras(claves, k):
+    """
+    Posiciones de las k claves más pequeñas, de menor a mayor y, a igualdad, en orden de posición.
+    argpartition elige el umbral en O(n); solo se ordenan las candidatas (las k más los empates).
+    """
+    if k < len(claves):
+        umbral = np.partition(claves, k - 1)[k - 1]
+        candidatas = np.flatnonzero(claves <= umbral)
+    else:
+        candidatas = np.arange(len(claves))
+    return candidatas[np.argsort(claves[candidatas], kind='stable')][:k]
+
+
+def mejores(evaluaciones, k):
+    """
+    Las k evaluaciones de nota más alta, de mayor a menor; a igualdad de nota, en el orden
+    recibido. Las notas se calculan en lote con calcular_notas(); sin NumPy, un montículo de
+    tamaño k las elige en una pasada, O(n log k), sin ordenar las n.
+    """
+    if np is None:
+        return heapq.nlargest(k, evaluaciones, key=lambda e: e.calcular_nota())
+    evaluaciones = list(evaluaciones)
+    k = min(max(k, 0), len(evaluaciones))
+    if not k:
+        return []
+    return [evaluaciones[i] for i in _primeras(-calcular_notas(evaluaciones), k)]
+
+
+def peores(evaluaciones, k):
+    """
+    Las k evaluaciones de nota más baja, de menor a mayor: el final de la clasificación de
+    mejores() recorrido al revés (a igualdad de nota, la última recibida primero).
+    """
+    if np is None:
+        posicion = count()
+        return [e for _, _, e in heapq.nsmallest(k, ((e.calcular_nota(), -next(posicion), e) for e in evaluaciones))]
+    evaluaciones = list(evaluaciones)
+    k = min(max(k, 0), len(evaluaciones))
+    if not k:
+        return []
+    # Sobre las notas invertidas, el orden de posición pone primero a la última recibida
+    ultima = len(evaluaciones) - 1
+    return [evaluaciones[ultima - i] for i in _primeras(calcular_notas(evaluaciones)[::-1], k)]
+
+
+# Benchmark: clasificaciones con sorted() frente a las notas en lote (consulta única) y a las notas
+# ordenadas que AgregadosEvaluaciones mantiene con cada cambio (consultas repetidas).
+if __name__ == '__main__':
+    import random
+    import time
+    from datetime import date
+
+    from src.dominio.examen import Examen
+    from src.dominio.presentacion import Presentacion
+    from src.dominio.trabajo import Trabajo
+    from src.servicio.agregados_evaluaciones import AgregadosEvaluaciones
+    from src.servicio.almacen_evaluaciones import AlmacenEvaluaciones
+
+    def evaluacion_aleatoria(rnd, nombre):
+        puntaje = rnd.choice([100.0, 50.0, round(rnd.uniform(0, 100), 1)])  # con empates
+        tipo = rnd.randrange(3)
+        if tipo == 0:
+            return Examen(nombre, date(2025, 1, 1), puntaje, rnd.randint(15, 300), rnd.randint(1, 100))
+        if tipo == 1:
+            return Trabajo(nombre, date(2025, 1, 1), puntaje, rnd.randint(1, 100), f"Tema {nombre}")
+        return Presentacion(nombre, date(2025, 1, 1), puntaje, rnd.randint(5, 60), rnd.randint(1, 1000))
+
+    # Corrección: las tres vías dan la misma clasificación, empates incluidos
+    rnd = random.Random(7)
+    almacen = AlmacenEvaluaciones()
+    agregados = AgregadosEvaluaciones()
+    almacen.registrar_indice(agregados)
+    for i in range(5000):
+        almacen.agregar(evaluacion_aleatoria(rnd, f"E{i}"))
+    for nombre in rnd.sample([f"E{i}" for i in range(5000)], 500):
+        almacen.eliminar(nombre)
+    lista = list(almacen)
+    ordenadas = sorted(lista, key=lambda e: e.calcular_nota(), reverse=True)
+    for k in (0, 1, 10, 1000, len(lista) + 5):
+        assert mejores(lista, k) == agregados.mejores(k) == ordenadas[:k]
+        assert peores(lista, k) == agregados.peores(k) == ordenadas[::-1][:k]
+    for posicion, evaluacion in enumerate(ordenadas[:300], 1):
+        assert agregados.posicion(almacen.obtener_secuencia(evaluacion.nombre)) == posicion
+    notas = sorted(e.calcular_nota() for e in lista)
+    for p in (0, 10, 25, 50, 90, 99, 100):
+        posicion = (len(notas) - 1) * p / 100
+        inferior = int(posicion)
+        esperado = notas[inferior] + (notas[min(inferior + 1, len(notas) - 1)] - notas[inferior]) * (posicion - inferior)
+        assert abs(agregados.percentil(p) - esperado) < 1e-9, p
+    print("Notas en lote, agregados incrementales y sorted() coinciden.")
+
+    N = 1_000_000
+    K = 10
+    CONSULTAS = 1000
+    rnd = random.Random(1)
+    almacen = AlmacenEvaluaciones()
+    agregados = AgregadosEvaluaciones()
+    almacen.registrar_indice(agregados)
+    for i in range(N):
+        almacen.agregar(evaluacion_aleatoria(rnd, f"E{i}"))
+    lista = list(almacen)
+
+    inicio = time.perf_counter()
+    sorted(lista, key=lambda e: e.calcular_nota(), reverse=True)[:K]
+    t_sorted = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    mejores(lista, K)
+    t_lote = time.perf_counter() - inicio
+    print(f"Top {K} de {N} evaluaciones, consulta única: sorted() {t_sorted * 1000:.0f} ms, "
+          f"notas en lote {t_lote * 1000:.0f} ms")
+
+    # Consultas repetidas con la colección cambiando entre ellas (un cambio por consulta)
+    inicio = time.perf_counter()
+    for i in range(CONSULTAS):
+        almacen.reemplazar(f"E{i}", evaluacion_aleatoria(rnd, f"E{i}"))
+        agregados.mejores(K)
+        agregados.posicion(i)
+        agregados.percentil(90)
+    t_incremental = time.perf_counter() - inicio
+    print(f"{CONSULTAS} cambios + top {K}, puesto y percentil 90: agregados incrementales "
+          f"{t_incremental * 1000:.0f} ms en total; con sorted() serían ~{t_sorted * CONSULTAS:.0f} s")
@@ -0,0 +1,349 @@
+# src/servicio/escritura_diferida.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import json
+import os
+import threading
+import time
+
+from src.servicio.importador_json import evaluacion_a_dict, evaluacion_desde_dict
+
+
+class DiarioEscrituras:
+    """
+    Diario local de operaciones pendientes (una línea JSON por operación, con fsync tras cada
+    una). Mientras se envía un lote, sus líneas se apartan en '<ruta>.enviando' y las nuevas
+    siguen entrando en '<ruta>'; el segmento apartado se borra cuando la base de datos confirma.
+    Las operaciones que la base de datos rechaza se conservan en '<ruta>.rechazadas'.
+    """
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self.ruta_enviando = ruta + '.enviando'
+        self.ruta_rechazadas = ruta + '.rechazadas'
+        self._archivo = open(self.ruta, 'a', encoding='utf-8')
+
+    def registrar(self, operacion):
+        self._archivo.write(json.dumps(operacion, ensure_ascii=False) + '\n')
+        self._archivo.flush()
+        os.fsync(self._archivo.fileno())
+
+    def leer(self):
+        """Operaciones registradas y no confirmadas, en orden (primero el segmento en envío)."""
+        operaciones = []
+        for ruta in (self.ruta_enviando, self.ruta):
+            operaciones.extend(self._leer_lineas(ruta))
+        return operaciones
+
+    def registrar_rechazadas(self, rechazadas):
+        """Añade operaciones rechazadas (con su 'error') a '<ruta>.rechazadas'."""
+        with open(self.ruta_rechazadas, 'a', encoding='utf-8') as archivo:
+            for rechazada in rechazadas:
+                archivo.write(json.dumps(rechazada, ensure_ascii=False) + '\n')
+            archivo.flush()
+            os.fsync(archivo.fileno())
+
+    def leer_rechazadas(self):
+        return self._leer_lineas(self.ruta_rechazadas)
+
+    def descartar_rechazadas(self):
+        if os.path.exists(self.ruta_rechazadas):
+            os.remove(self.ruta_rechazadas)
+
+    @staticmethod
+    def _leer_lineas(ruta):
+        operaciones = []
+        if not os.path.exists(ruta):
+            return operaciones
+        with open(ruta, encoding='utf-8') as archivo:
+            for linea in archivo:
+                try:
+                    operaciones.append(json.loads(linea))
+                except json.JSONDecodeError:
+                    # Última línea a medio escribir por una caída: nunca se confirmó al usuario
+                    break
+        return operaciones
+
+    def apartar(self):
+        """Aparta las operaciones actuales como segmento en envío y empieza un diario vacío."""
+        self._archivo.close()
+        if os.path.exists(self.ruta_enviando):
+            self._unir(self.ruta_enviando, self.ruta)  # Un envío anterior falló: se reenvía entero
+        else:
+            os.replace(self.ruta, self.ruta_enviando)
+        self._archivo = open(self.ruta, 'a', encoding='utf-8')
+
+    def confirmar(self):
+        """La base de datos confirmó el segmento apartado: ya no hace falta conservarlo."""
+        if os.path.exists(self.ruta_enviando):
+            os.remove(self.ruta_enviando)
+
+    def cerrar(self):
+        self._archivo.close()
+
+    @staticmethod
+    def _unir(destino, origen):
+        with open(origen, encoding='utf-8') as entrada, open(destino, 'a', encoding='utf-8') as salida:
+            salida.write(entrada.read())
+            salida.flush()
+            os.fsync(salida.fileno())
+        os.remove(origen)
+
+
+def agrupar_operaciones(operaciones):
+    """
+    Reduce una secuencia de operaciones a lo mínimo que hay que enviar:
+    - eliminaciones: nombres (tal como están en la base de datos) a borrar;
+    - actualizaciones: {nombre actual: (nombre en la base de datos, evaluacion)};
+    - altas: {nombre: evaluacion} que aún no existen en la base de datos.
+    Por ejemplo, alta + cambio = alta con los datos finales, alta + baja = nada,
+    y baja + alta del mismo nombre = actualización.
+    """
+    eliminaciones = set()
+    cambios = {}  # nombre actual -> (nombre en la DB o None si es un alta, evaluacion)
+    for operacion in operaciones:
+        tipo = operacion['op']
+        if tipo == 'agregar':
+            evaluacion = evaluacion_desde_dict(operacion['evaluacion'])
+            if evaluacion.nombre in eliminaciones:
+                eliminaciones.discard(evaluacion.nombre)
+                cambios[evaluacion.nombre] = (evaluacion.nombre, evaluacion)
+            else:
+                cambios[evaluacion.nombre] = (None, evaluacion)
+        elif tipo == 'actualizar':
+            evaluacion = evaluacion_desde_dict(operacion['evaluacion'])
+            previo = cambios.pop(operacion['nombre_original'], None)
+            origen = operacion['nombre_original'] if previo is None else previo[0]
+            cambios[evaluacion.nombre] = (origen, evaluacion)
+        elif tipo == 'eliminar':
+            previo = cambios.pop(operacion['nombre'], None)
+            if previo is None:
+                eliminaciones.add(operacion['nombre'])
+            elif previo[0] is not None:
+                eliminaciones.add(previo[0])
+
+    actualizaciones = {nombre: par for nombre, par in cambios.items() if par[0] is not None}
+    altas = {nombre: par[1] for nombre, par in cambios.items() if par[0] is None}
+    return eliminaciones, actualizaciones, altas
+
+
+def _rechazo(operacion, error):
+    """Operación rechazada por la base de datos, con el motivo, tal como se guarda en el diario."""
+    return dict(operacion, error=str(error))
+
+
+def _mismos_datos(guardada, evaluacion):
+    """True si 'guardada' (leída de la base de datos) tiene los datos de 'evaluacion'."""
+    if guardada is None:
+        return False
+    a, b = evaluacion_a_dict(guardada), evaluacion_a_dict(evaluacion)
+    # Puntaje es DECIMAL(5,2) en SQL Server: se compara con los decimales que guarda la columna
+    a['puntaje'], b['puntaje'] = round(a['puntaje'], 2), round(b['puntaje'], 2)
+    return a == b
+
+
+class EscrituraDiferida:
+    """
+    Escritura diferida (write-behind) hacia la base de datos. Cada operación se anota en el diario
+    local y se devuelve el control de inmediato; un hilo de fondo agrupa las pendientes y las
+    envía por lotes cuando se acumulan 'tamano_lote' o pasan 'intervalo' segundos.
+    Si el envío falla por la conexión (o cualquier error que no sea un rechazo de los datos), las
+    operaciones se conservan y se reintentan en el siguiente ciclo. Las que la base de datos rechaza
+    (ValueError: nombre o tema ya usados por otro cliente, restricciones) no se reintentan: se
+    apartan en el diario de rechazadas, se avisa con al_rechazar(rechazadas) desde el hilo de fondo
+    y el resto del lote sigue su curso. Cada rechazada es la operación del diario más su 'error'.
+    """
+    def __init__(self, dao, ruta_diario, tamano_lote=500, intervalo=2.0, al_rechazar=None):
+        self.dao = dao
+        self.tamano_lote = tamano_lote
+        self.intervalo = intervalo
+        self.al_rechazar = al_rechazar
+        self._diario = DiarioEscrituras(ruta_diario)
+        self._condicion = threading.Condition()
+        # Operaciones de una caída anterior: se envían en el primer ciclo
+        self._operaciones = self._diario.leer()
+        self._registradas = len(self._operaciones)
+        self._confirmadas = 0  # Enviadas con éxito o apartadas como rechazadas
+        self._rechazadas = self._diario.leer_rechazadas()
+        self._rechazadas_nuevas = []  # Aún no atendidas (ver tomar_rechazadas)
+        self._ultimo_error = None
+        self._vaciar_ya = False
+        self._detenido = False
+        self._hilo = threading.Thread(target=self._ciclo, name="EscrituraDiferida", daemon=True)
+        self._hilo.start()
+
+    @property
+    def pendientes(self):
+        with self._condicion:
+            return self._registradas - self._confirmadas
+
+    def rechazadas(self):
+        """Todas las operaciones rechazadas que conserva el diario, con su 'error'."""
+        with self._condicion:
+            return list(self._rechazadas)
+
+    def tomar_rechazadas(self):
+        """Retorna las rechazadas desde la última llamada, para corregir la memoria una sola vez."""
+        with self._condicion:
+            nuevas, self._rechazadas_nuevas = self._rechazadas_nuevas, []
+            return nuevas
+
+    def descartar_rechazadas(self):
+        """Vacía el diario de rechazadas (p. ej. cuando el usuario ya las revisó)."""
+        with self._condicion:
+            self._diario.descartar_rechazadas()
+            self._rechazadas = []
+
+    # --- Registro de operaciones (cualquier hilo) ---
+    def agregar(self, evaluacion):
+        self._registrar({'op': 'agregar', 'evaluacion': evaluacion_a_dict(evaluacion)})
+
+    def actualizar(self, nombre_original, evaluacion):
+        self._registrar({'op': 'actualizar', 'nombre_original': nombre_original,
+                         'evaluacion': evaluacion_a_dict(evaluacion)})
+
+    def eliminar(self, nombre):
+        self._registrar({'op': 'eliminar', 'nombre': nombre})
+
+    def _registrar(self, operacion):
+        with self._condicion:
+            if self._detenido:
+                raise Exception("La escritura diferida está detenida.")
+            self._diario.registrar(operacion)
+            self._operaciones.append(operacion)
+            self._registradas += 1
+            if len(self._operaciones) >= self.tamano_lote:
+                self._condicion.notify_all()
+
+    # --- Barrera y cierre ---
+    def flush(self, timeout=None):
+        """
+        Espera a que todas las operaciones registradas hasta ahora estén confirmadas en la
+        base de datos o apartadas como rechazadas. Retorna False si el envío falla (p. ej. sin
+        conexión) o se agota el tiempo.
+        """
+        limite = None if timeout is None else time.monotonic() + timeout
+        with self._condicion:
+            objetivo = self._registradas
+            errores_previos = self._ultimo_error
+            self._vaciar_ya = True
+            self._condicion.notify_all()
+            while self._confirmadas < objetivo:
+                if self._ultimo_error is not errores_previos:
+                    print(f"Error al enviar las escrituras pendientes: {self._ultimo_error}")
+                    return False
+                restante = None if limite is None else limite - time.monotonic()
+                if restante is not None and restante <= 0:
+                    return False
+                self._condicion.wait(restante)
+        return True
+
+    def cerrar(self, timeout=None):
+        """Envía lo pendiente y detiene el hilo de fondo. Retorna True si no quedó nada sin confirmar."""
+        vaciado = self.flush(timeout)
+        with self._condicion:
+            self._detenido = True
+            self._condicion.notify_all()
+        self._hilo.join(timeout)
+        self._diario.cerrar()
+        return vaciado
+
+    # --- Hilo de fondo ---
+    def _ciclo(self):
+        while True:
+            with self._condicion:
+                self._condicion.wait_for(
+                    lambda: self._detenido or self._vaciar_ya or len(self._operaciones) >= self.tamano_lote,
+                    timeout=self.intervalo)
+                if self._detenido:
+                    return
+                self._vaciar_ya = False
+                if not self._operaciones:
+                    continue
+                lote, self._operaciones = self._operaciones, []
+                self._diario.apartar()
+
+            try:
+                rechazadas = self._enviar(lote)
+            except Exception as e:
+                with self._condicion:
+                    # Se conservan delante de las llegadas durante el envío para reintentarlas
+                    self._operaciones = lote + self._operaciones
+                    self._ultimo_error = e
+                    self._condicion.notify_all()
+                print(f"Error al enviar el lote de escrituras diferidas (se reintentará): {e}")
+                time.sleep(self.intervalo)  # Espera antes de reintentar
+                continue
+
+            if rechazadas:
+                self._apartar_rechazadas(rechazadas)
+            with self._condicion:
+                self._diario.confirmar()
+                self._confirmadas += len(lote)
+                self._condicion.notify_all()
+
+    def _apartar_rechazadas(self, rechazadas):
+        # Antes de confirmar el lote, así que flush() retorna con el aviso ya dado; tras una caída
+        # en este punto el reenvío del segmento las rechaza otra vez
+        with self._condicion:
+            self._diario.registrar_rechazadas(rechazadas)
+            self._rechazadas.extend(rechazadas)
+            self._rechazadas_nuevas.extend(rechazadas)
+        print(f"La base de datos rechazó {len(rechazadas)} escrituras diferidas; se apartaron en "
+              f"'{self._diario.ruta_rechazadas}'.")
+        if self.al_rechazar is not None:
+            try:
+                self.al_rechazar(rechazadas)
+            except Exception as e:
+                print(f"Error al avisar de las escrituras rechazadas: {e}")
+
+    def _enviar(self, lote):
+        """
+        Envía un lote y retorna las operaciones rechazadas. Los errores que no son un rechazo de
+        los datos (ValueError) se propagan para reintentar el lote completo.
+        """
+        eliminaciones, actualizaciones, altas = agrupar_operaciones(lote)
+        try:
+            # Primero bajas, luego cambios y al final altas, para que un nombre liberado pueda reutilizarse
+            if eliminaciones:
+                self.dao.eliminar_evaluaciones_lote(eliminaciones)
+            if actualizaciones:
+                self.dao.actualizar_evaluaciones_lote(actualizaciones.values())
+            return self._guardar_altas(list(altas.values())) if altas else []
+        except ValueError as e:
+            print(f"La base de datos rechazó el lote de escrituras diferidas ({e}); se envían una a una.")
+
+        # Cada paso es una transacción y reaplicarlo es inocuo: se repite todo, operación por operación,
+        # para apartar solo las rechazadas
+        rechazadas = []
+        if eliminaciones:
+            try:
+                self.dao.eliminar_evaluaciones_lote(eliminaciones)
+            except ValueError as e:
+                rechazadas.extend(_rechazo({'op': 'eliminar', 'nombre': nombre}, e) for nombre in eliminaciones)
+        for nombre_original, evaluacion in actualizaciones.values():
+            try:
+                self.dao.actualizar_evaluaciones_lote([(nombre_original, evaluacion)])
+            except ValueError as e:
+                rechazadas.append(_rechazo({'op': 'actualizar', 'nombre_original': nombre_original,
+                                            'evaluacion': evaluacion_a_dict(evaluacion)}, e))
+        for evaluacion in altas.values():
+            try:
+                rechazadas.extend(self._guardar_altas([evaluacion]))
+            except ValueError as e:
+                rechazadas.append(_rechazo({'op': 'agregar', 'evaluacion': evaluacion_a_dict(evaluacion)}, e))
+        return rechazadas
+
+    def _guardar_altas(self, altas):
+        """
+        Inserta las altas y retorna las rechazadas. Un reenvío tras una caída puede encontrar
+        altas ya confirmadas, así que las de nombre existente se omiten; si la fila existente
+        tiene otros datos, la escribió otro cliente con ese nombre y el alta se rechaza.
+        """
+        ids = self.dao.guardar_evaluaciones_lote(altas, omitir_existentes=True)
+        omitidas = [evaluacion for evaluacion in altas if evaluacion.nombre not in ids]
+        if not omitidas:
+            return []
+        existentes = self.dao.leer_evaluaciones_por_nombre(evaluacion.nombre for evaluacion in omitidas)
+        return [_rechazo({'op': 'agregar', 'evaluacion': evaluacion_a_dict(evaluacion)},
+                         f"Ya existe otra evaluación con el nombre '{evaluacion.nombre}'.")
+                for evaluacion in omitidas
+                if not _mismos_datos(existentes.get(evaluacion.nombre, (None, None))[1], evaluacion)]
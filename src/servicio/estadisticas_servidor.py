@@ -0,0 +1,158 @@
+# src/servicio/estadisticas_servidor.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import threading
+
+from src.servicio.indices_evaluaciones import TIPOS_EVALUACION
+
+
+class EstadisticasServidor:
+    """
+    Estadísticas del panel calculadas por la base de datos (ver BackendEvaluaciones.leer_estadisticas),
+    para cuando las evaluaciones no están todas en memoria. Cada nota sale de la misma fórmula que
+    calcular_nota() y del mismo puntaje (en memoria se redondea a centésimas, como la columna
+    DECIMAL(5,2)), así que cantidades, mejores y notas coinciden con AgregadosEvaluaciones; los
+    promedios difieren como mucho en el redondeo de la suma en el servidor.
+
+    El último resultado se conserva hasta que el gestor llama a invalidar() (al conectar y tras cada
+    alta, cambio o baja que hace en la base de datos): las páginas que se van cargando son filas que
+    ya estaban contadas, así que durante la carga el panel se refresca sin volver a consultar.
+    Las consultas se hacen desde un hilo de lectura mientras el de escrituras invalida: un resultado
+    leído antes de una invalidación se entrega, pero no se conserva.
+    """
+    def __init__(self, dao):
+        self.dao = dao
+        self._candado = threading.Lock()
+        self._version = 0      # aumenta con cada invalidar()
+        self._por_tipo = None  # último resultado de leer_estadisticas()
+        self._mejor = None     # (EvaluacionID, evaluacion) leída para obtener_mejor_evaluacion()
+
+    def invalidar(self):
+        """Descarta el último resultado: la próxima consulta vuelve a leer la base de datos."""
+        with self._candado:
+            self._version += 1
+            self._por_tipo = None
+            self._mejor = None
+
+    # --- Consultas (mismos formatos que GestorEvaluaciones) ---
+    def _leer(self):
+        with self._candado:
+            por_tipo, version = self._por_tipo, self._version
+        if por_tipo is None:
+            por_tipo = self.dao.leer_estadisticas()
+            with self._candado:
+                if version == self._version:
+                    self._por_tipo = por_tipo
+        return por_tipo
+
+    def total_evaluaciones(self):
+        return sum(cantidad for cantidad, *_ in self._leer().values())
+
+    def calcular_promedio_general(self):
+        por_tipo = self._leer()
+        cantidad = sum(fila[0] for fila in por_tipo.values())
+        return sum(fila[1] for fila in por_tipo.values()) / cantidad if cantidad else 0.0
+
+    def obtener_mejor_evaluacion(self):
+        por_tipo = self._leer()
+        if not por_tipo:
+            return None
+        # Nota más alta; a igualdad, el menor EvaluacionID (el que se cargó antes en memoria)
+        _, _, mejor_id, _, _ = max(por_tipo.values(), key=lambda fila: (fila[4], -fila[2]))
+        with self._candado:
+            mejor, version = self._mejor, self._version
+        if mejor is None or mejor[0] != mejor_id:
+            mejor = (mejor_id, self.dao.obtener_evaluacion_bd(mejor_id))
+            with self._candado:
+                if version == self._version:
+                    self._mejor = mejor
+        return mejor[1]
+
+    def obtener_estadisticas_por_tipo(self):
+        por_tipo = self._leer()
+        stats = {}
+        for tipo in TIPOS_EVALUACION:
+            if tipo in por_tipo:
+                cantidad, suma, _, mejor_nombre, mejor_nota = por_tipo[tipo]
+                stats[tipo] = {
+                    'count': cantidad,
+                    'promedio': suma / cantidad,
+                    'best_name': mejor_nombre,
+                    'best_score': mejor_nota
+                }
+            else:
+                stats[tipo] = {
+                    'count': 0,
+                    'promedio': 0.0,
+                    'best_name': "N/A",
+                    'best_score': 0.0
+                }
+        return stats
+
+
+# Comprobación sobre SQLite: con puntajes de cualquier precisión, las estadísticas del servidor
+# coinciden con las que AgregadosEvaluaciones calcula de las evaluaciones en memoria. Cantidades,
+# mejores y notas son idénticas; el promedio del servidor solo acumula el error de su suma en
+# float, como mucho del orden de cantidad * epsilon relativo.
+if __name__ == '__main__':
+    import os
+    import random
+    import sys
+    import tempfile
+    from datetime import date
+
+    from src.datos.backend_evaluaciones import crear_backend
+    from src.dominio.examen import Examen
+    from src.dominio.presentacion import Presentacion
+    from src.dominio.trabajo import Trabajo
+    from src.servicio.agregados_evaluaciones import AgregadosEvaluaciones
+    from src.servicio.almacen_evaluaciones import AlmacenEvaluaciones
+
+    rnd = random.Random(20)
+    evaluaciones = []
+    for i in range(20_000):
+        # Sin redondear, con empates y con los casos de mitad exacta (múltiplos de 1/8)
+        puntaje = rnd.choice([rnd.uniform(0, 100), rnd.randrange(801) / 8, 100.0, 50.0])
+        fecha = date(2025, rnd.randint(1, 12), rnd.randint(1, 28))
+        tipo = rnd.randrange(3)
+        if tipo == 0:
+            evaluaciones.append(Examen(f"E{i}", fecha, puntaje, rnd.randint(15, 300), rnd.randint(1, 100)))
+        elif tipo == 1:
+            evaluaciones.append(Trabajo(f"E{i}", fecha, puntaje, rnd.randint(1, 100), f"Tema {i}"))
+        else:
+            evaluaciones.append(Presentacion(f"E{i}", fecha, puntaje, rnd.randint(5, 60), rnd.randint(1, 1000)))
+
+    # En memoria el puntaje ya está en centésimas: el valor que guarda Puntaje DECIMAL(5,2)
+    assert all(e.puntaje == round(e.puntaje, 2) for e in evaluaciones)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        dao = crear_backend('sqlite', ruta=os.path.join(directorio, 'evaluaciones.sqlite3'))
+        try:
+            ids = dao.guardar_evaluaciones_lote(evaluaciones)
+            # Las mismas evaluaciones que el gestor deja en memoria tras guardarlas
+            almacen = AlmacenEvaluaciones()
+            agregados = AgregadosEvaluaciones()
+            almacen.registrar_indice(agregados)
+            almacen.agregar_varios((e, ids[e.nombre]) for e in evaluaciones)
+            servidor = EstadisticasServidor(dao)
+
+            def mismo_promedio(en_servidor, en_memoria, cantidad):
+                return abs(en_servidor - en_memoria) <= (cantidad + 1) * sys.float_info.epsilon * en_memoria
+
+            assert servidor.total_evaluaciones() == len(almacen)
+            assert mismo_promedio(servidor.calcular_promedio_general(), agregados.promedio_general(), len(almacen))
+            mejor = servidor.obtener_mejor_evaluacion()
+            assert mejor.nombre == agregados.mejor_evaluacion().nombre
+            assert mejor.calcular_nota() == agregados.mejor_evaluacion().calcular_nota()
+            en_memoria = agregados.estadisticas_por_tipo()
+            for tipo, stats in servidor.obtener_estadisticas_por_tipo().items():
+                esperado = en_memoria[tipo]
+                assert (stats['count'], stats['best_name'], stats['best_score']) == \
+                    (esperado['count'], esperado['best_name'], esperado['best_score']), tipo
+                assert mismo_promedio(stats['promedio'], esperado['promedio'], stats['count']), tipo
+            # Y cada fila leída de la base de datos tiene el mismo puntaje y la misma nota que en memoria
+            for evaluacion_id, leida in dao.iterar_evaluaciones():
+                original = almacen.obtener(leida.nombre)
+                assert (leida.puntaje, leida.calcular_nota()) == (original.puntaje, original.calcular_nota())
+        finally:
+            dao.cerrar()
+    print(f"Estadísticas del servidor (SQLite) y AgregadosEvaluaciones coinciden en {len(evaluaciones)} evaluaciones.")
@@ -0,0 +1,128 @@
+# src/servicio/exportador_json.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import gzip
+import json
+import os
+
+from src.dominio.calculo_notas import lista_notas
+from src.servicio.importador_json import evaluacion_a_dict
+
+try:
+    import orjson  # Opcional: codifica en C varias veces más rápido que el módulo json
+except ImportError:
+    orjson = None
+
+# Extensiones que eligen la compresión cuando no se indica (ver compresion_por_extension)
+EXTENSIONES_COMPRESION = {'.gz': 'gzip', '.zst': 'zstd'}
+
+
+def compresion_por_extension(ruta):
+    """'gzip' para *.gz, 'zstd' para *.zst y None (sin comprimir) para cualquier otra extensión."""
+    return EXTENSIONES_COMPRESION.get(os.path.splitext(ruta)[1].lower())
+
+
+def _abrir_salida(ruta, compresion):
+    if compresion is None:
+        return open(ruta, 'wb')
+    if compresion == 'gzip':
+        # Nivel 6: casi el tamaño del 9 con una fracción del tiempo de CPU
+        return gzip.open(ruta, 'wb', compresslevel=6)
+    if compresion == 'zstd':
+        # Importación diferida: zstandard solo es necesario para este formato
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("La compresión zstd requiere el paquete 'zstandard' (pip install zstandard).")
+        compresor = zstandard.ZstdCompressor(level=3)
+        return compresor.stream_writer(open(ruta, 'wb'), closefd=True, write_return_read=True)
+    raise ValueError(f"Compresión desconocida: '{compresion}'.")
+
+
+class ExportadorEvaluaciones:
+    """
+    Exporta evaluaciones a un arreglo JSON en memoria acotada: los registros se codifican y se
+    escriben por bloques de 'tamano_bloque' directamente desde el iterable recibido (normalmente
+    el almacén del gestor), sin armar la lista de diccionarios ni el texto completo.
+    Con compacto=False cada evaluación ocupa una línea; con compacto=True no hay espacios ni
+    saltos de línea. El archivo se escribe junto al destino y solo lo reemplaza al terminar,
+    así que una exportación cancelada o fallida no deja un archivo a medias.
+    Con incluir_nota=True cada registro lleva además su 'nota', calculada en lote por bloque
+    (ver calcular_notas); la importación la ignora y vuelve a calcularla.
+    """
+    def __init__(self, compacto=False, compresion=None, tamano_bloque=5000, progreso=None, cancelado=None,
+                 incluir_nota=False):
+        if tamano_bloque < 1:
+            raise ValueError("El tamaño de bloque debe ser al menos 1.")
+        self.compacto = compacto
+        self.compresion = compresion
+        self.tamano_bloque = tamano_bloque
+        # progreso(escritas, totales) se llama tras cada bloque (totales es None si no se conoce)
+        self.progreso = progreso
+        # cancelado() se consulta antes de cada bloque; si retorna True la exportación se detiene
+        self.cancelado = cancelado
+        self.incluir_nota = incluir_nota
+        self._separador = b',' if compacto else b',\n'
+        self._codificar_bloque = self._bloque_orjson if orjson is not None else self._bloque_json
+        self._codificador = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+    def exportar(self, evaluaciones, ruta):
+        """
+        Escribe 'evaluaciones' en 'ruta' y retorna un resumen con las evaluaciones exportadas,
+        los bytes escritos (sin comprimir) y si se canceló (en ese caso 'ruta' no se modifica).
+        """
+        totales = len(evaluaciones) if hasattr(evaluaciones, '__len__') else None
+        resumen = {'exportadas': 0, 'bytes': 0, 'cancelada': False}
+        temporal = ruta + '.tmp'
+        try:
+            with _abrir_salida(temporal, self.compresion) as salida:
+                resumen['bytes'] += salida.write(b'[' if self.compacto else b'[\n')
+                bloque = []
+                for evaluacion in evaluaciones:
+                    bloque.append(evaluacion)
+                    if len(bloque) >= self.tamano_bloque:
+                        if self.cancelado and self.cancelado():
+                            resumen['cancelada'] = True
+                            break
+                        self._escribir_bloque(salida, bloque, resumen)
+                        self._notificar(resumen, totales)
+                if not resumen['cancelada']:
+                    self._escribir_bloque(salida, bloque, resumen)
+                    resumen['bytes'] += salida.write(b']' if self.compacto else b'\n]\n')
+            if resumen['cancelada']:
+                os.remove(temporal)
+            else:
+                os.replace(temporal, ruta)
+                self._notificar(resumen, totales)
+        except BaseException:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+            raise
+        return resumen
+
+    def _escribir_bloque(self, salida, bloque, resumen):
+        if not bloque:
+            return
+        dicts = [evaluacion_a_dict(e) for e in bloque]
+        if self.incluir_nota:
+            for eval_dict, nota in zip(dicts, lista_notas(bloque)):
+                eval_dict['nota'] = nota
+        datos = self._codificar_bloque(dicts)
+        if resumen['exportadas']:
+            datos = self._separador + datos
+        resumen['bytes'] += salida.write(datos)
+        resumen['exportadas'] += len(bloque)
+        bloque.clear()
+
+    def _bloque_orjson(self, dicts):
+        if self.compacto:
+            return orjson.dumps(dicts)[1:-1]  # El bloque entero de una vez, sin los corchetes
+        return self._separador.join(map(orjson.dumps, dicts))
+
+    def _bloque_json(self, dicts):
+        if self.compacto:
+            return self._codificador.encode(dicts)[1:-1].encode('utf-8')
+        return self._separador.join(self._codificador.encode(d).encode('utf-8') for d in dicts)
+
+    def _notificar(self, resumen, totales):
+        if self.progreso:
+            self.progreso(resumen['exportadas'], totales)
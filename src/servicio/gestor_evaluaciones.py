@@ -5,29 +5,80 @@ from src.dominio.evaluacion import Evaluacion
 from src.dominio.examen import Examen
 from src.dominio.trabajo import Trabajo
 from src.dominio.presentacion import Presentacion
-from src.datos.conexion import Conexion
+from src.datos.backend_evaluaciones import crear_backend
+from src.datos.cache_local import CacheEvaluaciones
+from src.servicio.almacen_evaluaciones import AlmacenEvaluaciones
+from src.servicio.indices_evaluaciones import IndiceTipoFecha, normalizar_tipo
+from src.servicio.agregados_evaluaciones import AgregadosEvaluaciones
+from src.servicio.escritura_diferida import EscrituraDiferida
+from src.servicio.estadisticas_servidor import EstadisticasServidor
+from src.servicio.indice_busqueda import IndiceBusqueda
+from src.servicio.clasificacion_evaluaciones import mejores, peores
 from datetime import date
-import pyodbc as bd
+from itertools import islice
+import sqlite3
 
 
 class GestorEvaluaciones:
-    def __init__(self):
-        self.evaluaciones = []
+    # Filas leídas por cada página de la carga perezosa desde la base de datos
+    TAMANO_PAGINA = 500
+
+    def __init__(self, cargar: bool = True, ruta_cache: str = None, dao=None):
+        # Colección ordenada con índice por nombre (y su EvaluacionID) para búsquedas y borrados O(1)
+        self.evaluaciones = AlmacenEvaluaciones()
+        # Cubetas por tipo e índice ordenado por fecha, actualizados en cada mutación del almacén
+        self._indice_tipo_fecha = IndiceTipoFecha()
+        self.evaluaciones.registrar_indice(self._indice_tipo_fecha)
+        # Cantidad, suma y notas ordenadas por tipo para el panel de estadísticas
+        self._agregados = AgregadosEvaluaciones()
+        self.evaluaciones.registrar_indice(self._agregados)
+        # Búsqueda por prefijo y por subcadena en nombres y temas, y temas en uso sin ir a la DB
+        self._busqueda = IndiceBusqueda()
+        self.evaluaciones.registrar_indice(self._busqueda)
+        # Backend de almacenamiento (SQL Server por defecto; ver crear_backend)
+        self.dao = dao if dao is not None else crear_backend()
+        # Estadísticas agregadas en la base de datos mientras la carga perezosa no termina
+        # (ver usar_estadisticas_servidor). No es un índice del almacén: cargar páginas de filas
+        # que ya están en la DB no las cambia, así que solo se invalidan al conectar y con las
+        # altas, cambios y bajas hechas por el gestor
+        self._estadisticas_servidor = EstadisticasServidor(self.dao)
+        self._usar_estadisticas_servidor = False
+        # Generador de páginas pendientes de la carga perezosa (None = carga completa)
+        self._paginas_pendientes = None
+        self._tamano_pagina = self.TAMANO_PAGINA
+        # Copia local opcional: al conectar se carga y solo se piden los cambios desde su marca de agua
+        self._cache = CacheEvaluaciones(ruta_cache) if ruta_cache and self.dao.SOPORTA_CAMBIOS else None
+        self._marca_carga = None  # Marca leída antes de una carga completa, para sellar la copia al terminar
+        # Escritura diferida opcional (ver activar_escritura_diferida); None = escritura directa
+        self._escritura_diferida = None
+        # Aviso opcional de la interfaz cuando la base de datos rechaza escrituras diferidas: se llama
+        # con la lista de rechazadas desde el hilo de la escritura diferida (ver atender_escrituras_rechazadas)
+        self.al_rechazar_escrituras = None
         # Bandera para saber si la conexión a la DB fue exitosa
         self.db_conectada = False
-        # Cargar evaluaciones al iniciar el gestor
+        # Con cargar=False la conexión se hace después con conectar() (p. ej. desde un hilo de fondo)
+        if cargar:
+            self.conectar()
+
+    def conectar(self):
+        """
+        Carga la copia local más los cambios del servidor si hay caché; si no, la primera
+        página de evaluaciones y el resto bajo demanda. Retorna True si la base de datos respondió.
+        """
+        self._estadisticas_servidor.invalidar()
         try:
-            self.cargar_evaluaciones_desde_db()
+            if not self._cargar_desde_cache():
+                self.cargar_evaluaciones_desde_db()
             self.db_conectada = True
         except ConnectionError as e:
             print(f"Advertencia: La aplicación se inició sin conexión a la base de datos. Las operaciones de DB no funcionarán. Detalles: {e}")
-            self.evaluaciones = [] # Asegurarse de que la lista esté vacía si no se pudo cargar
+            self.evaluaciones.limpiar() # Asegurarse de que la colección esté vacía si no se pudo cargar
             self.db_conectada = False
         except Exception as e:
             print(f"Error inesperado al intentar cargar evaluaciones al inicio: {e}")
-            self.evaluaciones = []
+            self.evaluaciones.limpiar()
             self.db_conectada = False
-
+        return self.db_conectada
 
     def agregar_evaluacion(self, evaluacion: Evaluacion):
         """
@@ -36,106 +87,47 @@ class GestorEvaluaciones:
         if not self.db_conectada:
             print("Error: No hay conexión a la base de datos. No se puede agregar la evaluación.")
             return False
+        if self._escritura_diferida is not None:
+            return self._agregar_diferido(evaluacion)
+        # Lo que ya se sabe en memoria se rechaza sin ir a la DB; la DB sigue comprobando las páginas no cargadas
+        if evaluacion.nombre in self.evaluaciones:
+            print(f"Ya existe una evaluación con el nombre '{evaluacion.nombre}'.")
+            return False
+        if isinstance(evaluacion, Trabajo) and self._tema_en_uso(evaluacion.tema):
+            print(f"Ya existe un Trabajo con el tema '{evaluacion.tema}'.")
+            return False
         try:
-            # Llama al método privado para guardar en la DB
-            self._guardar_evaluacion_en_db(evaluacion)
-            self.evaluaciones.append(evaluacion)  # Añadir a la lista en memoria solo si la DB tuvo éxito
+            evaluacion_id = self.dao.insertar_evaluacion(evaluacion)
+            self.evaluaciones.agregar(evaluacion, evaluacion_id)  # Añadir a memoria solo si la DB tuvo éxito
+            self._estadisticas_servidor.invalidar()
             print(f"Evaluación '{evaluacion.nombre}' agregada y guardada en DB.")
             return True
         except Exception as e:
             print(f"Error al agregar y guardar la evaluación en la DB: {e}")
             return False
 
-    def _guardar_evaluacion_en_db(self, evaluacion: Evaluacion):
+    def agregar_evaluaciones_lote(self, evaluaciones):
         """
-        Método privado para persistir una única evaluación en la base de datos.
-        Levanta una excepción si hay un error.
+        Agrega un lote de evaluaciones en una sola transacción de base de datos.
+        Si alguna falla (p. ej. nombre o tema duplicado) no se guarda ninguna.
+        Retorna el número de evaluaciones agregadas.
         """
-        conexion = None
-        cursor = None
+        if not self.db_conectada:
+            print("Error: No hay conexión a la base de datos. No se puede agregar el lote de evaluaciones.")
+            return 0
+        if not self.flush():  # El lote va directo a la DB: antes deben llegar las escrituras pendientes
+            return 0
+        evaluaciones = list(evaluaciones)
         try:
-            conexion = Conexion.obtenerConexion()
-            cursor = Conexion.obtenerCursor()
-
-            # --- NUEVO: Verificar si el nombre de la evaluación ya existe ---
-            sql_check_name = "SELECT COUNT(*) FROM Evaluaciones WHERE Nombre = ?"
-            cursor.execute(sql_check_name, evaluacion.nombre)
-            if cursor.fetchone()[0] > 0:
-                raise Exception(f"Ya existe una evaluación con el nombre '{evaluacion.nombre}'.")
-
-            # --- NUEVO: Si es un Trabajo, verificar si el tema ya existe ---
-            if isinstance(evaluacion, Trabajo):
-                sql_check_tema = "SELECT COUNT(*) FROM Trabajos WHERE Tema = ?"
-                cursor.execute(sql_check_tema, evaluacion.tema)
-                if cursor.fetchone()[0] > 0:
-                    raise Exception(f"Ya existe un Trabajo con el tema '{evaluacion.tema}'.")
-
-            # 1. Insertar en la tabla base 'Evaluaciones'
-            sql_base = """
-             INSERT INTO Evaluaciones (Nombre, Fecha, Puntaje, TipoEvaluacion)
-             OUTPUT INSERTED.EvaluacionID
-             VALUES (?, ?, ?, ?)
-             """
-            parametros_base = (
-                evaluacion.nombre,
-                evaluacion.fecha,
-                evaluacion.puntaje,
-                evaluacion.__class__.__name__  # Obtener el tipo de la clase (Examen, Trabajo, Presentacion)
-            )
-            cursor.execute(sql_base, parametros_base)
-            evaluacion_id = cursor.fetchone()[0]  # Obtener el ID de la evaluación insertada
-
-            # 2. Insertar en la tabla específica del tipo de evaluación
-            if isinstance(evaluacion, Examen):
-                sql_tipo = """
-                 INSERT INTO Examenes (EvaluacionID, Duracion, NumPreguntas)
-                 VALUES (?, ?, ?)
-                 """
-                parametros_tipo = (
-                    evaluacion_id,
-                    evaluacion.duracion_min,
-                    evaluacion.num_preguntas
-                )
-                cursor.execute(sql_tipo, parametros_tipo)
-            elif isinstance(evaluacion, Trabajo):
-                sql_tipo = """
-                 INSERT INTO Trabajos (EvaluacionID, NumPaginas, Tema)
-                 VALUES (?, ?, ?)
-                 """
-                parametros_tipo = (
-                    evaluacion_id,
-                    evaluacion.num_paginas,
-                    evaluacion.tema
-                )
-                cursor.execute(sql_tipo, parametros_tipo)
-            elif isinstance(evaluacion, Presentacion):
-                sql_tipo = """
-                 INSERT INTO Presentaciones (EvaluacionID, Duracion, TamanoAudiencia)
-                 VALUES (?, ?, ?)
-                 """
-                parametros_tipo = (
-                    evaluacion_id,
-                    evaluacion.duracion_min,
-                    evaluacion.tamano_audiencia
-                )
-                cursor.execute(sql_tipo, parametros_tipo)
-
-            conexion.commit()  # Confirmar la transacción
-            # Nota: Aquí podríamos asignar evaluacion_id al objeto evaluacion si necesitamos su ID de DB en Python.
-            # evaluacion._evaluacion_id_db = evaluacion_id
-
-        except bd.Error as ex:
-            sqlstate = ex.args[0]
-            if conexion:
-                conexion.rollback()  # Revertir la transacción en caso de error
-            # Re-lanzar la excepción para que el llamador (agregar_evaluacion) la capture y muestre el error
-            raise Exception(f"Error SQL al guardar en DB: {sqlstate}. Mensaje: {ex.args[1]}")
+            ids = self.dao.guardar_evaluaciones_lote(evaluaciones)
+            # Solo si la DB confirmó el lote completo; los índices calculan las notas en lote
+            self.evaluaciones.agregar_varios((evaluacion, ids.get(evaluacion.nombre)) for evaluacion in evaluaciones)
+            self._estadisticas_servidor.invalidar()
+            print(f"{len(evaluaciones)} evaluaciones agregadas y guardadas en DB.")
+            return len(evaluaciones)
         except Exception as e:
-            if conexion:
-                conexion.rollback()
-            raise Exception(f"Error inesperado al guardar en DB: {e}")
-        finally:
-            Conexion.cerrarConexion()
+            print(f"Error al agregar y guardar el lote de evaluaciones en la DB: {e}")
+            return 0
 
     def eliminar_evaluacion_por_nombre(self, nombre: str):
         """
@@ -144,111 +136,360 @@ class GestorEvaluaciones:
         if not self.db_conectada:
             print("Error: No hay conexión a la base de datos. No se puede eliminar la evaluación.")
             return False
-        conexion = None
-        cursor = None
+        if self._escritura_diferida is not None:
+            return self._eliminar_diferido([nombre]) == 1
         try:
-            conexion = Conexion.obtenerConexion()
-            cursor = Conexion.obtenerCursor()
-
-            # 1. Obtener el EvaluacionID de la evaluación a eliminar
-            sql_get_id = "SELECT EvaluacionID FROM Evaluaciones WHERE Nombre = ?"
-            cursor.execute(sql_get_id, nombre)
-            result = cursor.fetchone()
-
-            if result is None:
-                print(f"Evaluación '{nombre}' no encontrada en la base de datos.")
-                # Aunque no se encontró en la DB, si por alguna razón está en memoria, la quitamos
-                self.evaluaciones = [e for e in self.evaluaciones if e.nombre != nombre]
-                return False  # No se encontró la evaluación en la DB
-
-            evaluacion_id = result[0]
+            # Se usa el EvaluacionID conocido en memoria; el DAO solo lo busca por nombre si falta
+            evaluacion_id = self.dao.eliminar_evaluacion_bd(nombre, self.evaluaciones.obtener_id(nombre))
+        except Exception as e:
+            print(f"Error al eliminar evaluación: {e}")
+            return False
+        if evaluacion_id is None:
+            print(f"Evaluación '{nombre}' no encontrada en la base de datos.")
+            # Aunque no se encontró en la DB, si por alguna razón está en memoria, la quitamos
+            self.evaluaciones.eliminar(nombre)
+            return False
+        print(f"Evaluación '{nombre}' (ID: {evaluacion_id}) eliminada exitosamente de la DB.")
 
-            # 2. Eliminar de las tablas específicas primero (por foreign key)
-            # No importa si no hay registros en alguna de estas, el DELETE afectará 0 filas.
-            cursor.execute("DELETE FROM Examenes WHERE EvaluacionID = ?", evaluacion_id)
-            cursor.execute("DELETE FROM Trabajos WHERE EvaluacionID = ?", evaluacion_id)
-            cursor.execute("DELETE FROM Presentaciones WHERE EvaluacionID = ?", evaluacion_id)
+        # Eliminar de la colección en memoria
+        self.evaluaciones.eliminar(nombre)
+        self._estadisticas_servidor.invalidar()
+        print(f"Evaluación '{nombre}' eliminada de la memoria.")
+        return True
 
-            # 3. Eliminar de la tabla base 'Evaluaciones'
-            cursor.execute("DELETE FROM Evaluaciones WHERE EvaluacionID = ?", evaluacion_id)
+    def eliminar_evaluaciones(self, nombres):
+        """
+        Elimina varias evaluaciones por nombre en una sola transacción y una sola ida y vuelta
+        a la base de datos (las tablas de subtipos se limpian por ON DELETE CASCADE), y
+        actualiza la colección en memoria y sus índices en una pasada.
+        Retorna el número de evaluaciones eliminadas de la base de datos.
+        """
+        if not self.db_conectada:
+            print("Error: No hay conexión a la base de datos. No se pueden eliminar las evaluaciones.")
+            return 0
+        nombres = list(nombres)
+        if self._escritura_diferida is not None:
+            return self._eliminar_diferido(nombres)
+        try:
+            eliminadas = self.dao.eliminar_evaluaciones_lote(nombres)
+        except Exception as e:
+            print(f"Error al eliminar el lote de evaluaciones de la DB: {e}")
+            return 0
+        # Como en el borrado individual, lo que ya no está en la DB tampoco debe quedar en memoria
+        self.evaluaciones.eliminar_varios(nombres)
+        self._estadisticas_servidor.invalidar()
+        print(f"{len(eliminadas)} evaluaciones eliminadas de la DB y de la memoria.")
+        return len(eliminadas)
+
+    # --- Escritura diferida (write-behind) ---
+    def activar_escritura_diferida(self, ruta_diario="evaluaciones_pendientes.jsonl", tamano_lote=500,
+                                   intervalo=2.0):
+        """
+        Activa el modo de escritura diferida: altas, cambios y bajas se aplican en memoria al
+        instante y se anotan en un diario local; un hilo de fondo los envía a la base de datos por
+        lotes cada 'tamano_lote' operaciones o 'intervalo' segundos. Si el diario contiene
+        operaciones de una sesión que terminó sin enviarlas, se envían primero y se recarga.
+        Retorna True si el modo quedó activo.
+        """
+        if self._escritura_diferida is not None:
+            return True
+        if not self.db_conectada:
+            print("Error: No hay conexión a la base de datos. No se puede activar la escritura diferida.")
+            return False
+        try:
+            self._escritura_diferida = EscrituraDiferida(self.dao, ruta_diario, tamano_lote, intervalo,
+                                                         al_rechazar=self._avisar_rechazo)
+            if self._escritura_diferida.pendientes:
+                print(f"Reenviando {self._escritura_diferida.pendientes} escrituras pendientes del diario.")
+                if not self._escritura_diferida.flush():
+                    raise Exception("No se pudieron reenviar las escrituras pendientes del diario.")
+                self.cargar_evaluaciones_desde_db()
+            # Las validaciones de unicidad se hacen en memoria, así que debe estar completa
+            self.cargar_todas()
+            print("Escritura diferida activada.")
+            return True
+        except Exception as e:
+            print(f"Error al activar la escritura diferida: {e}")
+            if self._escritura_diferida is not None:
+                self._escritura_diferida.cerrar(timeout=0)
+            self._escritura_diferida = None
+            return False
 
-            conexion.commit()  # Confirmar la transacción
-            print(f"Evaluación '{nombre}' (ID: {evaluacion_id}) eliminada exitosamente de la DB.")
+    def desactivar_escritura_diferida(self, timeout=None):
+        """Envía lo pendiente y vuelve a la escritura directa. Retorna False si quedó algo sin enviar."""
+        if self._escritura_diferida is None:
+            return True
+        enviado = self._escritura_diferida.cerrar(timeout)
+        self._escritura_diferida = None
+        if not enviado:
+            print("Advertencia: quedaron escrituras sin enviar; se reenviarán al reactivar la escritura diferida.")
+        return enviado
 
-            # 4. Eliminar de la lista en memoria
-            self.evaluaciones = [e for e in self.evaluaciones if e.nombre != nombre]
-            print(f"Evaluación '{nombre}' eliminada de la memoria.")
+    def flush(self, timeout=None):
+        """
+        Barrera: espera a que todas las escrituras diferidas registradas hasta ahora estén
+        confirmadas en la base de datos (o rechazadas, y entonces corregidas en memoria).
+        Sin escritura diferida retorna True de inmediato.
+        """
+        if self._escritura_diferida is None:
             return True
+        if not self._escritura_diferida.flush(timeout):
+            return False
+        self.atender_escrituras_rechazadas()
+        return True
 
-        except bd.Error as ex:
-            sqlstate = ex.args[0]
-            if conexion:
-                conexion.rollback()  # Revertir la transacción en caso de error
-            print(f"Error SQLSTATE al eliminar evaluación: {sqlstate}. Mensaje: {ex.args[1]}")
+    def atender_escrituras_rechazadas(self):
+        """
+        Corrige la memoria tras las escrituras diferidas que la base de datos rechazó y que aún
+        no se habían atendido: las evaluaciones afectadas se recargan desde la base de datos (o se
+        quitan si allí no existen). Antes espera a que se envíe lo pendiente, para no pisar cambios
+        posteriores. Retorna la lista de rechazadas atendidas.
+        """
+        if self._escritura_diferida is None or not self._escritura_diferida.flush():
+            return []
+        rechazadas = self._escritura_diferida.tomar_rechazadas()
+        if not rechazadas:
+            return []
+        nombres = set()
+        for rechazada in rechazadas:
+            nombres.update(n for n in (rechazada.get('nombre'), rechazada.get('nombre_original')) if n)
+            if 'evaluacion' in rechazada:
+                nombres.add(rechazada['evaluacion']['nombre'])
+        try:
+            leidas = self.dao.leer_evaluaciones_por_nombre(nombres)
+        except Exception as e:
+            print(f"Error al recargar las evaluaciones rechazadas: {e}")
+            return []
+        for nombre in nombres:
+            evaluacion_id, evaluacion = leidas.get(nombre, (None, None))
+            if evaluacion is None:
+                self.evaluaciones.eliminar(nombre)
+            elif nombre in self.evaluaciones:
+                self.evaluaciones.reemplazar(nombre, evaluacion, evaluacion_id)  # Conserva su posición
+            else:
+                self.evaluaciones.agregar(evaluacion, evaluacion_id)
+        self._estadisticas_servidor.invalidar()
+        print(f"{len(rechazadas)} escrituras rechazadas atendidas; {len(nombres)} evaluaciones recargadas de la DB.")
+        return rechazadas
+
+    def escrituras_rechazadas(self):
+        """Escrituras diferidas que la base de datos rechazó, con su 'error' (diario de rechazadas)."""
+        return [] if self._escritura_diferida is None else self._escritura_diferida.rechazadas()
+
+    def _avisar_rechazo(self, rechazadas):
+        if self.al_rechazar_escrituras is not None:
+            self.al_rechazar_escrituras(rechazadas)
+
+    def _agregar_diferido(self, evaluacion):
+        if evaluacion.nombre in self.evaluaciones:
+            print(f"Ya existe una evaluación con el nombre '{evaluacion.nombre}'.")
             return False
+        if isinstance(evaluacion, Trabajo) and self._tema_en_uso(evaluacion.tema):
+            print(f"Ya existe un Trabajo con el tema '{evaluacion.tema}'.")
+            return False
+        try:
+            self._escritura_diferida.agregar(evaluacion)  # Primero el diario: si falla, la memoria no cambia
         except Exception as e:
-            if conexion:
-                conexion.rollback()
-            print(f"Error inesperado al eliminar evaluación: {e}")
+            print(f"Error al registrar la evaluación en el diario: {e}")
             return False
-        finally:
-            Conexion.cerrarConexion()
+        self.evaluaciones.agregar(evaluacion)
+        self._estadisticas_servidor.invalidar()
+        print(f"Evaluación '{evaluacion.nombre}' agregada (escritura diferida).")
+        return True
+
+    def _actualizar_diferido(self, nombre_original, evaluacion):
+        anterior = self.evaluaciones.obtener(nombre_original)
+        if anterior is None:
+            print(f"Evaluación original '{nombre_original}' no encontrada para actualizar.")
+            return False
+        if nombre_original != evaluacion.nombre and evaluacion.nombre in self.evaluaciones:
+            print(f"El nuevo nombre '{evaluacion.nombre}' ya está en uso por otra evaluación.")
+            return False
+        if isinstance(evaluacion, Trabajo) and self._tema_en_uso(evaluacion.tema, excepto=anterior):
+            print(f"Ya existe un Trabajo con el tema '{evaluacion.tema}'.")
+            return False
+        try:
+            self._escritura_diferida.actualizar(nombre_original, evaluacion)
+        except Exception as e:
+            print(f"Error al registrar la actualización en el diario: {e}")
+            return False
+        self.evaluaciones.reemplazar(nombre_original, evaluacion)
+        self._estadisticas_servidor.invalidar()
+        print(f"Evaluación '{nombre_original}' actualizada (escritura diferida).")
+        return True
+
+    def _eliminar_diferido(self, nombres):
+        nombres = [nombre for nombre in dict.fromkeys(nombres) if nombre in self.evaluaciones]
+        try:
+            for nombre in nombres:
+                self._escritura_diferida.eliminar(nombre)
+        except Exception as e:
+            print(f"Error al registrar la eliminación en el diario: {e}")
+            return 0
+        self.evaluaciones.eliminar_varios(nombres)
+        self._estadisticas_servidor.invalidar()
+        print(f"{len(nombres)} evaluaciones eliminadas (escritura diferida).")
+        return len(nombres)
+
+    def _tema_en_uso(self, tema, excepto=None):
+        return any(t is not excepto for t in self._busqueda.trabajos_con_tema(tema))
 
     def obtener_evaluacion_por_nombre(self, nombre: str):
         """Obtiene una evaluación por su nombre."""
-        # Esta operación no requiere DB, opera sobre la lista en memoria
-        for eval_obj in self.evaluaciones:
-            if eval_obj.nombre == nombre:
-                return eval_obj
-        return None
+        # Esta operación no requiere DB, usa el índice por nombre en memoria
+        return self.evaluaciones.obtener(nombre)
+
+    def buscar(self, texto: str, limite: int = 50):
+        """
+        Evaluaciones en memoria cuyo nombre o tema (de los Trabajos) contiene el texto, sin distinguir
+        mayúsculas ni acentos: primero las que empiezan por él. Retorna como mucho 'limite'.
+        """
+        # Esta operación no requiere DB, usa el índice de búsqueda en memoria
+        return self._busqueda.buscar(texto, limite)
 
     def filtrar_evaluaciones_por_tipo(self, tipo: str):
         """Filtra y devuelve evaluaciones por tipo."""
-        # Esta operación no requiere DB, opera sobre la lista en memoria
+        # Esta operación no requiere DB, usa las cubetas por tipo en memoria
         if tipo == "Todos":
             return self.evaluaciones
         else:
-            return [e for e in self.evaluaciones if e.__class__.__name__ == tipo]
+            return self._indice_tipo_fecha.filtrar(tipo=tipo)
+
+    def filtrar(self, tipo: str = None, desde: date = None, hasta: date = None):
+        """
+        Devuelve las evaluaciones del tipo indicado (None o "Todos" = cualquiera) con fecha
+        entre desde y hasta, ambos inclusive. Con rango de fechas el resultado sale ordenado por fecha.
+        Cuesta O(log n + k) gracias a los índices secundarios.
+        """
+        if tipo == "Todos":
+            tipo = None
+        if tipo is None and desde is None and hasta is None:
+            return list(self.evaluaciones)
+        return self._indice_tipo_fecha.filtrar(tipo, desde, hasta)
+
+    def usar_estadisticas_servidor(self, activar: bool = True):
+        """
+        Con activar=True, mientras queden páginas por cargar las estadísticas se calculan en la
+        base de datos sobre todas las filas (ver EstadisticasServidor) en lugar de solo sobre las
+        cargadas. Con la carga completa se siguen leyendo los agregados en memoria.
+        """
+        self._usar_estadisticas_servidor = activar
+
+    @property
+    def estadisticas_en_servidor(self):
+        """True si las estadísticas se leen ahora de la base de datos (ver usar_estadisticas_servidor)."""
+        return self._usar_estadisticas_servidor and self.db_conectada and not self.carga_completa
+
+    def _estadistica(self, desde_servidor, desde_memoria):
+        if self.estadisticas_en_servidor:
+            try:
+                return desde_servidor(self._estadisticas_al_dia())
+            except Exception as e:
+                print(f"Error al calcular las estadísticas en la base de datos; se usan las de memoria: {e}")
+        return desde_memoria()
+
+    def _estadisticas_al_dia(self):
+        if self._escritura_diferida is not None:
+            # Que el servidor ya tenga las escrituras diferidas pendientes. Solo la barrera de la escritura
+            # diferida: atender los rechazos modifica la memoria y esto puede correr en un hilo de lectura
+            self._escritura_diferida.flush()
+        return self._estadisticas_servidor
+
+    def resumen_estadisticas(self, desde_servidor: bool = None):
+        """
+        Total, promedio general, mejor evaluación y estadísticas por tipo en un diccionario
+        ('total', 'promedio', 'mejor', 'por_tipo'), con los mismos criterios que los métodos
+        individuales (desde_servidor=None), solo de la base de datos (True) o solo de memoria (False).
+        Desde la base de datos espera a las escrituras diferidas y levanta la excepción si falla, sin
+        leer la memoria, así que puede ejecutarse en un hilo de lectura; la interfaz no debe llamarlo
+        entonces desde su hilo.
+        """
+        if desde_servidor is None:
+            desde_servidor = self.estadisticas_en_servidor
+        if desde_servidor:
+            servidor = self._estadisticas_al_dia()
+            return {'total': servidor.total_evaluaciones(),
+                    'promedio': servidor.calcular_promedio_general(),
+                    'mejor': servidor.obtener_mejor_evaluacion(),
+                    'por_tipo': servidor.obtener_estadisticas_por_tipo()}
+        return {'total': len(self.evaluaciones),
+                'promedio': self._agregados.promedio_general(),
+                'mejor': self._agregados.mejor_evaluacion(),
+                'por_tipo': self._agregados.estadisticas_por_tipo()}
+
+    def total_evaluaciones(self):
+        """Cantidad total de evaluaciones (en la base de datos si aún no están todas cargadas)."""
+        return self._estadistica(EstadisticasServidor.total_evaluaciones, lambda: len(self.evaluaciones))
 
     def calcular_promedio_general(self):
-        """Calcula el promedio de puntajes de todas las evaluaciones."""
-        # Esta operación no requiere DB, opera sobre la lista en memoria
-        if not self.evaluaciones:
-            return 0.0
-        return sum(e.calcular_nota() for e in self.evaluaciones) / len(self.evaluaciones)
+        """Calcula el promedio de notas de todas las evaluaciones."""
+        # Sin estadísticas en el servidor no requiere DB; lee los agregados que se mantienen en cada mutación
+        return self._estadistica(EstadisticasServidor.calcular_promedio_general, self._agregados.promedio_general)
 
     def obtener_mejor_evaluacion(self):
-        """Obtiene la evaluación con el puntaje más alto."""
-        # Esta operación no requiere DB, opera sobre la lista en memoria
-        if not self.evaluaciones:
-            return None
-        return max(self.evaluaciones, key=lambda e: e.calcular_nota())
+        """Obtiene la evaluación con la nota más alta."""
+        return self._estadistica(EstadisticasServidor.obtener_mejor_evaluacion, self._agregados.mejor_evaluacion)
 
     def obtener_estadisticas_por_tipo(self):
         """Obtiene estadísticas (cantidad, promedio, mejor) por tipo de evaluación."""
-        # Esta operación no requiere DB, opera sobre la lista en memoria
-        stats = {}
-        tipos_validos = ["Examen", "Trabajo", "Presentacion"]
-        for tipo in tipos_validos:
-            evals_tipo = self.filtrar_evaluaciones_por_tipo(tipo)
-            count = len(evals_tipo)
-            if count > 0:
-                promedio = sum(e.calcular_nota() for e in evals_tipo) / count
-                best_eval = max(evals_tipo, key=lambda e: e.calcular_nota())
-                stats[tipo] = {
-                    'count': count,
-                    'promedio': promedio,
-                    'best_name': best_eval.nombre,
-                    'best_score': best_eval.calcular_nota()
-                }
-            else:
-                stats[tipo] = {
-                    'count': 0,
-                    'promedio': 0.0,
-                    'best_name': "N/A",
-                    'best_score': 0.0
-                }
-        return stats
+        return self._estadistica(EstadisticasServidor.obtener_estadisticas_por_tipo,
+                                 self._agregados.estadisticas_por_tipo)
+
+    # --- Clasificaciones (sobre las evaluaciones en memoria) ---
+    def mejores_evaluaciones(self, k: int, tipo: str = None, desde: date = None, hasta: date = None):
+        """
+        Las k evaluaciones con la nota más alta, de mayor a menor. Sin rango de fechas salen de las
+        notas ordenadas que mantienen los agregados (a igualdad de nota, la que se cargó antes);
+        con rango, un montículo las elige entre las de filtrar() sin ordenarlas todas.
+        """
+        if desde is None and hasta is None:
+            return self._agregados.mejores(k, self._tipo_clasificacion(tipo))
+        return mejores(self.filtrar(tipo, desde, hasta), k)
+
+    def peores_evaluaciones(self, k: int, tipo: str = None, desde: date = None, hasta: date = None):
+        """Las k evaluaciones con la nota más baja, de menor a mayor (ver mejores_evaluaciones)."""
+        if desde is None and hasta is None:
+            return self._agregados.peores(k, self._tipo_clasificacion(tipo))
+        return peores(self.filtrar(tipo, desde, hasta), k)
+
+    def posicion_de(self, nombre: str, por_tipo: bool = False):
+        """
+        Puesto (1 = la mejor nota) de la evaluación entre todas o solo entre las de su tipo,
+        o None si no existe. Cuesta O(log n) gracias a los agregados.
+        """
+        secuencia = self.evaluaciones.obtener_secuencia(nombre)
+        return None if secuencia is None else self._agregados.posicion(secuencia, por_tipo)
+
+    def percentil(self, p: float, tipo: str = None):
+        """Nota del percentil p (0 a 100) entre todas o las del tipo indicado; None si no hay evaluaciones."""
+        return self._agregados.percentil(p, self._tipo_clasificacion(tipo))
+
+    @staticmethod
+    def _tipo_clasificacion(tipo):
+        return None if tipo in (None, "Todos") else normalizar_tipo(tipo)
+
+    def crear_almacen_columnar(self, sincronizado=True):
+        """
+        Crea un AlmacenColumnar (NumPy) con las evaluaciones actuales para estadísticas y
+        filtros vectorizados. Si sincronizado es True, queda registrado como índice y
+        refleja las altas, cambios y bajas posteriores del gestor.
+        """
+        # Importación diferida: NumPy solo es necesario para el análisis por columnas
+        from src.servicio.almacen_columnar import AlmacenColumnar
+        if not sincronizado:
+            return AlmacenColumnar.desde_evaluaciones(self.evaluaciones)
+        almacen = AlmacenColumnar(len(self.evaluaciones))
+        self.evaluaciones.registrar_indice(almacen)
+        return almacen
+
+    def crear_tabla_arrow(self):
+        """
+        Tabla Arrow (pyarrow) con las evaluaciones en memoria y su EvaluacionID: una fila por
+        evaluación con las columnas de cada subtipo, nulas en las filas de los otros tipos.
+        """
+        # Importación diferida: pyarrow solo es necesario para el intercambio con herramientas de análisis
+        from src.servicio.archivo_parquet import tabla_arrow
+        return tabla_arrow(self.evaluaciones)
 
     def limpiar_todas_las_evaluaciones(self):
         """
@@ -257,223 +498,231 @@ class GestorEvaluaciones:
         if not self.db_conectada:
             print("Error: No hay conexión a la base de datos. No se pueden limpiar las evaluaciones.")
             return False
-        conexion = None
-        cursor = None
+        if not self.flush():  # Que ninguna escritura pendiente llegue después del borrado
+            return False
         try:
-            conexion = Conexion.obtenerConexion()
-            cursor = Conexion.obtenerCursor()
-
-            # Eliminar registros de las tablas de subtipos primero (por foreign key)
-            cursor.execute("DELETE FROM Examenes;")
-            cursor.execute("DELETE FROM Trabajos;")
-            cursor.execute("DELETE FROM Presentaciones;")
-            # Finalmente, eliminar de la tabla base
-            cursor.execute("DELETE FROM Evaluaciones;")
-            conexion.commit()
+            # Las tablas de subtipos se vacían por ON DELETE CASCADE
+            self.dao.limpiar_todas_las_evaluaciones_bd()
             print("Todas las evaluaciones eliminadas exitosamente de la base de datos.")
-            self.evaluaciones = []  # Limpiar la lista en memoria después de la DB
+            self._paginas_pendientes = None  # Ya no quedan filas por cargar
+            self._marca_carga = None
+            self.evaluaciones.limpiar()  # Limpiar la colección en memoria después de la DB
+            self._estadisticas_servidor.invalidar()
             print("Lista de evaluaciones en memoria limpiada.")
             return True
-        except bd.Error as ex:
-            sqlstate = ex.args[0]
-            if conexion:
-                conexion.rollback()
-            print(f"Error SQLSTATE al limpiar todas las evaluaciones de la DB: {sqlstate}. Mensaje: {ex.args[1]}")
-            return False
         except Exception as e:
-            if conexion:
-                conexion.rollback()
-            print(f"Error inesperado al limpiar todas las evaluaciones de la DB: {e}")
+            print(f"Error al limpiar todas las evaluaciones de la DB: {e}")
             return False
-        finally:
-            Conexion.cerrarConexion()
 
-    def cargar_evaluaciones_desde_db(self):
+    def cargar_evaluaciones_desde_db(self, tamano_pagina: int = None):
         """
-        Carga todas las evaluaciones desde la base de datos.
+        Inicia la carga perezosa de evaluaciones desde la base de datos: solo se lee la
+        primera página y el resto queda pendiente para cargar_siguiente_pagina().
         Levanta ConnectionError si no se puede conectar.
         """
-        self.evaluaciones = []  # Limpiar la lista actual antes de cargar
+        self.evaluaciones.limpiar()  # Limpiar la colección actual antes de cargar
+        if self._cache is not None:
+            self._marca_carga = self.dao.leer_marca_agua()
+        self._tamano_pagina = tamano_pagina or self.TAMANO_PAGINA
+        self._paginas_pendientes = self.dao.iterar_evaluaciones(self._tamano_pagina)
+        self.cargar_siguiente_pagina()
+
+    def cargar_siguiente_pagina(self):
+        """
+        Carga la siguiente página de evaluaciones pendientes y retorna las que se añadieron
+        (lista vacía si la carga ya terminó). Levanta ConnectionError si falla la lectura.
+        """
+        return self.agregar_pagina(self.leer_siguiente_pagina())
 
-        conexion = None
-        cursor = None
+    def leer_siguiente_pagina(self):
+        """
+        Lee de la base de datos la siguiente página pendiente sin modificar la colección en
+        memoria, para poder hacerlo desde un hilo de fondo. Retorna una lista de
+        (EvaluacionID, evaluacion). Levanta ConnectionError si falla la lectura.
+        """
+        if self._paginas_pendientes is None:
+            return []
         try:
-            conexion = Conexion.obtenerConexion()
-            cursor = Conexion.obtenerCursor()
-
-            sql_query = """
-             SELECT
-                 e.EvaluacionID,
-                 e.Nombre,
-                 e.Fecha,
-                 e.Puntaje,
-                 e.TipoEvaluacion,
-                 ex.Duracion AS Examen_duracion_min,
-                 ex.NumPreguntas AS Examen_num_preguntas,
-                 t.NumPaginas AS Trabajo_num_paginas,
-                 t.Tema AS Trabajo_tema,
-                 p.Duracion AS Presentacion_duracion_min,
-                 p.TamanoAudiencia AS Presentacion_tamano_audiencia
-             FROM Evaluaciones AS e
-             LEFT JOIN Examenes AS ex ON e.EvaluacionID = ex.EvaluacionID AND e.TipoEvaluacion = 'Examen'
-             LEFT JOIN Trabajos AS t ON e.EvaluacionID = t.EvaluacionID AND e.TipoEvaluacion = 'Trabajo'
-             LEFT JOIN Presentaciones AS p ON e.EvaluacionID = p.EvaluacionID AND e.TipoEvaluacion = 'Presentacion';
-             """
-            cursor.execute(sql_query)
-            rows = cursor.fetchall()
-
-            for row in rows:
-                evaluacion_id, nombre, fecha, puntaje, tipo_evaluacion = \
-                    row[0], row[1], row[2], float(row[3]), row[4]
-
-                eval_obj = None
-                if tipo_evaluacion == 'Examen':
-                    duracion_min = row[5]
-                    num_preguntas = row[6]
-                    if duracion_min is not None and num_preguntas is not None:
-                        eval_obj = Examen(nombre, fecha, puntaje, duracion_min, num_preguntas)
-                elif tipo_evaluacion == 'Trabajo':
-                    num_paginas = row[7]
-                    tema = row[8]
-                    if num_paginas is not None and tema is not None:
-                        eval_obj = Trabajo(nombre, fecha, puntaje, num_paginas, tema)
-                elif tipo_evaluacion == 'Presentacion':
-                    duracion_min = row[9]
-                    tamano_audiencia = row[10]
-                    if duracion_min is not None and tamano_audiencia is not None:
-                        eval_obj = Presentacion(nombre, fecha, puntaje, duracion_min, tamano_audiencia)
-
-                if eval_obj:
-                    self.evaluaciones.append(eval_obj)
-
-            print("Evaluaciones cargadas exitosamente desde la base de datos.")
-
-        except bd.Error as ex:
-            sqlstate = ex.args[0]
-            # No re-lanzar Exception genérica, re-lanzar el error de conexión
-            raise ConnectionError(f"Error SQLSTATE al cargar evaluaciones: {sqlstate}. Mensaje: {ex.args[1]}")
+            filas = list(islice(self._paginas_pendientes, self._tamano_pagina))
         except Exception as e:
-            # Capturar cualquier otra excepción y re-lanzarla como ConnectionError
+            self._paginas_pendientes = None
             raise ConnectionError(f"Error inesperado al cargar evaluaciones desde la DB: {e}")
-        finally:
-            Conexion.cerrarConexion()
+        if len(filas) < self._tamano_pagina:
+            self._paginas_pendientes = None  # El generador se agotó: no quedan páginas
+        return filas
+
+    def agregar_pagina(self, filas):
+        """Añade a la colección una página leída con leer_siguiente_pagina() y retorna las nuevas."""
+        # Las altas hechas durante la carga ya están en memoria y vuelven a aparecer al final
+        nuevas = [(evaluacion, evaluacion_id) for evaluacion_id, evaluacion in filas
+                  if evaluacion.nombre not in self.evaluaciones]
+        self.evaluaciones.agregar_varios(nuevas)
+        nuevas = [evaluacion for evaluacion, _ in nuevas]
+        if self._paginas_pendientes is None:
+            print(f"Evaluaciones cargadas exitosamente desde la base de datos ({len(self.evaluaciones)}).")
+            if self._marca_carga is not None:
+                self._guardar_cache()
+        return nuevas
+
+    def _cargar_desde_cache(self):
+        """
+        Carga la copia local y le aplica los cambios del servidor posteriores a su marca de agua.
+        Retorna False (sin tocar la colección) si no hay caché o no se puede usar, para hacer
+        una carga normal. Levanta ConnectionError si no se puede conectar.
+        """
+        if self._cache is None:
+            return False
+        try:
+            copia = self._cache.cargar()
+        except sqlite3.Error as e:
+            print(f"Advertencia: no se pudo leer la caché local: {e}")
+            copia = None
+        if copia is None:
+            return False
+        marca, filas = copia
+        delta = self._leer_cambios_cache(marca)
+        if delta is None:
+            print("Se hará una carga completa.")
+            return False
+        marca_nueva, cambiadas, eliminadas = delta
+
+        por_id = dict(filas)
+        for evaluacion_id in eliminadas:
+            por_id.pop(evaluacion_id, None)
+        por_id.update(cambiadas)
+        self.evaluaciones.limpiar()
+        self._paginas_pendientes = None
+        self.evaluaciones.agregar_varios((por_id[evaluacion_id], evaluacion_id) for evaluacion_id in sorted(por_id))
+        try:
+            self._cache.aplicar_cambios(marca_nueva, cambiadas, eliminadas)
+        except sqlite3.Error as e:
+            print(f"Advertencia: no se pudo actualizar la caché local: {e}")
+        print(f"Evaluaciones cargadas desde la caché local ({len(self.evaluaciones)}), "
+              f"con {len(cambiadas)} cambios y {len(eliminadas)} eliminaciones del servidor.")
+        return True
+
+    def _leer_cambios_cache(self, marca):
+        """
+        Lee del servidor lo que cambió desde la marca de la copia local y retorna
+        (marca_nueva, cambiadas, eliminadas), o None si la copia ya no se puede poner al día: se
+        descarta, o se deja de usar la caché en esta sesión si el esquema no ofrece los cambios.
+        Levanta ConnectionError si no se puede conectar.
+        """
+        marca_nueva = self.dao.leer_marca_agua()  # Antes que los cambios, para no perder ninguno
+        if marca_nueva < marca:
+            # La marca del servidor retrocedió: la base de datos se recreó y la copia no le corresponde
+            print("La caché local no corresponde a esta base de datos; se descarta.")
+            self._cache.invalidar()
+            return None
+        try:
+            cambiadas, eliminadas = self.dao.leer_cambios(marca)
+            # Después de los cambios: una purga hecha mientras se leían también se detecta
+            horizonte = self.dao.leer_horizonte_eliminadas()
+        except Exception as e:
+            # Normalmente un esquema sin columnas Version: se sigue sin caché en esta sesión
+            print(f"Advertencia: no se pudieron leer los cambios para la caché local ({e}).")
+            self._cache = None
+            return None
+        if horizonte is not None and marca <= horizonte:
+            # Los borrados posteriores a la marca pueden estar entre los ya purgados del servidor
+            print("La caché local es anterior a los borrados purgados en el servidor; se descarta.")
+            self._cache.invalidar()
+            return None
+        return marca_nueva, cambiadas, eliminadas
+
+    def actualizar_cache(self):
+        """
+        Pone al día la copia local con lo que cambió en el servidor desde su marca (las escrituras
+        de esta sesión y las de otros clientes) y la sella con la marca actual, para que la próxima
+        carga solo pida lo posterior. Sin copia válida (p. ej. con la primera carga perezosa a
+        medias) no hace nada. Retorna True si la copia quedó al día.
+        """
+        if self._cache is None or not self.db_conectada:
+            return False
+        try:
+            marca = self._cache.leer_marca()
+            if marca is None:
+                return False
+            delta = self._leer_cambios_cache(marca)
+            if delta is None:
+                return False
+            self._cache.aplicar_cambios(*delta)
+            return True
+        except (sqlite3.Error, ConnectionError) as e:
+            print(f"Advertencia: no se pudo poner al día la caché local: {e}")
+            return False
+
+    def _guardar_cache(self):
+        """Guarda la colección recién cargada en la copia local, sellada con la marca previa a la carga."""
+        marca, self._marca_carga = self._marca_carga, None
+        filas = []
+        for evaluacion in self.evaluaciones:
+            # Las altas sin ID conocido (p. ej. diferidas) llegarán como cambio en la próxima carga
+            evaluacion_id = self.evaluaciones.obtener_id(evaluacion.nombre)
+            if evaluacion_id is not None:
+                filas.append((evaluacion_id, evaluacion))
+        try:
+            self._cache.guardar(marca, filas)
+        except sqlite3.Error as e:
+            print(f"Advertencia: no se pudo guardar la caché local: {e}")
+
+    @property
+    def carga_completa(self):
+        """True cuando ya no quedan páginas por leer de la base de datos."""
+        return self._paginas_pendientes is None
+
+    def cargar_todas(self):
+        """Termina la carga perezosa leyendo todas las páginas pendientes."""
+        while not self.carga_completa:
+            self.cargar_siguiente_pagina()
 
     def buscar_evaluacion_por_nombre(self, nombre: str):
         """Busca y retorna una evaluación por su nombre."""
-        # Esta operación no requiere DB, opera sobre la lista en memoria
-        for eval_obj in self.evaluaciones:
-            if eval_obj.nombre == nombre:
-                return eval_obj
-        return None
+        # Esta operación no requiere DB, usa el índice por nombre en memoria
+        return self.evaluaciones.obtener(nombre)
 
     def actualizar_evaluacion(self, nombre_original: str, evaluacion_actualizada: Evaluacion):
         """
         Actualiza una evaluación existente en la base de datos y en la lista en memoria.
+        Solo se escriben las columnas que cambiaron: un UPDATE sobre Evaluaciones y otro sobre
+        la tabla del subtipo (o, si cambió el tipo, el traslado de la fila a la nueva tabla),
+        todo en una sola transacción. Si nada cambió no se escribe en la base de datos.
         """
         if not self.db_conectada:
             print("Error: No hay conexión a la base de datos. No se puede actualizar la evaluación.")
             return False
-        conexion = None
-        cursor = None
-        try:
-            conexion = Conexion.obtenerConexion()
-            cursor = Conexion.obtenerCursor()
+        if self._escritura_diferida is not None:
+            return self._actualizar_diferido(nombre_original, evaluacion_actualizada)
 
-            # 1. Obtener el EvaluacionID de la evaluación original
-            sql_get_id = "SELECT EvaluacionID FROM Evaluaciones WHERE Nombre = ?"
-            cursor.execute(sql_get_id, nombre_original)
-            result = cursor.fetchone()
-
-            if result is None:
-                print(f"Evaluación original '{nombre_original}' no encontrada para actualizar.")
-                return False
+        anterior = self.evaluaciones.obtener(nombre_original)
+        if nombre_original != evaluacion_actualizada.nombre and evaluacion_actualizada.nombre in self.evaluaciones:
+            print(f"El nuevo nombre '{evaluacion_actualizada.nombre}' ya está en uso por otra evaluación.")
+            return False
+        if isinstance(evaluacion_actualizada, Trabajo) and self._tema_en_uso(evaluacion_actualizada.tema, excepto=anterior):
+            print(f"Ya existe un Trabajo con el tema '{evaluacion_actualizada.tema}'.")
+            return False
 
-            evaluacion_id = result[0]
-
-            # Verificar si el nuevo nombre ya existe para otra evaluación (si el nombre ha cambiado)
-            if nombre_original != evaluacion_actualizada.nombre:
-                sql_check_name = "SELECT EvaluacionID FROM Evaluaciones WHERE Nombre = ? AND EvaluacionID != ?"
-                cursor.execute(sql_check_name, evaluacion_actualizada.nombre, evaluacion_id)
-                if cursor.fetchone():
-                    print(f"El nuevo nombre '{evaluacion_actualizada.nombre}' ya está en uso por otra evaluación.")
-                    return False  # El nuevo nombre ya existe para otra evaluación
-
-            # 2. Actualizar en la tabla base 'Evaluaciones'
-            sql_update_base = """
-             UPDATE Evaluaciones SET Nombre = ?, Fecha = ?, Puntaje = ?, TipoEvaluacion = ?
-             WHERE EvaluacionID = ?
-             """
-            parametros_update_base = (
-                evaluacion_actualizada.nombre,
-                evaluacion_actualizada.fecha,
-                evaluacion_actualizada.puntaje,
-                evaluacion_actualizada.__class__.__name__,
-                evaluacion_id
-            )
-            cursor.execute(sql_update_base, parametros_update_base)
-
-            # 3. Actualizar o insertar en la tabla específica del tipo de evaluación
-            # Primero, eliminar el registro antiguo si el tipo de evaluación cambió
-            # (o simplemente si siempre quieres una operación de upsert para los subtipos)
-            cursor.execute("DELETE FROM Examenes WHERE EvaluacionID = ?", evaluacion_id)
-            cursor.execute("DELETE FROM Trabajos WHERE EvaluacionID = ?, Tema = ?", evaluacion_id, evaluacion_actualizada.tema) # Update: Added Tema to deletion for Trabajos
-            cursor.execute("DELETE FROM Presentaciones WHERE EvaluacionID = ?", evaluacion_id)
-
-            if isinstance(evaluacion_actualizada, Examen):
-                sql_tipo = """
-                 INSERT INTO Examenes (EvaluacionID, Duracion, NumPreguntas)
-                 VALUES (?, ?, ?)
-                 """
-                parametros_tipo = (
-                    evaluacion_id,
-                    evaluacion_actualizada.duracion_min,
-                    evaluacion_actualizada.num_preguntas
-                )
-                cursor.execute(sql_tipo, parametros_tipo)
-            elif isinstance(evaluacion_actualizada, Trabajo):
-                sql_tipo = """
-                 INSERT INTO Trabajos (EvaluacionID, NumPaginas, Tema)
-                 VALUES (?, ?, ?)
-                 """
-                parametros_tipo = (
-                    evaluacion_id,
-                    evaluacion_actualizada.num_paginas,
-                    evaluacion_actualizada.tema
-                )
-                cursor.execute(sql_tipo, parametros_tipo)
-            elif isinstance(evaluacion_actualizada, Presentacion):
-                sql_tipo = """
-                 INSERT INTO Presentaciones (EvaluacionID, Duracion, TamanoAudiencia)
-                 VALUES (?, ?, ?)
-                 """
-                parametros_tipo = (
-                    evaluacion_id,
-                    evaluacion_actualizada.duracion_min,
-                    evaluacion_actualizada.tamano_audiencia
-                )
-                cursor.execute(sql_tipo, parametros_tipo)
-
-            conexion.commit()  # Confirmar la transacción
-            print(f"Evaluación '{evaluacion_actualizada.nombre}' (ID: {evaluacion_id}) actualizada exitosamente en DB.")
-
-            # 4. Actualizar la lista en memoria
-            for i, eval_obj in enumerate(self.evaluaciones):
-                if eval_obj.nombre == nombre_original:
-                    self.evaluaciones[i] = evaluacion_actualizada
-                    print(f"Evaluación '{nombre_original}' actualizada en memoria a '{evaluacion_actualizada.nombre}'.")
-                    break
+        cambios_base, cambios_subtipo = self.dao.cambios_evaluacion(anterior, evaluacion_actualizada)
+        if not cambios_base and not cambios_subtipo:
+            print(f"Evaluación '{nombre_original}' sin cambios; no se escribe en la DB.")
             return True
 
-        except bd.Error as ex:
-            sqlstate = ex.args[0]
-            if conexion:
-                conexion.rollback()  # Revertir la transacción en caso de error
-            print(f"Error SQLSTATE al actualizar evaluación: {sqlstate}. Mensaje: {ex.args[1]}")
+        try:
+            evaluacion_id = self.dao.actualizar_evaluacion_bd(nombre_original, anterior, evaluacion_actualizada,
+                                                             self.evaluaciones.obtener_id(nombre_original))
+        except ValueError as e:  # Nombre o tema ya usados por otra evaluación
+            print(e)
             return False
         except Exception as e:
-            if conexion:
-                conexion.rollback()
-            print(f"Error inesperado al actualizar evaluación: {e}")
+            print(f"Error al actualizar evaluación: {e}")
+            return False
+        if evaluacion_id is None:
+            print(f"Evaluación original '{nombre_original}' no encontrada para actualizar.")
             return False
-        finally:
-            Conexion.cerrarConexion()
\ No newline at end of file
+        print(f"Evaluación '{evaluacion_actualizada.nombre}' (ID: {evaluacion_id}) actualizada exitosamente en DB.")
+
+        self._estadisticas_servidor.invalidar()
+        # Actualizar la colección en memoria (conserva la posición aunque cambie el nombre)
+        if self.evaluaciones.reemplazar(nombre_original, evaluacion_actualizada, evaluacion_id) is not None:
+            print(f"Evaluación '{nombre_original}' actualizada en memoria a '{evaluacion_actualizada.nombre}'.")
+        return True
@@ -0,0 +1,256 @@
+# src/servicio/importador_json.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import codecs
+import json
+import os
+from datetime import date
+
+from src.dominio.examen import Examen
+from src.dominio.presentacion import Presentacion
+from src.dominio.trabajo import Trabajo
+
+
+def iterar_registros_json(archivo, tamano_bloque=64 * 1024):
+    """
+    Recorre un arreglo JSON de nivel superior leyendo el archivo (abierto en modo binario)
+    por bloques y entrega cada elemento en cuanto está completo, sin cargar el archivo entero.
+    """
+    decodificador = json.JSONDecoder()
+    decodificador_utf8 = codecs.getincrementaldecoder('utf-8-sig')()
+    buffer = ''
+    pos = 0
+    fin_archivo = False
+
+    def leer_mas():
+        nonlocal buffer, pos, fin_archivo
+        bloque = archivo.read(tamano_bloque)
+        if not bloque:
+            fin_archivo = True
+            buffer = buffer[pos:] + decodificador_utf8.decode(b'', final=True)
+        else:
+            buffer = buffer[pos:] + decodificador_utf8.decode(bloque)
+        pos = 0
+
+    def saltar_espacios():
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n':
+                pos += 1
+            if pos < len(buffer) or fin_archivo:
+                return
+            leer_mas()
+
+    saltar_espacios()
+    if pos >= len(buffer) or buffer[pos] != '[':
+        raise ValueError("El archivo JSON debe contener un arreglo de evaluaciones.")
+    pos += 1
+
+    esperando_elemento = True
+    while True:
+        saltar_espacios()
+        if pos >= len(buffer):
+            raise ValueError("El arreglo JSON está incompleto.")
+        if buffer[pos] == ']':
+            return
+        if not esperando_elemento:
+            if buffer[pos] != ',':
+                raise ValueError(f"Se esperaba ',' o ']' en el arreglo JSON, se encontró '{buffer[pos]}'.")
+            pos += 1
+            saltar_espacios()
+
+        # Un valor que termina justo al final del buffer puede estar truncado (p. ej. un número),
+        # así que solo se acepta cuando queda texto detrás o el archivo ya terminó.
+        while True:
+            try:
+                valor, fin = decodificador.raw_decode(buffer, pos)
+                if fin < len(buffer) or fin_archivo:
+                    break
+            except json.JSONDecodeError:
+                if fin_archivo:
+                    raise
+            leer_mas()
+        pos = fin
+        esperando_elemento = False
+        yield valor
+
+
+def evaluacion_a_dict(eval_obj):
+    """Diccionario serializable de una evaluación (formato de los archivos JSON exportados)."""
+    eval_dict = eval_obj.to_dict()
+    # En los archivos el tipo es el nombre de la clase ("Presentacion" sin tilde, como en la DB)
+    eval_dict['tipo'] = eval_obj.__class__.__name__
+    return eval_dict
+
+
+def evaluacion_desde_dict(eval_dict):
+    """
+    Construye un Examen, Trabajo o Presentacion a partir de un diccionario exportado.
+    Levanta ValueError/TypeError si los datos no superan las validaciones del dominio.
+    """
+    nombre = eval_dict['nombre']
+    fecha = date.fromisoformat(eval_dict['fecha'])
+    puntaje = eval_dict['puntaje']
+    tipo = eval_dict['tipo']
+
+    if tipo == "Examen":
+        return Examen(nombre, fecha, puntaje,
+                      eval_dict.get('duracion_min', 0),
+                      eval_dict.get('num_preguntas', 0))
+    elif tipo == "Trabajo":
+        return Trabajo(nombre, fecha, puntaje,
+                       eval_dict.get('num_paginas', 0),
+                       eval_dict.get('tema', ''))
+    elif tipo in ("Presentacion", "Presentación"):
+        return Presentacion(nombre, fecha, puntaje,
+                            eval_dict.get('duracion_min', 0),
+                            eval_dict.get('tamano_audiencia', 0))
+    raise ValueError(f"Tipo de evaluación desconocido '{tipo}'.")
+
+
+class ImportadorEvaluaciones:
+    """
+    Importa evaluaciones desde un archivo JSON (o una instantánea binaria .evb, o un archivo
+    Parquet) en memoria acotada: los registros se leen en streaming, se validan como objetos de dominio y se
+    envían al gestor por lotes.
+    """
+    MAX_ERRORES_REPORTADOS = 20
+
+    def __init__(self, gestor, tamano_lote=1000, progreso=None, cancelado=None):
+        if tamano_lote < 1:
+            raise ValueError("El tamaño de lote debe ser al menos 1.")
+        self.gestor = gestor
+        self.tamano_lote = tamano_lote
+        # progreso(bytes_leidos, bytes_totales, importadas) se llama tras cada lote
+        self.progreso = progreso
+        # cancelado() se consulta antes de cada lote; si retorna True la importación se detiene
+        self.cancelado = cancelado
+        # True durante la pasada de comprobación de importar(reemplazar=True), que no guarda nada
+        self.validando = False
+        self._cancelable = True
+
+    def importar(self, ruta, reemplazar=False):
+        """
+        Importa el archivo indicado y retorna un resumen con las evaluaciones importadas,
+        las rechazadas y los primeros mensajes de error. Si se cancela, los lotes ya
+        guardados se conservan y el resumen lo indica con 'cancelada'.
+
+        Con reemplazar=True las evaluaciones actuales se borran solo después de recorrer el
+        archivo completo sin errores de formato, en una primera pasada que no guarda nada: si
+        falla o se cancela, no se borra nada. Una vez borradas ya no se atiende la cancelación,
+        para no dejar la base de datos a medias.
+        """
+        if not reemplazar:
+            return self._importar(ruta)
+        self.validando = True
+        try:
+            comprobacion = self._importar(ruta)
+        finally:
+            self.validando = False
+        if comprobacion['cancelada']:
+            comprobacion['importadas'] = 0
+            return comprobacion
+        self.gestor.limpiar_todas_las_evaluaciones()
+        self._cancelable = False
+        try:
+            return self._importar(ruta)
+        finally:
+            self._cancelable = True
+
+    def _importar(self, ruta):
+        resumen = {'importadas': 0, 'rechazadas': 0, 'errores': [], 'cancelada': False}
+        if os.path.splitext(ruta)[1].lower() == '.evb':
+            return self._importar_instantanea(ruta, resumen)
+        if os.path.splitext(ruta)[1].lower() == '.parquet':
+            return self._importar_parquet(ruta, resumen)
+        bytes_totales = os.path.getsize(ruta)
+        lote = []
+
+        with open(ruta, 'rb') as archivo:
+            for indice, eval_dict in enumerate(iterar_registros_json(archivo)):
+                try:
+                    lote.append(evaluacion_desde_dict(eval_dict))
+                except (KeyError, ValueError, TypeError) as e:
+                    self._registrar_error(resumen, 1, f"Registro {indice}: {e!r}")
+                    continue
+                if len(lote) >= self.tamano_lote:
+                    if self._se_cancelo():
+                        resumen['cancelada'] = True
+                        return resumen
+                    self._vaciar_lote(lote, resumen)
+                    self._notificar(archivo.tell(), bytes_totales, resumen)
+            self._vaciar_lote(lote, resumen)
+            self._notificar(bytes_totales, bytes_totales, resumen)
+        return resumen
+
+    def _importar_instantanea(self, ruta, resumen):
+        """Igual que importar() para una instantánea binaria; el progreso se informa en filas."""
+        # Importación diferida: NumPy solo es necesario para las instantáneas binarias
+        from src.servicio.instantanea_binaria import InstantaneaEvaluaciones
+        lote = []
+        with InstantaneaEvaluaciones(ruta) as instantanea:
+            filas = len(instantanea)
+            for indice in range(filas):
+                try:
+                    lote.append(instantanea[indice])
+                except (ValueError, TypeError) as e:
+                    self._registrar_error(resumen, 1, f"Registro {indice}: {e!r}")
+                    continue
+                if len(lote) >= self.tamano_lote:
+                    if self._se_cancelo():
+                        resumen['cancelada'] = True
+                        return resumen
+                    self._vaciar_lote(lote, resumen)
+                    self._notificar(indice + 1, filas, resumen)
+            self._vaciar_lote(lote, resumen)
+            self._notificar(filas, filas, resumen)
+        return resumen
+
+    def _importar_parquet(self, ruta, resumen):
+        """
+        Igual que importar() para un archivo Parquet: cada lote leído (del tamaño de los lotes
+        del gestor) va directo a agregar_evaluaciones_lote. El progreso se informa en filas.
+        """
+        from src.servicio.archivo_parquet import evaluacion_desde_fila, filas_parquet, iterar_lotes_parquet
+        filas = filas_parquet(ruta)
+        leidas = 0
+        for filas_lote in iterar_lotes_parquet(ruta, tamano_lote=self.tamano_lote):
+            if self._se_cancelo():
+                resumen['cancelada'] = True
+                return resumen
+            lote = []
+            for fila in filas_lote:
+                try:
+                    lote.append(evaluacion_desde_fila(fila))
+                except (KeyError, ValueError, TypeError) as e:
+                    self._registrar_error(resumen, 1, f"Registro {leidas + len(lote)}: {e!r}")
+            leidas += len(filas_lote)
+            self._vaciar_lote(lote, resumen)
+            self._notificar(leidas, filas, resumen)
+        self._notificar(filas, filas, resumen)
+        return resumen
+
+    def _se_cancelo(self):
+        return self._cancelable and self.cancelado is not None and self.cancelado()
+
+    def _vaciar_lote(self, lote, resumen):
+        if not lote:
+            return
+        if self.validando:  # Solo se comprueba el archivo; cuentan como importables
+            resumen['importadas'] += len(lote)
+            lote.clear()
+            return
+        agregadas = self.gestor.agregar_evaluaciones_lote(lote)
+        resumen['importadas'] += agregadas
+        if agregadas < len(lote):
+            self._registrar_error(resumen, len(lote) - agregadas,
+                                  f"Lote desde '{lote[0].nombre}' rechazado por la base de datos.")
+        lote.clear()
+
+    def _registrar_error(self, resumen, cantidad, mensaje):
+        resumen['rechazadas'] += cantidad
+        if len(resumen['errores']) < self.MAX_ERRORES_REPORTADOS:
+            resumen['errores'].append(mensaje)
+
+    def _notificar(self, bytes_leidos, bytes_totales, resumen):
+        if self.progreso:
+            self.progreso(bytes_leidos, bytes_totales, resumen['importadas'])
@@ -0,0 +1,237 @@
+# src/servicio/indice_busqueda.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import threading
+import unicodedata
+from collections import defaultdict
+
+from src.servicio.indices_evaluaciones import tipo_de
+from src.servicio.lista_ordenada import ListaOrdenada
+
+# Longitud de los fragmentos del índice invertido; las consultas más cortas solo buscan por prefijo
+LONGITUD_NGRAMA = 3
+
+# Letras acentuadas del español sin la marca, para no descomponer en Unicode los textos habituales
+_SIN_ACENTOS = str.maketrans("áéíóúüñÁÉÍÓÚÜÑ", "aeiouunAEIOUUN")
+
+# Une el nombre y el tema normalizados en un solo texto por evaluación; al no poder escribirse en
+# una consulta, ninguna coincidencia abarca los dos campos
+_SEPARADOR = "\x1f"
+
+
+def normalizar_texto(texto):
+    """
+    Texto en minúsculas y sin tildes ni diéresis ("Presentación" -> "presentacion"), para
+    comparar sin distinguir mayúsculas ni acentos.
+    """
+    texto = texto.translate(_SIN_ACENTOS)
+    if texto.isascii():
+        return texto.lower()  # Caso habitual: no quedan marcas que quitar
+    descompuesto = unicodedata.normalize('NFKD', texto.casefold())
+    return ''.join(c for c in descompuesto if not unicodedata.combining(c))
+
+
+def _ngramas(texto):
+    return {texto[i:i + LONGITUD_NGRAMA] for i in range(len(texto) - LONGITUD_NGRAMA + 1)}
+
+
+class IndiceBusqueda:
+    """
+    Índice de búsqueda de texto sobre el nombre de cada evaluación y el tema de los Trabajos,
+    sin distinguir mayúsculas ni acentos:
+    - prefijos: los textos normalizados en una ListaOrdenada, así que los que empiezan por la
+      consulta forman un tramo contiguo que se encuentra en O(log n) (el mismo recorrido que un
+      trie, sin un diccionario por carácter en memoria);
+    - subcadenas: índice invertido de trigramas -> secuencias; se recorre la lista más corta
+      de entre los trigramas de la consulta y se comprueba cada candidata;
+    - temas exactos: tema -> Trabajos que lo usan, para validar la unicidad sin ir a la base de datos.
+
+    Se registra como índice de AlmacenEvaluaciones. Las listas de trigramas solo crecen: las
+    entradas de evaluaciones borradas o cambiadas se descartan al comprobar las candidatas y se
+    compactan cuando superan a las vigentes. Un candado permite consultar desde el hilo de la
+    interfaz mientras el hilo de escrituras modifica la colección.
+    """
+    def __init__(self):
+        self._candado = threading.Lock()
+        self._textos = {}             # secuencia -> (evaluacion, nombre y tema normalizados, ver _SEPARADOR)
+        self._prefijos = ListaOrdenada()  # (texto normalizado, secuencia)
+        self._ngramas = defaultdict(list)  # trigrama -> [secuencias] (con entradas obsoletas o repetidas)
+        self._entradas = 0            # total de secuencias en las listas de trigramas
+        self._vigentes = 0            # de ellas, las que corresponden a un texto actual
+        self._trabajos_por_tema = {}  # tema (sin normalizar) -> {secuencia: Trabajo}
+
+    # --- Interfaz de índice de AlmacenEvaluaciones ---
+    def agregar(self, secuencia, evaluacion):
+        with self._candado:
+            self._agregar(secuencia, evaluacion, None)
+
+    def eliminar(self, secuencia, evaluacion):
+        with self._candado:
+            self._eliminar(secuencia, evaluacion)
+            self._compactar_si_conviene()
+
+    def eliminar_varios(self, pares):
+        with self._candado:
+            for secuencia, evaluacion in pares:
+                self._eliminar(secuencia, evaluacion)
+            self._compactar_si_conviene()
+
+    def reemplazar(self, secuencia, anterior, nueva):
+        with self._candado:
+            ngramas_anteriores = _ngramas(self._textos[secuencia][1])
+            self._eliminar(secuencia, anterior)
+            # Los trigramas que ya tenía siguen en sus listas: solo se añaden los nuevos
+            self._agregar(secuencia, nueva, ngramas_anteriores)
+            self._compactar_si_conviene()
+
+    def limpiar(self):
+        with self._candado:
+            self._textos.clear()
+            self._prefijos.limpiar()
+            self._ngramas.clear()
+            self._entradas = self._vigentes = 0
+            self._trabajos_por_tema.clear()
+
+    # --- Mantenimiento (con el candado tomado) ---
+    def _agregar(self, secuencia, evaluacion, ya_indexados):
+        texto = nombre = normalizar_texto(evaluacion.nombre)
+        self._prefijos.agregar((nombre, secuencia))
+        if tipo_de(evaluacion) == "Trabajo":
+            tema = normalizar_texto(evaluacion.tema)
+            self._prefijos.agregar((tema, secuencia))
+            self._trabajos_por_tema.setdefault(evaluacion.tema, {})[secuencia] = evaluacion
+            texto = nombre + _SEPARADOR + tema
+        self._textos[secuencia] = (evaluacion, texto)
+        ngramas = _ngramas(texto)
+        nuevos = ngramas - ya_indexados if ya_indexados else ngramas
+        listas = self._ngramas
+        for ngrama in nuevos:
+            listas[ngrama].append(secuencia)
+        self._entradas += len(nuevos)
+        self._vigentes += len(ngramas)
+
+    def _eliminar(self, secuencia, evaluacion):
+        _, texto = self._textos.pop(secuencia)
+        nombre, _, tema = texto.partition(_SEPARADOR)
+        self._prefijos.eliminar((nombre, secuencia))
+        if tema:
+            self._prefijos.eliminar((tema, secuencia))
+            trabajos = self._trabajos_por_tema[evaluacion.tema]
+            del trabajos[secuencia]
+            if not trabajos:
+                del self._trabajos_por_tema[evaluacion.tema]
+        self._vigentes -= len(_ngramas(texto))
+
+    def _compactar_si_conviene(self):
+        """Reconstruye las listas de trigramas cuando las entradas obsoletas superan a las vigentes."""
+        if self._entradas <= 2 * self._vigentes + 1000:
+            return
+        self._ngramas = listas = defaultdict(list)
+        for secuencia, (_, texto) in self._textos.items():
+            for ngrama in _ngramas(texto):
+                listas[ngrama].append(secuencia)
+        self._entradas = self._vigentes
+
+    # --- Consultas ---
+    def buscar(self, texto, limite=50):
+        """
+        Evaluaciones cuyo nombre o tema contiene 'texto' (sin distinguir mayúsculas ni acentos),
+        como mucho 'limite'. Primero las que empiezan por el texto, en orden alfabético; después
+        las que lo contienen en otra posición, en orden de inserción. Con menos de tres caracteres
+        solo se buscan prefijos.
+        """
+        consulta = normalizar_texto(texto.strip())
+        if not consulta or limite <= 0:
+            return []
+        with self._candado:
+            encontradas = {}  # secuencia -> evaluacion, en el orden del resultado
+            for _, secuencia in self._prefijos.rango((consulta,), (consulta + '\U0010ffff',)):
+                if secuencia not in encontradas:
+                    encontradas[secuencia] = self._textos[secuencia][0]
+                    if len(encontradas) >= limite:
+                        return list(encontradas.values())
+            if len(consulta) >= LONGITUD_NGRAMA:
+                self._buscar_subcadena(consulta, encontradas, limite)
+            return list(encontradas.values())
+
+    def _buscar_subcadena(self, consulta, encontradas, limite):
+        listas = [self._ngramas.get(ngrama) for ngrama in _ngramas(consulta)]
+        if not all(listas):
+            return  # Algún trigrama no aparece en ningún texto
+        leer = self._textos.get
+        for secuencia in min(listas, key=len):
+            candidata = leer(secuencia)  # None si la evaluación ya no existe
+            if candidata is not None and consulta in candidata[1] and secuencia not in encontradas:
+                encontradas[secuencia] = candidata[0]
+                if len(encontradas) >= limite:
+                    return
+
+    def trabajos_con_tema(self, tema):
+        """Trabajos en memoria cuyo tema es exactamente 'tema'."""
+        with self._candado:
+            return list(self._trabajos_por_tema.get(tema, {}).values())
+
+
+# Benchmark: búsqueda mientras se escribe sobre 1M de evaluaciones, frente a recorrer la colección.
+if __name__ == '__main__':
+    import random
+    import time
+    from datetime import date
+
+    from src.dominio.examen import Examen
+    from src.dominio.trabajo import Trabajo
+
+    N = 1_000_000
+    palabras = ["álgebra", "cálculo", "física", "química", "historia", "programación", "redes",
+                "bases de datos", "estadística", "ética", "inglés", "diseño"]
+    evaluaciones = []
+    for i in range(N):
+        palabra = palabras[i % len(palabras)]
+        if i % 3 == 0:
+            evaluaciones.append(Trabajo(f"Trabajo {i}", date(2025, 1, 1), 80.0, 10,
+                                        f"Informe de {palabra} número {i}"))
+        else:
+            evaluaciones.append(Examen(f"Examen {palabra} {i}", date(2025, 1, 1), 70.0, 60, 20))
+
+    indice = IndiceBusqueda()
+    inicio = time.perf_counter()
+    for secuencia, evaluacion in enumerate(evaluaciones):
+        indice.agregar(secuencia, evaluacion)
+    print(f"Índice de {N} evaluaciones construido en {time.perf_counter() - inicio:.1f} s")
+
+    # Comprobación contra un recorrido completo de la colección
+    textos = [(e.nombre, normalizar_texto(e.nombre) + "\n" + (normalizar_texto(e.tema) if isinstance(e, Trabajo) else ""))
+              for e in evaluaciones]
+    for consulta in ("Exa", "algebra", "QUIMICA 9", "numero 12345", "cion 99", "zzz"):
+        normalizada = normalizar_texto(consulta)
+        esperadas = {nombre for nombre, texto in textos if normalizada in texto}
+        halladas = {e.nombre for e in indice.buscar(consulta, limite=N)}
+        assert halladas == esperadas, consulta
+    assert [e.nombre for e in indice.trabajos_con_tema("Informe de álgebra número 0")] == ["Trabajo 0"]
+
+    consultas = ["e", "ex", "exa", "fisi", "Estadistica 4", "programacion 12", "número 99", "de 7",
+                 "redes 123456", "informe de etica", "trabajo 99999", "no existe"]
+    consultas += [f"{random.randrange(N)}" for _ in range(20)]
+    tiempos = []
+    for consulta in consultas:
+        for i in range(1, len(consulta) + 1):  # Una consulta por cada tecla pulsada
+            inicio = time.perf_counter()
+            indice.buscar(consulta[:i], limite=50)
+            tiempos.append(time.perf_counter() - inicio)
+    tiempos.sort()
+    print(f"{len(tiempos)} búsquedas (límite 50): mediana {tiempos[len(tiempos) // 2] * 1000:.3f} ms, "
+          f"p99 {tiempos[int(len(tiempos) * 0.99)] * 1000:.3f} ms, máximo {tiempos[-1] * 1000:.3f} ms")
+
+    inicio = time.perf_counter()
+    normalizada = normalizar_texto("programacion 12")
+    [e for e in evaluaciones if normalizada in normalizar_texto(e.nombre)]
+    print(f"Recorrido completo para una búsqueda: {(time.perf_counter() - inicio) * 1000:.0f} ms")
+
+    # Bajas y cambios: las entradas obsoletas no aparecen y se compactan
+    for secuencia in range(0, N, 2):
+        indice.eliminar(secuencia, evaluaciones[secuencia])
+    assert all(int(e.nombre.split()[-1]) % 2 for e in indice.buscar("examen", limite=1000))
+    nueva = Trabajo("Renombrado", date(2025, 1, 1), 80.0, 10, "Tema único")
+    indice.reemplazar(1, evaluaciones[1], nueva)
+    assert indice.buscar("tema unico") == [nueva] and indice.buscar("unico") == [nueva]
+    assert evaluaciones[1] not in indice.buscar(evaluaciones[1].nombre, limite=N)
+    print("Bajas, cambios y compactación: OK")
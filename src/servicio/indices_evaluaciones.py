@@ -0,0 +1,101 @@
+# src/servicio/indices_evaluaciones.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+from src.servicio.lista_ordenada import ListaOrdenada
+
+# Tipos tal como se guardan en la columna TipoEvaluacion (nombre de la clase de dominio)
+TIPOS_EVALUACION = ("Examen", "Trabajo", "Presentacion")
+
+
+def normalizar_tipo(tipo):
+    """
+    Convierte el texto de tipo que muestra la UI ("Presentación") al nombre de clase
+    usado en la base de datos y en los índices ("Presentacion").
+    """
+    return "Presentacion" if tipo == "Presentación" else tipo
+
+
+def tipo_de(evaluacion):
+    return evaluacion.__class__.__name__
+
+
+class IndiceTipoFecha:
+    """
+    Índices secundarios de AlmacenEvaluaciones:
+    - cubetas por tipo, en orden de inserción, para filtrar por tipo en O(k);
+    - índices ordenados por fecha (global y por tipo) para rangos de fechas en O(log n + k).
+    Las entradas de fecha son tuplas (fecha, secuencia, evaluacion); la secuencia del almacén
+    desempata y hace que cada entrada sea única.
+    """
+    def __init__(self):
+        self._por_tipo = {tipo: {} for tipo in TIPOS_EVALUACION}  # tipo -> {secuencia: evaluacion}
+        self._fechas = ListaOrdenada()
+        self._fechas_por_tipo = {tipo: ListaOrdenada() for tipo in TIPOS_EVALUACION}
+
+    def agregar(self, secuencia, evaluacion):
+        tipo = tipo_de(evaluacion)
+        entrada = (evaluacion.fecha, secuencia, evaluacion)
+        self._por_tipo.setdefault(tipo, {})[secuencia] = evaluacion
+        self._fechas.agregar(entrada)
+        self._fechas_por_tipo.setdefault(tipo, ListaOrdenada()).agregar(entrada)
+
+    def eliminar(self, secuencia, evaluacion):
+        tipo = tipo_de(evaluacion)
+        entrada = (evaluacion.fecha, secuencia, evaluacion)
+        del self._por_tipo[tipo][secuencia]
+        self._fechas.eliminar(entrada)
+        self._fechas_por_tipo[tipo].eliminar(entrada)
+
+    def eliminar_varios(self, pares):
+        entradas_por_tipo = {}
+        for secuencia, evaluacion in pares:
+            tipo = tipo_de(evaluacion)
+            del self._por_tipo[tipo][secuencia]
+            entradas_por_tipo.setdefault(tipo, []).append((evaluacion.fecha, secuencia, evaluacion))
+        for tipo, entradas in entradas_por_tipo.items():
+            self._fechas_por_tipo[tipo].eliminar_varios(entradas)
+        self._fechas.eliminar_varios([e for entradas in entradas_por_tipo.values() for e in entradas])
+
+    def reemplazar(self, secuencia, anterior, nueva):
+        if tipo_de(anterior) == tipo_de(nueva):
+            # Mismo tipo: la cubeta conserva la posición de la fila
+            self._por_tipo[tipo_de(nueva)][secuencia] = nueva
+            tipo = tipo_de(nueva)
+            entrada_anterior = (anterior.fecha, secuencia, anterior)
+            entrada_nueva = (nueva.fecha, secuencia, nueva)
+            self._fechas.eliminar(entrada_anterior)
+            self._fechas.agregar(entrada_nueva)
+            self._fechas_por_tipo[tipo].eliminar(entrada_anterior)
+            self._fechas_por_tipo[tipo].agregar(entrada_nueva)
+        else:
+            self.eliminar(secuencia, anterior)
+            self.agregar(secuencia, nueva)
+
+    def limpiar(self):
+        for cubeta in self._por_tipo.values():
+            cubeta.clear()
+        self._fechas.limpiar()
+        for fechas in self._fechas_por_tipo.values():
+            fechas.limpiar()
+
+    def contar(self, tipo):
+        return len(self._por_tipo.get(normalizar_tipo(tipo), ()))
+
+    def filtrar(self, tipo=None, desde=None, hasta=None):
+        """
+        Evaluaciones del tipo indicado (None = todos) cuya fecha está en [desde, hasta].
+        Sin rango de fechas se devuelven en orden de inserción dentro de cada tipo;
+        con rango, ordenadas por fecha.
+        """
+        tipo = normalizar_tipo(tipo) if tipo is not None else None
+        if desde is None and hasta is None:
+            if tipo is None:
+                return [e for cubeta in self._por_tipo.values() for e in cubeta.values()]
+            return list(self._por_tipo.get(tipo, {}).values())
+
+        fechas = self._fechas if tipo is None else self._fechas_por_tipo.get(tipo)
+        if fechas is None:
+            return []
+        minimo = (desde,) if desde is not None else None
+        # (hasta, inf) es mayor que cualquier entrada de esa fecha, así que el límite es inclusivo
+        maximo = (hasta, float('inf')) if hasta is not None else None
+        return [evaluacion for _, _, evaluacion in fechas.rango(minimo, maximo, (True, False))]
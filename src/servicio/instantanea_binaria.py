@@ -0,0 +1,284 @@
+# src/servicio/instantanea_binaria.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import mmap
+import os
+import struct
+from datetime import date
+
+import numpy as np
+
+from src.dominio.examen import Examen
+from src.dominio.presentacion import Presentacion
+from src.dominio.trabajo import Trabajo
+from src.servicio.almacen_columnar import CODIGOS_TIPO, EXAMEN, TRABAJO, SIN_TEMA, AlmacenColumnar
+from src.servicio.indices_evaluaciones import tipo_de
+
+# Formato de instantánea binaria (todo en little-endian):
+#   cabecera   MAGIA, versión u16, reservado u16 + u32, filas u64, temas u64,
+#              bytes del montículo de nombres u64, bytes del montículo de temas u64
+#   columnas   puntaje f8, fecha i4 (ordinal), duracion i4, num_preguntas i4, num_paginas i4,
+#              tamano_audiencia i4, tema i4 (índice en la tabla de temas o SIN_TEMA), tipo i1,
+#              inicio_nombre u8 (filas + 1), inicio_tema u8 (temas + 1)
+#   montículos nombres y temas en UTF-8, cada cadena seguida de un byte 0
+# Cada columna empieza en un múltiplo de 8 bytes, así que np.frombuffer la lee alineada sin copiarla.
+MAGIA = b'EVALSNAP'
+VERSION = 1
+EXTENSION = '.evb'
+_CABECERA = struct.Struct('<8sHHIQQQQ')
+_COLUMNAS_FILA = (('puntaje', '<f8'), ('fecha', '<i4'), ('duracion', '<i4'), ('num_preguntas', '<i4'),
+                  ('num_paginas', '<i4'), ('tamano_audiencia', '<i4'), ('tema', '<i4'), ('tipo', '<i1'))
+
+
+def es_instantanea(ruta):
+    return os.path.splitext(ruta)[1].lower() == EXTENSION
+
+
+def _alinear(posicion):
+    return (posicion + 7) & ~7
+
+
+def _disposicion(filas, temas):
+    """Posición de cada columna y del montículo de nombres para 'filas' y 'temas'."""
+    posiciones = {}
+    posicion = _CABECERA.size
+    for columna, tipo in _COLUMNAS_FILA:
+        posicion = _alinear(posicion)
+        posiciones[columna] = posicion
+        posicion += filas * np.dtype(tipo).itemsize
+    for columna, cantidad in (('inicio_nombre', filas + 1), ('inicio_tema', temas + 1)):
+        posicion = _alinear(posicion)
+        posiciones[columna] = posicion
+        posicion += cantidad * 8
+    posiciones['monticulos'] = posicion
+    return posiciones
+
+
+def _monticulo(cadenas):
+    """Concatena las cadenas terminadas en 0 y retorna (bytes, inicios u8 con una entrada final)."""
+    codificadas = [c.encode('utf-8') for c in cadenas]
+    if any(b'\0' in c for c in codificadas):
+        raise ValueError("Los nombres y temas no pueden contener el carácter nulo.")
+    inicios = np.zeros(len(codificadas) + 1, dtype='<u8')
+    np.cumsum([len(c) + 1 for c in codificadas], out=inicios[1:])
+    return b''.join(c + b'\0' for c in codificadas), inicios
+
+
+def guardar_instantanea(evaluaciones, ruta):
+    """
+    Escribe 'evaluaciones' (cualquier iterable de evaluaciones de dominio, p. ej. el almacén
+    del gestor) como instantánea binaria. Como la exportación JSON, escribe junto al destino
+    y solo lo reemplaza al terminar. Retorna el número de filas escritas.
+    """
+    nombres, temas, codigo_tema = [], [], {}
+    filas = {columna: [] for columna, _ in _COLUMNAS_FILA}
+    for evaluacion in evaluaciones:
+        tipo = tipo_de(evaluacion)
+        nombres.append(evaluacion.nombre)
+        filas['puntaje'].append(evaluacion.puntaje)
+        filas['fecha'].append(evaluacion.fecha.toordinal())
+        filas['tipo'].append(CODIGOS_TIPO[tipo])
+        filas['duracion'].append(evaluacion.duracion_min if tipo != "Trabajo" else 0)
+        filas['num_preguntas'].append(evaluacion.num_preguntas if tipo == "Examen" else 0)
+        filas['num_paginas'].append(evaluacion.num_paginas if tipo == "Trabajo" else 0)
+        filas['tamano_audiencia'].append(evaluacion.tamano_audiencia if tipo == "Presentacion" else 0)
+        if tipo == "Trabajo":
+            codigo = codigo_tema.get(evaluacion.tema)
+            if codigo is None:
+                codigo = codigo_tema[evaluacion.tema] = len(temas)
+                temas.append(evaluacion.tema)
+            filas['tema'].append(codigo)
+        else:
+            filas['tema'].append(SIN_TEMA)
+
+    monticulo_nombres, inicio_nombre = _monticulo(nombres)
+    monticulo_temas, inicio_tema = _monticulo(temas)
+    posiciones = _disposicion(len(nombres), len(temas))
+    temporal = ruta + '.tmp'
+    try:
+        with open(temporal, 'wb') as archivo:
+            archivo.write(_CABECERA.pack(MAGIA, VERSION, 0, 0, len(nombres), len(temas),
+                                         len(monticulo_nombres), len(monticulo_temas)))
+            columnas = [(posiciones[c], np.asarray(filas[c], dtype=t)) for c, t in _COLUMNAS_FILA]
+            columnas += [(posiciones['inicio_nombre'], inicio_nombre), (posiciones['inicio_tema'], inicio_tema)]
+            for posicion, arreglo in columnas:
+                archivo.write(b'\0' * (posicion - archivo.tell()))
+                archivo.write(arreglo.tobytes())
+            archivo.write(b'\0' * (posiciones['monticulos'] - archivo.tell()))
+            archivo.write(monticulo_nombres)
+            archivo.write(monticulo_temas)
+        os.replace(temporal, ruta)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+    return len(nombres)
+
+
+class InstantaneaEvaluaciones:
+    """
+    Lectura de una instantánea binaria con mmap: las columnas son arreglos NumPy de solo lectura
+    sobre el propio archivo (sin copiar ni decodificar nada al abrir) y cada fila se convierte
+    en Examen/Trabajo/Presentacion solo cuando se pide. Debe cerrarse (o usarse con 'with')
+    después de soltar las columnas y los almacenes que las usan.
+    """
+    def __init__(self, ruta):
+        self.ruta = ruta
+        with open(ruta, 'rb') as archivo:
+            self._mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._abrir()
+        except BaseException:
+            self._mapa.close()
+            raise
+
+    def _abrir(self):
+        if len(self._mapa) < _CABECERA.size:
+            raise ValueError(f"'{self.ruta}' no es una instantánea de evaluaciones.")
+        magia, version, _, _, filas, temas, bytes_nombres, bytes_temas = _CABECERA.unpack_from(self._mapa)
+        if magia != MAGIA:
+            raise ValueError(f"'{self.ruta}' no es una instantánea de evaluaciones.")
+        if version != VERSION:
+            raise ValueError(f"Versión de instantánea no soportada: {version} (se esperaba {VERSION}).")
+        posiciones = _disposicion(filas, temas)
+        if len(self._mapa) != posiciones['monticulos'] + bytes_nombres + bytes_temas:
+            raise ValueError(f"La instantánea '{self.ruta}' está truncada o dañada.")
+
+        self._filas = filas
+        for columna, tipo in _COLUMNAS_FILA:
+            setattr(self, columna, np.frombuffer(self._mapa, dtype=tipo, count=filas, offset=posiciones[columna]))
+        self._inicio_nombre = np.frombuffer(self._mapa, dtype='<u8', count=filas + 1,
+                                            offset=posiciones['inicio_nombre'])
+        self._inicio_tema = np.frombuffer(self._mapa, dtype='<u8', count=temas + 1, offset=posiciones['inicio_tema'])
+        self._base_nombres = posiciones['monticulos']
+        self._base_temas = self._base_nombres + bytes_nombres
+        self._bytes_nombres = bytes_nombres
+        self._bytes_temas = bytes_temas
+
+    def cerrar(self):
+        # Las columnas son vistas del mapa: se sueltan antes de cerrarlo
+        for columna, _ in _COLUMNAS_FILA:
+            setattr(self, columna, None)
+        self._inicio_nombre = self._inicio_tema = None
+        self._mapa.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def __len__(self):
+        return self._filas
+
+    # --- Cadenas ---
+    def _cadena(self, base, inicios, i):
+        return self._mapa[base + int(inicios[i]):base + int(inicios[i + 1]) - 1].decode('utf-8')
+
+    def nombre(self, fila):
+        return self._cadena(self._base_nombres, self._inicio_nombre, fila)
+
+    def texto_tema(self, codigo):
+        return self._cadena(self._base_temas, self._inicio_tema, codigo)
+
+    @staticmethod
+    def _todas(mapa, base, longitud):
+        # Una sola decodificación y un split en C en lugar de una por cadena
+        return mapa[base:base + longitud - 1].decode('utf-8').split('\0') if longitud else []
+
+    def nombres(self):
+        return self._todas(self._mapa, self._base_nombres, self._bytes_nombres)
+
+    def temas(self):
+        return self._todas(self._mapa, self._base_temas, self._bytes_temas)
+
+    # --- Filas ---
+    def __getitem__(self, fila):
+        """Construye el objeto de dominio de la fila indicada."""
+        if not 0 <= fila < self._filas:
+            raise IndexError(fila)
+        nombre = self.nombre(fila)
+        fecha = date.fromordinal(int(self.fecha[fila]))
+        puntaje = float(self.puntaje[fila])
+        codigo = self.tipo[fila]
+        if codigo == EXAMEN:
+            return Examen(nombre, fecha, puntaje, int(self.duracion[fila]), int(self.num_preguntas[fila]))
+        if codigo == TRABAJO:
+            return Trabajo(nombre, fecha, puntaje, int(self.num_paginas[fila]), self.texto_tema(int(self.tema[fila])))
+        return Presentacion(nombre, fecha, puntaje, int(self.duracion[fila]), int(self.tamano_audiencia[fila]))
+
+    def __iter__(self):
+        for fila in range(self._filas):
+            yield self[fila]
+
+    def a_almacen_columnar(self):
+        """
+        AlmacenColumnar cuyas columnas numéricas son las del archivo, sin copiarlas; solo se
+        decodifican los nombres y temas. El almacén copia una columna la primera vez que la modifica.
+        """
+        return AlmacenColumnar.desde_columnas(
+            self.puntaje, self.fecha, self.tipo, self.duracion, self.num_preguntas, self.num_paginas,
+            self.tamano_audiencia, self.tema, self.nombres(), self.temas())
+
+
+# Prueba de ida y vuelta contra el formato JSON y comparación del tiempo de carga.
+# Uso: python -m src.servicio.instantanea_binaria [filas]
+if __name__ == '__main__':
+    import random
+    import sys
+    import tempfile
+    import time
+
+    from src.servicio.exportador_json import ExportadorEvaluaciones
+    from src.servicio.importador_json import evaluacion_a_dict, evaluacion_desde_dict, iterar_registros_json
+
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rnd = random.Random(0)
+
+    def evaluacion_aleatoria(i):
+        fecha = date(2025, rnd.randint(1, 12), rnd.randint(1, 28))
+        puntaje = rnd.choice([0.0, 100.0, round(rnd.uniform(0, 100), 2), rnd.uniform(0, 100)])
+        tipo = i % 3
+        if tipo == 0:
+            return Examen(f"Examen {i}", fecha, puntaje, rnd.randint(15, 300), rnd.randint(1, 100))
+        if tipo == 1:
+            return Trabajo(f"Trabajo {i} ñ", fecha, puntaje, rnd.randint(1, 100), f"Tema {rnd.randrange(N // 10 + 1)}")
+        return Presentacion(f"Presentación {i}", fecha, puntaje, rnd.randint(5, 60), rnd.randint(1, 1000))
+
+    evaluaciones = [evaluacion_aleatoria(i) for i in range(N)]
+    esperado = [evaluacion_a_dict(e) for e in evaluaciones]
+    directorio = tempfile.mkdtemp()
+    ruta_json = os.path.join(directorio, 'evaluaciones.json')
+    ruta_instantanea = os.path.join(directorio, 'evaluaciones' + EXTENSION)
+    ExportadorEvaluaciones().exportar(evaluaciones, ruta_json)
+    guardar_instantanea(evaluaciones, ruta_instantanea)
+    del evaluaciones
+
+    inicio = time.perf_counter()
+    with open(ruta_json, 'rb') as archivo:
+        desde_json = [evaluacion_desde_dict(d) for d in iterar_registros_json(archivo)]
+    tiempo_json = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    instantanea = InstantaneaEvaluaciones(ruta_instantanea)
+    tiempo_abrir = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    almacen = instantanea.a_almacen_columnar()
+    notas = almacen.notas()
+    tiempo_columnar = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    desde_instantanea = list(instantanea)
+    tiempo_objetos = time.perf_counter() - inicio
+
+    # Ida y vuelta: JSON, instantánea y almacén columnar reconstruyen exactamente los mismos datos
+    assert [evaluacion_a_dict(e) for e in desde_json] == esperado
+    assert [evaluacion_a_dict(e) for e in desde_instantanea] == esperado
+    assert [evaluacion_a_dict(e) for e in almacen] == esperado
+    assert np.array_equal(notas, [e.calcular_nota() for e in desde_json])
+
+    del almacen, notas
+    instantanea.cerrar()
+    print(f"{N} evaluaciones: JSON {os.path.getsize(ruta_json) / 1e6:.1f} MB, "
+          f"instantánea {os.path.getsize(ruta_instantanea) / 1e6:.1f} MB")
+    print(f"Carga desde JSON (objetos): {tiempo_json:.2f} s")
+    print(f"Instantánea: abrir {tiempo_abrir * 1000:.2f} ms, almacén columnar + notas {tiempo_columnar:.2f} s, "
+          f"objetos {tiempo_objetos:.2f} s")
@@ -0,0 +1,216 @@
+# src/servicio/lista_ordenada.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from heapq import merge
+
+
+class ListaOrdenada:
+    """
+    Lista ordenada por bloques (descomposición en raíz): cada bloque es una lista corta
+    ordenada, así que insertar y borrar mueven como mucho un bloque en lugar de toda la lista.
+    Las búsquedas por valor son O(log n). Un árbol de Fenwick sobre las longitudes de los
+    bloques da en O(log n) cuántos elementos hay antes de un bloque, así que contar menores o
+    mayores y acceder por posición también son O(log n); solo se reconstruye (O(n / TAMANO_BLOQUE))
+    en la primera consulta tras dividir, vaciar o rehacer bloques.
+    """
+    TAMANO_BLOQUE = 1000
+
+    def __init__(self, valores=()):
+        self._bloques = []   # listas ordenadas, todas no vacías
+        self._maximos = []   # último elemento de cada bloque, para bisect entre bloques
+        self._longitud = 0
+        self._arbol = None   # árbol de Fenwick de longitudes de bloque (None = por reconstruir)
+        self._reconstruir(sorted(valores))
+
+    def agregar(self, valor):
+        if not self._bloques:
+            self._bloques.append([valor])
+            self._maximos.append(valor)
+            self._arbol = None
+        else:
+            i = bisect_left(self._maximos, valor)
+            if i == len(self._maximos):
+                i -= 1
+                self._bloques[i].append(valor)
+                self._maximos[i] = valor
+            else:
+                insort(self._bloques[i], valor)
+            if len(self._bloques[i]) > 2 * self.TAMANO_BLOQUE:
+                self._dividir(i)
+            else:
+                self._sumar_en_arbol(i, 1)
+        self._longitud += 1
+
+    def agregar_varios(self, valores):
+        """
+        Agrega todos los valores indicados. Con pocos valores se insertan uno a uno; con muchos,
+        se mezclan ya ordenados con la lista y se reconstruyen los bloques en un solo recorrido.
+        """
+        valores = sorted(valores)
+        if len(valores) * self.TAMANO_BLOQUE < self._longitud:
+            for valor in valores:
+                self.agregar(valor)
+            return
+        self._reconstruir(list(merge(self, valores)))
+
+    def eliminar(self, valor):
+        """Elimina una aparición de valor. Levanta ValueError si no está."""
+        i = bisect_left(self._maximos, valor)
+        if i < len(self._bloques):
+            bloque = self._bloques[i]
+            j = bisect_left(bloque, valor)
+            if j < len(bloque) and bloque[j] == valor:
+                del bloque[j]
+                self._longitud -= 1
+                if bloque:
+                    self._maximos[i] = bloque[-1]
+                    self._sumar_en_arbol(i, -1)
+                else:
+                    del self._bloques[i]
+                    del self._maximos[i]
+                    self._arbol = None
+                return
+        raise ValueError(f"{valor!r} no está en la lista ordenada.")
+
+    def eliminar_varios(self, valores):
+        """
+        Elimina una aparición de cada valor indicado. Con pocos valores se borran uno a uno;
+        con muchos, se reconstruyen los bloques en un solo recorrido. Levanta ValueError
+        (sin modificar la lista) si alguno no está.
+        """
+        valores = list(valores)
+        if len(valores) * self.TAMANO_BLOQUE < self._longitud:
+            for i, valor in enumerate(valores):
+                try:
+                    self.eliminar(valor)
+                except ValueError:
+                    for restaurar in valores[:i]:
+                        self.agregar(restaurar)
+                    raise
+            return
+
+        quitar = Counter(valores)
+        restantes = []
+        for valor in self:
+            if quitar[valor]:
+                quitar[valor] -= 1
+            else:
+                restantes.append(valor)
+        faltantes = [valor for valor, cantidad in quitar.items() if cantidad]
+        if faltantes:
+            raise ValueError(f"{faltantes[0]!r} no está en la lista ordenada.")
+        self._reconstruir(restantes)
+
+    def rango(self, minimo=None, maximo=None, inclusivo=(True, True)):
+        """Itera en orden los valores entre minimo y maximo (None = sin límite)."""
+        if minimo is None:
+            i, j = 0, 0
+        else:
+            buscar = bisect_left if inclusivo[0] else bisect_right
+            i = buscar(self._maximos, minimo)
+            if i == len(self._bloques):
+                return
+            j = buscar(self._bloques[i], minimo)
+        buscar_fin = bisect_right if inclusivo[1] else bisect_left
+        for k in range(i, len(self._bloques)):
+            bloque = self._bloques[k]
+            inicio = j if k == i else 0
+            if maximo is not None and not (bloque[-1] < maximo or (inclusivo[1] and bloque[-1] == maximo)):
+                yield from bloque[inicio:buscar_fin(bloque, maximo)]
+                return
+            yield from bloque[inicio:]
+
+    def contar_menores(self, valor):
+        """Número de elementos estrictamente menores que valor."""
+        i = bisect_left(self._maximos, valor)
+        if i == len(self._bloques):
+            return self._longitud
+        return self._anteriores(i) + bisect_left(self._bloques[i], valor)
+
+    def contar_mayores(self, valor):
+        """Número de elementos estrictamente mayores que valor."""
+        i = bisect_right(self._maximos, valor)
+        if i == len(self._bloques):
+            return 0
+        return self._longitud - self._anteriores(i) - bisect_right(self._bloques[i], valor)
+
+    def limpiar(self):
+        self._bloques.clear()
+        self._maximos.clear()
+        self._longitud = 0
+        self._arbol = None
+
+    def __getitem__(self, posicion):
+        """Elemento en la posición indicada dentro del orden (admite índices negativos)."""
+        if posicion < 0:
+            posicion += self._longitud
+        if not 0 <= posicion < self._longitud:
+            raise IndexError("Posición fuera de la lista ordenada.")
+        # Descenso por el árbol: el último bloque cuyos anteriores suman como mucho 'posicion'
+        arbol = self._arbol_actual()
+        i = 0
+        paso = 1 << (len(arbol) - 1).bit_length()
+        while paso:
+            siguiente = i + paso
+            if siguiente < len(arbol) and arbol[siguiente] <= posicion:
+                i = siguiente
+                posicion -= arbol[siguiente]
+            paso >>= 1
+        return self._bloques[i][posicion]
+
+    def __len__(self):
+        return self._longitud
+
+    def __iter__(self):
+        for bloque in self._bloques:
+            yield from bloque
+
+    def __reversed__(self):
+        for bloque in reversed(self._bloques):
+            yield from reversed(bloque)
+
+    def _dividir(self, i):
+        bloque = self._bloques[i]
+        mitad = len(bloque) // 2
+        self._bloques[i:i + 1] = [bloque[:mitad], bloque[mitad:]]
+        self._maximos[i:i + 1] = [bloque[mitad - 1], bloque[-1]]
+        self._arbol = None
+
+    # --- Árbol de Fenwick (índices desde 1) sobre las longitudes de los bloques ---
+    def _arbol_actual(self):
+        if self._arbol is None:
+            arbol = [0] + [len(bloque) for bloque in self._bloques]
+            for i in range(1, len(arbol)):
+                padre = i + (i & -i)
+                if padre < len(arbol):
+                    arbol[padre] += arbol[i]
+            self._arbol = arbol
+        return self._arbol
+
+    def _sumar_en_arbol(self, bloque, cantidad):
+        arbol = self._arbol
+        if arbol is None:
+            return  # Se reconstruye en la próxima consulta
+        i = bloque + 1
+        while i < len(arbol):
+            arbol[i] += cantidad
+            i += i & -i
+
+    def _anteriores(self, bloque):
+        """Número de elementos en los bloques anteriores a 'bloque'."""
+        arbol = self._arbol_actual()
+        total = 0
+        i = bloque
+        while i:
+            total += arbol[i]
+            i -= i & -i
+        return total
+
+    def _reconstruir(self, ordenados):
+        """Reparte una lista ya ordenada en bloques nuevos."""
+        self._bloques = [ordenados[i:i + self.TAMANO_BLOQUE]
+                         for i in range(0, len(ordenados), self.TAMANO_BLOQUE)]
+        self._maximos = [bloque[-1] for bloque in self._bloques]
+        self._longitud = len(ordenados)
+        self._arbol = None
@@ -0,0 +1,189 @@
+# src/servicio/modelo_evaluaciones.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import threading
+from bisect import bisect_left
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt, Signal
+
+from src.servicio.indices_evaluaciones import normalizar_tipo, tipo_de
+
+
+class EvaluacionesTableModel(QAbstractTableModel):
+    """
+    Modelo de tabla sobre la colección del gestor. Se registra como índice de
+    AlmacenEvaluaciones, así que cada alta, cambio o baja llega como un aviso fino
+    (rowsInserted, dataChanged, rowsRemoved) en lugar de reconstruir la tabla, y la vista
+    solo pide datos de las filas visibles.
+
+    Las mutaciones pueden ocurrir en el hilo de escrituras: los avisos se encolan y se
+    aplican en el hilo de la interfaz, agrupando las altas consecutivas en una sola inserción.
+    """
+    COLUMNAS = ("Nombre", "Tipo", "Fecha", "Puntaje", "Nota Calculada")
+    NOMBRE, TIPO, FECHA, PUNTAJE, NOTA = range(len(COLUMNAS))
+
+    # Rol con el valor sin formato de cada celda, usado para ordenar (fechas y números)
+    ROL_VALOR = Qt.UserRole
+
+    _hay_cambios = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Las secuencias del almacén crecen con cada alta, así que _secuencias queda
+        # ordenada y la fila de una secuencia se encuentra con bisect
+        self._secuencias = []      # fila -> secuencia
+        self._evaluaciones = {}    # secuencia -> evaluacion
+        self._candado = threading.Lock()
+        self._cambios = []         # (operacion, secuencia, dato) pendientes de aplicar
+        self._hay_cambios.connect(self._aplicar_cambios, Qt.QueuedConnection)
+
+    # --- Protocolo de índice de AlmacenEvaluaciones (cualquier hilo) ---
+    def agregar(self, secuencia, evaluacion):
+        self._encolar('agregar', secuencia, evaluacion)
+
+    def eliminar(self, secuencia, evaluacion):
+        self._encolar('eliminar', secuencia, evaluacion)
+
+    def eliminar_varios(self, pares):
+        self._encolar('eliminar_varios', None, [secuencia for secuencia, _ in pares])
+
+    def reemplazar(self, secuencia, anterior, nueva):
+        self._encolar('reemplazar', secuencia, nueva)
+
+    def limpiar(self):
+        self._encolar('limpiar', None, None)
+
+    def _encolar(self, operacion, secuencia, evaluacion):
+        with self._candado:
+            avisar = not self._cambios
+            self._cambios.append((operacion, secuencia, evaluacion))
+        if avisar:
+            self._hay_cambios.emit()
+
+    # --- Aplicación de cambios (hilo de la interfaz) ---
+    def _aplicar_cambios(self):
+        with self._candado:
+            cambios, self._cambios = self._cambios, []
+
+        altas = []
+        for operacion, secuencia, dato in cambios:
+            if operacion == 'agregar':
+                altas.append((secuencia, dato))
+                continue
+            self._insertar_filas(altas)
+            altas = []
+            if operacion == 'eliminar':
+                fila = self._fila_de(secuencia)
+                if fila is not None:
+                    self.beginRemoveRows(QModelIndex(), fila, fila)
+                    del self._secuencias[fila]
+                    del self._evaluaciones[secuencia]
+                    self.endRemoveRows()
+            elif operacion == 'eliminar_varios':
+                self._eliminar_filas(dato)  # dato = lista de secuencias
+            elif operacion == 'reemplazar':
+                fila = self._fila_de(secuencia)
+                if fila is not None:
+                    self._evaluaciones[secuencia] = dato
+                    self.dataChanged.emit(self.index(fila, 0), self.index(fila, len(self.COLUMNAS) - 1))
+            elif operacion == 'limpiar':
+                self.beginResetModel()
+                self._secuencias.clear()
+                self._evaluaciones.clear()
+                self.endResetModel()
+        self._insertar_filas(altas)
+
+    def _insertar_filas(self, altas):
+        if not altas:
+            return
+        primera = len(self._secuencias)
+        self.beginInsertRows(QModelIndex(), primera, primera + len(altas) - 1)
+        for secuencia, evaluacion in altas:
+            self._secuencias.append(secuencia)
+            self._evaluaciones[secuencia] = evaluacion
+        self.endInsertRows()
+
+    def _eliminar_filas(self, secuencias):
+        """Quita las filas de esas secuencias avisando por tramos contiguos, de abajo arriba."""
+        filas = sorted((f for f in map(self._fila_de, secuencias) if f is not None), reverse=True)
+        i = 0
+        while i < len(filas):
+            ultima = primera = filas[i]
+            while i + 1 < len(filas) and filas[i + 1] == primera - 1:
+                i += 1
+                primera = filas[i]
+            self.beginRemoveRows(QModelIndex(), primera, ultima)
+            for secuencia in self._secuencias[primera:ultima + 1]:
+                del self._evaluaciones[secuencia]
+            del self._secuencias[primera:ultima + 1]
+            self.endRemoveRows()
+            i += 1
+
+    def _fila_de(self, secuencia):
+        fila = bisect_left(self._secuencias, secuencia)
+        if fila < len(self._secuencias) and self._secuencias[fila] == secuencia:
+            return fila
+        return None
+
+    # --- API del modelo ---
+    def evaluacion(self, fila):
+        """Evaluación mostrada en la fila indicada del modelo (no del proxy)."""
+        return self._evaluaciones[self._secuencias[fila]]
+
+    def indice_de_secuencia(self, secuencia):
+        """Índice (columna Nombre) de la fila de esa secuencia del almacén; inválido si aún no se muestra."""
+        fila = None if secuencia is None else self._fila_de(secuencia)
+        return QModelIndex() if fila is None else self.index(fila, self.NOMBRE)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._secuencias)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNAS)
+
+    def headerData(self, seccion, orientacion, rol=Qt.DisplayRole):
+        if orientacion == Qt.Horizontal and rol == Qt.DisplayRole:
+            return self.COLUMNAS[seccion]
+        return None
+
+    def data(self, index, rol=Qt.DisplayRole):
+        if not index.isValid() or rol not in (Qt.DisplayRole, self.ROL_VALOR):
+            return None
+        eval_obj = self.evaluacion(index.row())
+        columna = index.column()
+        if columna == self.NOMBRE:
+            return eval_obj.nombre
+        if columna == self.TIPO:
+            return eval_obj.__class__.__name__
+        if columna == self.FECHA:
+            return eval_obj.fecha.strftime("%Y-%m-%d") if rol == Qt.DisplayRole else eval_obj.fecha.toordinal()
+        if columna == self.PUNTAJE:
+            return f"{eval_obj.puntaje:.1f}" if rol == Qt.DisplayRole else float(eval_obj.puntaje)
+        if columna == self.NOTA:
+            nota = eval_obj.calcular_nota()
+            return f"{nota:.1f}" if rol == Qt.DisplayRole else float(nota)
+        return None
+
+
+class FiltroTipoProxyModel(QSortFilterProxyModel):
+    """Proxy que filtra por tipo de evaluación (texto de cbFiltro) y ordena por el valor sin formato."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tipo = None
+        self.setSortRole(EvaluacionesTableModel.ROL_VALOR)
+        self.setDynamicSortFilter(True)
+
+    def establecer_tipo(self, tipo):
+        """Muestra solo el tipo indicado ("Todos" o None = sin filtro)."""
+        tipo = None if tipo in (None, "Todos") else normalizar_tipo(tipo)
+        if tipo != self._tipo:
+            self._tipo = tipo
+            self.invalidateFilter()
+
+    def evaluacion(self, index_proxy):
+        """Evaluación de una fila del proxy (p. ej. de la selección de la vista)."""
+        return self.sourceModel().evaluacion(self.mapToSource(index_proxy).row())
+
+    def filterAcceptsRow(self, fila, padre):
+        if self._tipo is None:
+            return True
+        return tipo_de(self.sourceModel().evaluacion(fila)) == self._tipo
@@ -1,12 +1,11 @@
 # src/servicio/persona.py
 #nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
-import json
 import re # Necesario para validaciones si usas expresiones regulares
 from datetime import date
 
-from PySide6.QtWidgets import (QMainWindow, QMessageBox, QTableWidgetItem,
-                               QFileDialog, QApplication, QHeaderView, QTableWidget)
-from PySide6.QtCore import QDate
+from PySide6.QtWidgets import (QMainWindow, QMessageBox, QAbstractItemView, QCompleter,
+                               QFileDialog, QHeaderView, QLineEdit, QProgressBar, QPushButton)
+from PySide6.QtCore import QDate, QStringListModel, Qt, Signal
 
 # Asegúrate de que esta importación sea correcta para tu UI de evaluación
 from src.UI.vntEvaluacion import Ui_vntEvaluacion
@@ -15,6 +14,10 @@ from src.dominio.examen import Examen
 from src.dominio.presentacion import Presentacion
 from src.dominio.trabajo import Trabajo
 from src.servicio.gestor_evaluaciones import GestorEvaluaciones
+from src.servicio.exportador_json import ExportadorEvaluaciones, compresion_por_extension
+from src.servicio.importador_json import ImportadorEvaluaciones
+from src.servicio.modelo_evaluaciones import EvaluacionesTableModel, FiltroTipoProxyModel
+from src.servicio.tareas import EjecutorTareas, TareaCancelada
 
 
 class PersonaServicio(QMainWindow): # Renombrada de MainWindow
@@ -22,13 +25,34 @@ class PersonaServicio(QMainWindow): # Renombrada de MainWindow
     Clase principal de la aplicación que maneja la interfaz de usuario vntEvaluacion
     y la lógica de gestión de evaluaciones, incluyendo sus validaciones.
     """
+    # Sugerencias que muestra la búsqueda mientras se escribe
+    LIMITE_BUSQUEDA = 50
+
+    # Escrituras diferidas que la base de datos rechazó; se emite desde el hilo de la escritura
+    # diferida y la conexión la entrega en el hilo de la interfaz
+    escrituras_rechazadas = Signal(object)
 
     def __init__(self):
         super(PersonaServicio, self).__init__()
         self.ui = Ui_vntEvaluacion() # Usa la UI de vntEvaluacion
         self.ui.setupUi(self)
 
-        self.gestor = GestorEvaluaciones()
+        # El gestor se conecta en segundo plano para que la ventana aparezca de inmediato
+        self.gestor = GestorEvaluaciones(cargar=False, ruta_cache="evaluaciones_cache.sqlite3")
+        # Las estadísticas cubren todo el archivo aunque solo estén cargadas algunas páginas
+        self.gestor.usar_estadisticas_servidor()
+        self.gestor.al_rechazar_escrituras = self.escrituras_rechazadas.emit
+        self.escrituras_rechazadas.connect(self._mostrar_escrituras_rechazadas)
+        self.tareas = EjecutorTareas(self)
+        # Operaciones en curso que modifican la colección en memoria; mientras haya alguna,
+        # el hilo de la interfaz no la recorre (el refresco de estadísticas se aplaza)
+        self._modificaciones_pendientes = 0
+        self._refresco_pendiente = False
+        self._tarea_pagina = None
+        self._carga_en_pausa = False
+        # Cálculo de estadísticas en la base de datos en curso, y si hay que repetirlo al terminar
+        self._tarea_estadisticas = None
+        self._estadisticas_pendientes = False
 
         self.current_editing_eval_name = None
 
@@ -51,17 +75,127 @@ class PersonaServicio(QMainWindow): # Renombrada de MainWindow
         self.ui.actionSalir.triggered.connect(self.close)
         self.ui.actionAcerca_de.triggered.connect(self.mostrar_acerca_de)
 
+        # Modelo de la tabla: sigue a la colección del gestor fila a fila; el proxy filtra por tipo y ordena
+        self.modelo_evaluaciones = EvaluacionesTableModel(self)
+        self.gestor.evaluaciones.registrar_indice(self.modelo_evaluaciones)
+        self.proxy_evaluaciones = FiltroTipoProxyModel(self)
+        self.proxy_evaluaciones.setSourceModel(self.modelo_evaluaciones)
+
         # Configuración inicial de la tabla
-        self.ui.tableWidget_evaluaciones.setSelectionBehavior(QTableWidget.SelectRows)
-        self.ui.tableWidget_evaluaciones.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.ui.tableWidget_evaluaciones.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.ui.tableWidget_evaluaciones.verticalHeader().setVisible(False)
+        tabla = self.ui.tableView_evaluaciones
+        tabla.setModel(self.proxy_evaluaciones)
+        tabla.sortByColumn(-1, Qt.AscendingOrder)  # Orden de inserción hasta que se pulse una cabecera
+        tabla.setSelectionBehavior(QAbstractItemView.SelectRows)
+        tabla.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        tabla.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        tabla.verticalHeader().setVisible(False)
+        # Alto de fila fijo: la vista no mide filas fuera de pantalla, lo que permite desplazarse por millones
+        tabla.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+
+        # Indicador de carga y cancelación en la barra de estado
+        self.barra_progreso = QProgressBar(self)
+        self.barra_progreso.setRange(0, 0)  # Modo indeterminado
+        self.barra_progreso.setMaximumWidth(150)
+        self.barra_progreso.hide()
+        self.btnCancelar = QPushButton("Cancelar", self)
+        self.btnCancelar.hide()
+        self.btnCancelar.clicked.connect(self.tareas.cancelar_todas)
+        self.ui.statusbar.addPermanentWidget(self.barra_progreso)
+        self.ui.statusbar.addPermanentWidget(self.btnCancelar)
+        self.tareas.ocupado_cambiado.connect(self._actualizar_indicador_carga)
+        self.tareas.cancelable_cambiado.connect(self.btnCancelar.setVisible)
+        self.tareas.mensaje.connect(self.ui.statusbar.showMessage)
+
+        # Búsqueda mientras se escribe: las sugerencias salen del índice en memoria del gestor
+        # y al elegir una se selecciona su fila en la tabla
+        self.txtBuscar = QLineEdit(self.ui.tab_lista)
+        self.txtBuscar.setPlaceholderText("Buscar por nombre o tema...")
+        self.txtBuscar.setClearButtonEnabled(True)
+        self.sugerencias_busqueda = QStringListModel(self)
+        completador = QCompleter(self.sugerencias_busqueda, self)
+        completador.setCompletionMode(QCompleter.UnfilteredPopupCompletion)  # Ya vienen filtradas
+        completador.setMaxVisibleItems(15)
+        completador.activated.connect(self.ir_a_evaluacion)
+        self.txtBuscar.setCompleter(completador)
+        self.txtBuscar.textEdited.connect(self.buscar_evaluaciones)
+        self.txtBuscar.returnPressed.connect(lambda: self.ir_a_evaluacion(self.txtBuscar.text()))
+        self.ui.horizontalLayout_filtros.insertWidget(2, self.txtBuscar, 1)  # Tras el filtro por tipo
+
+        # Carga perezosa: tras la primera página, el resto se lee página a página en segundo plano
+        # (y de inmediato cuando el usuario llega al final de la tabla)
+        self.ui.tableView_evaluaciones.verticalScrollBar().valueChanged.connect(self._cargar_al_llegar_al_final)
 
         # Inicializar la UI
-        self.cargar_evaluaciones_en_tabla()
-        self.actualizar_resumen_estadisticas()
         self.limpiar_campos()
         self.ui.tabWidget.setCurrentIndex(0)
+        self._ejecutar_modificacion(self.gestor.conectar, al_terminar=self._gestor_conectado,
+                                    al_finalizar=self._gestor_finalizado,
+                                    descripcion="Conectando con la base de datos...")
+
+    # --- Ejecución en segundo plano ---
+    def _ejecutar_modificacion(self, funcion, *args, al_terminar=None, al_fallar=None,
+                               al_finalizar=None, **kwargs):
+        """
+        Ejecuta en el hilo de escrituras una operación que modifica la base de datos o la
+        colección en memoria; al terminar la última se aplican los refrescos aplazados.
+        """
+        self._modificaciones_pendientes += 1
+        return self.tareas.ejecutar(funcion, *args, al_terminar=al_terminar,
+                                    al_fallar=al_fallar or self._mostrar_error_tarea,
+                                    al_finalizar=lambda: self._modificacion_finalizada(al_finalizar),
+                                    **kwargs)
+
+    def _modificacion_finalizada(self, al_finalizar=None):
+        self._modificaciones_pendientes -= 1
+        if self._modificaciones_pendientes == 0 and self._refresco_pendiente:
+            self._refresco_pendiente = False
+            self.cargar_evaluaciones_en_tabla()
+        if al_finalizar:
+            al_finalizar()
+
+    def _mostrar_error_tarea(self, error):
+        if isinstance(error, TareaCancelada):
+            self.ui.statusbar.showMessage(str(error), 5000)
+        else:
+            QMessageBox.critical(self, "Error", f"Ocurrió un error inesperado: {error}")
+
+    def _mostrar_escrituras_rechazadas(self, rechazadas):
+        # La memoria ya tenía esos cambios: se recargan las filas afectadas desde la base de datos
+        self._ejecutar_modificacion(self.gestor.atender_escrituras_rechazadas,
+                                    descripcion="Recargando las evaluaciones rechazadas...")
+        self._refresco_pendiente = True
+        detalle = []
+        for rechazada in rechazadas:
+            nombre = rechazada['evaluacion']['nombre'] if 'evaluacion' in rechazada else rechazada['nombre']
+            detalle.append(f"- '{nombre}': {rechazada['error']}")
+        QMessageBox.warning(self, "Cambios Rechazados",
+                            f"La base de datos rechazó {len(rechazadas)} cambio(s) que ya se mostraban como "
+                            "guardados; se recargan los datos de la base de datos:\n" + "\n".join(detalle))
+
+    def _actualizar_indicador_carga(self, ocupado):
+        self.barra_progreso.setVisible(ocupado)
+        if not ocupado:
+            self.ui.statusbar.clearMessage()
+
+    def _gestor_conectado(self, conectado):
+        if not conectado:
+            QMessageBox.warning(self, "Base de Datos",
+                                "No se pudo conectar a la base de datos. Las operaciones de DB no funcionarán.")
+        self._refresco_pendiente = True  # Se aplica al finalizar la tarea de conexión
+
+    def _gestor_finalizado(self):
+        self.cargar_siguiente_pagina()
+
+    def closeEvent(self, event):
+        # Las escrituras en curso deben terminar antes de que se cierre el pool de conexiones
+        self._carga_en_pausa = True
+        self.tareas.cancelar_todas()
+        self.tareas.esperar()
+        # Con escritura diferida activa, lo pendiente se envía antes de salir (y si no, queda en el diario)
+        self.gestor.desactivar_escritura_diferida()
+        # La copia local se sella con la marca actual: el próximo inicio solo pide lo posterior
+        self.gestor.actualizar_cache()
+        super().closeEvent(event)
 
     # --- Métodos de Validación (privados para la clase) ---
     def _validar_nombre_evaluacion(self, nombre: str) -> bool:
@@ -149,50 +283,108 @@ class PersonaServicio(QMainWindow): # Renombrada de MainWindow
                 return
 
             if self.current_editing_eval_name:
-                self.gestor.eliminar_evaluacion_por_nombre(self.current_editing_eval_name)
-                self.gestor.agregar_evaluacion(evaluacion)
-                QMessageBox.information(self, "Éxito", f"Evaluación '{nombre}' actualizada correctamente.")
+                self._ejecutar_modificacion(
+                    self.gestor.actualizar_evaluacion, self.current_editing_eval_name, evaluacion,
+                    descripcion=f"Actualizando '{nombre}'...",
+                    al_terminar=lambda ok: self._evaluacion_guardada(ok, f"Evaluación '{nombre}' actualizada correctamente."))
             else:
                 if self.gestor.obtener_evaluacion_por_nombre(nombre):
                     QMessageBox.warning(self, "Evaluación Existente",
                                         f"Ya existe una evaluación con el nombre '{nombre}'. Por favor, use un nombre diferente o edite la existente.")
                     return
-                self.gestor.agregar_evaluacion(evaluacion)
-                QMessageBox.information(self, "Éxito", f"Evaluación '{nombre}' creada correctamente.")
+                self._ejecutar_modificacion(
+                    self.gestor.agregar_evaluacion, evaluacion, descripcion=f"Guardando '{nombre}'...",
+                    al_terminar=lambda ok: self._evaluacion_guardada(ok, f"Evaluación '{nombre}' creada correctamente."))
 
             self.limpiar_campos()
             self.cargar_evaluaciones_en_tabla()
-            self.actualizar_resumen_estadisticas()
 
         except ValueError as ve:
             QMessageBox.warning(self, "Error de Datos", str(ve))
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Ocurrió un error inesperado: {e}")
 
-    def cargar_evaluaciones_en_tabla(self):
-        self.ui.tableWidget_evaluaciones.setRowCount(0)
-
-        filtro_tipo = self.ui.cbFiltro.currentText()
-        evaluaciones_filtradas = self.gestor.filtrar_evaluaciones_por_tipo(filtro_tipo)
-
-        self.ui.tableWidget_evaluaciones.setRowCount(len(evaluaciones_filtradas))
-
-        for row, eval_obj in enumerate(evaluaciones_filtradas):
-            self.ui.tableWidget_evaluaciones.setItem(row, 0, QTableWidgetItem(eval_obj.nombre))
-            self.ui.tableWidget_evaluaciones.setItem(row, 1, QTableWidgetItem(eval_obj.__class__.__name__))
-            self.ui.tableWidget_evaluaciones.setItem(row, 2,
-                                                     QTableWidgetItem(eval_obj.fecha.strftime("%Y-%m-%d")))
-            self.ui.tableWidget_evaluaciones.setItem(row, 3,
-                                                     QTableWidgetItem(f"{eval_obj.puntaje:.1f}"))
-            self.ui.tableWidget_evaluaciones.setItem(row, 4, QTableWidgetItem(
-                f"{eval_obj.calcular_nota():.1f}"))
+    def _evaluacion_guardada(self, exito, mensaje):
+        if exito:
+            QMessageBox.information(self, "Éxito", mensaje)
+        else:
+            QMessageBox.warning(self, "Error", "No se pudo guardar la evaluación en la base de datos.")
 
-        self.ui.tableWidget_evaluaciones.resizeColumnsToContents()
+    def cargar_evaluaciones_en_tabla(self):
+        # La tabla se actualiza sola con cada cambio del gestor; aquí solo se aplica el filtro
+        self.proxy_evaluaciones.establecer_tipo(self.ui.cbFiltro.currentText())
         self.actualizar_resumen_estadisticas()
 
+    def buscar_evaluaciones(self, texto):
+        resultados = self.gestor.buscar(texto, self.LIMITE_BUSQUEDA)
+        self.sugerencias_busqueda.setStringList([e.nombre for e in resultados])
+        if resultados:
+            self.txtBuscar.completer().complete()
+
+    def ir_a_evaluacion(self, texto):
+        """Selecciona en la tabla la evaluación con ese nombre o, si no hay, la primera sugerencia."""
+        evaluacion = self.gestor.obtener_evaluacion_por_nombre(texto)
+        if evaluacion is None:
+            resultados = self.gestor.buscar(texto, 1)
+            if not resultados:
+                self.ui.statusbar.showMessage(f"No se encontraron evaluaciones para '{texto}'.", 5000)
+                return
+            evaluacion = resultados[0]
+        indice = self.modelo_evaluaciones.indice_de_secuencia(
+            self.gestor.evaluaciones.obtener_secuencia(evaluacion.nombre))
+        if not indice.isValid():  # La fila todavía no llegó al modelo
+            return
+        indice_proxy = self.proxy_evaluaciones.mapFromSource(indice)
+        if not indice_proxy.isValid():  # Oculta por el filtro de tipo: se muestran todas
+            self.ui.cbFiltro.setCurrentIndex(0)
+            indice_proxy = self.proxy_evaluaciones.mapFromSource(indice)
+        tabla = self.ui.tableView_evaluaciones
+        tabla.selectRow(indice_proxy.row())
+        tabla.scrollTo(indice_proxy, QAbstractItemView.PositionAtCenter)
+
+    def cargar_siguiente_pagina(self):
+        """Carga en segundo plano la siguiente página pendiente de la base de datos."""
+        if self._tarea_pagina is not None or self.gestor.carga_completa:
+            return
+        self._carga_en_pausa = False
+        self._tarea_pagina = self._ejecutar_modificacion(
+            self.gestor.cargar_siguiente_pagina, al_terminar=self._pagina_cargada,
+            al_fallar=self._pagina_fallida, al_finalizar=self._pagina_finalizada, cancelable=True,
+            descripcion=f"Cargando evaluaciones... ({len(self.gestor.evaluaciones)} cargadas)")
+
+    def _pagina_cargada(self, nuevas):
+        if self.gestor.carga_completa:
+            self._refresco_pendiente = True  # Estadísticas completas al finalizar la tarea
+
+    def _pagina_fallida(self, error):
+        self._carga_en_pausa = True
+        if isinstance(error, TareaCancelada):
+            # La carga se reanuda al desplazarse hasta el final de la tabla
+            self.ui.statusbar.showMessage("Carga de evaluaciones en pausa.", 5000)
+        else:
+            QMessageBox.warning(self, "Carga de Evaluaciones", f"No se pudieron cargar todas las evaluaciones: {error}")
+        self._refresco_pendiente = True
+
+    def _pagina_finalizada(self):
+        tarea, self._tarea_pagina = self._tarea_pagina, None
+        # La siguiente página se pide después de aplicar los refrescos aplazados, así que
+        # cambiar de filtro o actualizar la tabla no espera a que termine toda la carga
+        if not (tarea.cancelada or self._carga_en_pausa):
+            self.cargar_siguiente_pagina()
+
+    def _cargar_al_llegar_al_final(self, valor):
+        barra = self.ui.tableView_evaluaciones.verticalScrollBar()
+        if valor == barra.maximum() and not self.gestor.carga_completa:
+            self.cargar_siguiente_pagina()
+
+    def _evaluaciones_seleccionadas(self):
+        """Evaluaciones de las filas seleccionadas en la tabla, en orden de la vista."""
+        filas = sorted(self.ui.tableView_evaluaciones.selectionModel().selectedRows(), key=lambda i: i.row())
+        return [self.proxy_evaluaciones.evaluacion(index) for index in filas]
+
     def eliminar_evaluacion(self):
-        selected_rows = self.ui.tableWidget_evaluaciones.selectionModel().selectedRows()
-        if not selected_rows:
+        seleccionadas = self._evaluaciones_seleccionadas()
+        if not seleccionadas:
             QMessageBox.warning(self, "Eliminar Evaluación", "Por favor, seleccione una evaluación para eliminar.")
             return
 
@@ -201,22 +393,25 @@ class PersonaServicio(QMainWindow): # Renombrada de MainWindow
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
 
         if reply == QMessageBox.Yes:
-            for index in sorted(selected_rows, reverse=True):
-                nombre_eval = self.ui.tableWidget_evaluaciones.item(index.row(), 0).text()
-                self.gestor.eliminar_evaluacion_por_nombre(nombre_eval)
-            QMessageBox.information(self, "Éxito", "Evaluación(es) eliminada(s) correctamente.")
+            nombres = [eval_obj.nombre for eval_obj in seleccionadas]
+            self._ejecutar_modificacion(
+                self.gestor.eliminar_evaluaciones, nombres, descripcion="Eliminando evaluaciones...",
+                al_terminar=self._evaluaciones_eliminadas)
             self.cargar_evaluaciones_en_tabla()
-            self.actualizar_resumen_estadisticas()
+
+    def _evaluaciones_eliminadas(self, cantidad):
+        if cantidad:
+            QMessageBox.information(self, "Éxito", f"{cantidad} evaluación(es) eliminada(s) correctamente.")
+        else:
+            QMessageBox.warning(self, "Eliminar Evaluación", "No se eliminó ninguna evaluación de la base de datos.")
 
     def mostrar_detalle_evaluacion(self):
-        selected_rows = self.ui.tableWidget_evaluaciones.selectionModel().selectedRows()
-        if not selected_rows:
+        seleccionadas = self._evaluaciones_seleccionadas()
+        if not seleccionadas:
             QMessageBox.warning(self, "Ver Detalle", "Por favor, seleccione una evaluación para ver su detalle.")
             return
 
-        row = selected_rows[0].row()
-        nombre_eval = self.ui.tableWidget_evaluaciones.item(row, 0).text()
-        eval_obj = self.gestor.obtener_evaluacion_por_nombre(nombre_eval)
+        eval_obj = self.gestor.obtener_evaluacion_por_nombre(seleccionadas[0].nombre)
 
         if eval_obj:
             detalle_msg = f"Nombre: {eval_obj.nombre}\n" \
@@ -241,14 +436,12 @@ class PersonaServicio(QMainWindow): # Renombrada de MainWindow
             QMessageBox.warning(self, "Error", "No se pudo encontrar la evaluación seleccionada.")
 
     def seleccionar_evaluacion_para_edicion(self):
-        selected_rows = self.ui.tableWidget_evaluaciones.selectionModel().selectedRows()
-        if not selected_rows:
+        seleccionadas = self._evaluaciones_seleccionadas()
+        if not seleccionadas:
             QMessageBox.warning(self, "Editar Evaluación", "Por favor, seleccione una evaluación para editar.")
             return
 
-        row = selected_rows[0].row()
-        nombre_eval = self.ui.tableWidget_evaluaciones.item(row, 0).text()
-        eval_obj = self.gestor.obtener_evaluacion_por_nombre(nombre_eval)
+        eval_obj = self.gestor.obtener_evaluacion_por_nombre(seleccionadas[0].nombre)
 
         if eval_obj:
             self.limpiar_campos()
@@ -276,19 +469,45 @@ class PersonaServicio(QMainWindow): # Renombrada de MainWindow
             QMessageBox.warning(self, "Error", "No se pudo encontrar la evaluación seleccionada para edición.")
 
     def actualizar_resumen_estadisticas(self):
-        total_evaluaciones = len(self.gestor.evaluaciones)
-        self.ui.lblTotalNumero.setText(str(total_evaluaciones))
+        if self._modificaciones_pendientes:
+            self._refresco_pendiente = True  # Se refresca cuando termine la operación en curso
+            return
+        if not self.gestor.estadisticas_en_servidor:
+            # Agregados en memoria: no se consulta la base de datos
+            self._mostrar_resumen_estadisticas(self.gestor.resumen_estadisticas())
+            return
+        if self._tarea_estadisticas is not None:
+            self._estadisticas_pendientes = True  # Se repite cuando termine el cálculo en curso
+            return
+        # En la base de datos (y tras enviar las escrituras diferidas): en un hilo de lectura, y las
+        # etiquetas se actualizan al terminar
+        self._tarea_estadisticas = self.tareas.ejecutar(
+            self.gestor.resumen_estadisticas, True, escritura=False, descripcion="Calculando estadísticas...",
+            al_terminar=self._mostrar_resumen_estadisticas, al_fallar=self._estadisticas_fallidas,
+            al_finalizar=self._estadisticas_finalizadas)
+
+    def _estadisticas_fallidas(self, error):
+        print(f"Error al calcular las estadísticas en la base de datos; se usan las de memoria: {error}")
+        if not self._modificaciones_pendientes:
+            self._mostrar_resumen_estadisticas(self.gestor.resumen_estadisticas(desde_servidor=False))
+
+    def _estadisticas_finalizadas(self):
+        self._tarea_estadisticas = None
+        if self._estadisticas_pendientes:
+            self._estadisticas_pendientes = False
+            self.actualizar_resumen_estadisticas()
 
-        promedio_general = self.gestor.calcular_promedio_general()
-        self.ui.lblPromedioNumero.setText(f"{promedio_general:.1f}")
+    def _mostrar_resumen_estadisticas(self, resumen):
+        self.ui.lblTotalNumero.setText(str(resumen['total']))
+        self.ui.lblPromedioNumero.setText(f"{resumen['promedio']:.1f}")
 
-        mejor_evaluacion = self.gestor.obtener_mejor_evaluacion()
+        mejor_evaluacion = resumen['mejor']
         if mejor_evaluacion:
             self.ui.lblMejorNombre.setText(f"{mejor_evaluacion.nombre} ({mejor_evaluacion.calcular_nota():.1f})")
         else:
             self.ui.lblMejorNombre.setText("N/A")
 
-        stats_por_tipo = self.gestor.obtener_estadisticas_por_tipo()
+        stats_por_tipo = resumen['por_tipo']
         stats_text = "<h3>Estadísticas por Tipo de Evaluación:</h3>"
         for tipo, stats in stats_por_tipo.items():
             stats_text += f"<h4>{tipo}:</h4>"
@@ -302,73 +521,90 @@ class PersonaServicio(QMainWindow): # Renombrada de MainWindow
 
     def abrir_archivo_evaluaciones(self):
         file_name, _ = QFileDialog.getOpenFileName(self, "Abrir Archivo de Evaluaciones", "",
-                                                   "Archivos JSON (*.json);;Todos los archivos (*)")
+                                                   "Archivos JSON (*.json);;Instantánea binaria (*.evb);;"
+                                                   "Parquet (*.parquet);;Todos los archivos (*)")
         if file_name:
-            try:
-                with open(file_name, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                self.gestor.limpiar_todas_las_evaluaciones()
-
-                for eval_dict in data:
-                    nombre = eval_dict['nombre']
-                    fecha = date.fromisoformat(eval_dict['fecha'])
-                    puntaje = eval_dict['puntaje']
-                    tipo = eval_dict['tipo']
-
-                    eval_obj = None
-                    if tipo == "Examen":
-                        eval_obj = Examen(nombre, fecha, puntaje,
-                                          eval_dict.get('duracion_min', 0),
-                                          eval_dict.get('num_preguntas', 0))
-                    elif tipo == "Trabajo":
-                        eval_obj = Trabajo(nombre, fecha, puntaje,
-                                           eval_dict.get('num_paginas', 0),
-                                           eval_dict.get('tema', ''))
-                    elif tipo == "Presentacion":
-                        eval_obj = Presentacion(nombre, fecha, puntaje,
-                                                eval_dict.get('duracion_min', 0),
-                                                eval_dict.get('tamano_audiencia', 0))
-
-                    if eval_obj:
-                        self.gestor.agregar_evaluacion(eval_obj)
-
-                QMessageBox.information(self, "Abrir Archivo", f"Evaluaciones cargadas desde '{file_name}'.")
-                self.cargar_evaluaciones_en_tabla()
-                self.actualizar_resumen_estadisticas()
-                self.limpiar_campos()
-            except Exception as e:
-                QMessageBox.critical(self, "Error al abrir", f"Ocurrió un error al abrir el archivo: {e}")
+            respuesta = QMessageBox.question(
+                self, "Abrir Archivo",
+                "Las evaluaciones actuales se reemplazarán por las del archivo. Solo se borrarán "
+                "después de comprobar que el archivo se puede leer completo. ¿Desea continuar?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            if respuesta != QMessageBox.Yes:
+                return
+
+            def importar(tarea):
+                importador = ImportadorEvaluaciones(
+                    self.gestor,
+                    progreso=lambda leidos, totales, importadas:
+                        tarea.informar(self._mensaje_progreso_importacion(leidos, totales, importadas,
+                                                                          importador.validando)),
+                    cancelado=lambda: tarea.cancelada)
+                return importador.importar(file_name, reemplazar=True)
+
+            self._ejecutar_modificacion(
+                importar, cancelable=True, descripcion="Importando evaluaciones...",
+                al_terminar=lambda resumen: self._archivo_importado(file_name, resumen),
+                al_fallar=lambda e: QMessageBox.critical(self, "Error al abrir", f"Ocurrió un error al abrir el archivo: {e}"))
+            self.limpiar_campos()
+            self.cargar_evaluaciones_en_tabla()
+
+    def _archivo_importado(self, file_name, resumen):
+        if resumen['cancelada']:
+            QMessageBox.information(self, "Abrir Archivo", "La importación se canceló mientras se comprobaba "
+                                                           "el archivo; no se modificó ninguna evaluación.")
+            return
+        mensaje = f"{resumen['importadas']} evaluaciones cargadas desde '{file_name}'."
+        if resumen['rechazadas']:
+            mensaje += f"\n{resumen['rechazadas']} registros rechazados:\n" + "\n".join(resumen['errores'])
+        QMessageBox.information(self, "Abrir Archivo", mensaje)
+
+    @staticmethod
+    def _mensaje_progreso_importacion(bytes_leidos, bytes_totales, importadas, validando=False):
+        porcentaje = 100 * bytes_leidos // bytes_totales if bytes_totales else 100
+        if validando:
+            return f"Comprobando el archivo... {porcentaje}% ({importadas} evaluaciones válidas)"
+        return f"Importando evaluaciones... {porcentaje}% ({importadas} importadas)"
 
     def guardar_archivo_evaluaciones(self):
         file_name, _ = QFileDialog.getSaveFileName(self, "Guardar Archivo de Evaluaciones", "",
-                                                   "Archivos JSON (*.json);;Todos los archivos (*)")
+                                                   "Archivos JSON (*.json);;JSON comprimido con gzip (*.json.gz);;"
+                                                   "JSON comprimido con zstd (*.json.zst);;Instantánea binaria (*.evb);;"
+                                                   "Parquet (*.parquet);;Todos los archivos (*)")
         if file_name:
-            try:
-                data_to_save = []
-                for eval_obj in self.gestor.evaluaciones:
-                    eval_dict = {
-                        'nombre': eval_obj.nombre,
-                        'fecha': eval_obj.fecha.isoformat(),
-                        'puntaje': eval_obj.puntaje,
-                        'tipo': eval_obj.__class__.__name__
-                    }
-                    if isinstance(eval_obj, Examen):
-                        eval_dict['duracion_min'] = eval_obj.duracion_min
-                        eval_dict['num_preguntas'] = eval_obj.num_preguntas
-                    elif isinstance(eval_obj, Trabajo):
-                        eval_dict['num_paginas'] = eval_obj.num_paginas
-                        eval_dict['tema'] = eval_obj.tema
-                    elif isinstance(eval_obj, Presentacion):
-                        eval_dict['duracion_min'] = eval_obj.duracion_min
-                        eval_dict['tamano_audiencia'] = eval_obj.tamano_audiencia
-                    data_to_save.append(eval_dict)
-
-                with open(file_name, 'w', encoding='utf-8') as f:
-                    json.dump(data_to_save, f, indent=4)
-                QMessageBox.information(self, "Guardar Archivo", f"Evaluaciones guardadas en '{file_name}'.")
-            except Exception as e:
-                QMessageBox.critical(self, "Error al guardar", f"Ocurrió un error al guardar el archivo: {e}")
+            def exportar(tarea):
+                # El archivo debe incluir también las páginas que aún no se habían leído. Se recorre
+                # el almacén en el hilo de escrituras, así que ninguna modificación lo cambia a la vez
+                self.gestor.cargar_todas()
+                if file_name.lower().endswith('.evb'):
+                    # Importación diferida: NumPy solo es necesario para las instantáneas binarias
+                    from src.servicio.instantanea_binaria import guardar_instantanea
+                    exportadas = guardar_instantanea(self.gestor.evaluaciones, file_name)
+                    return {'exportadas': exportadas, 'cancelada': False}
+                if file_name.lower().endswith('.parquet'):
+                    from src.servicio.archivo_parquet import guardar_parquet
+                    return guardar_parquet(
+                        self.gestor.evaluaciones, file_name,
+                        progreso=lambda escritas, totales:
+                            tarea.informar(f"Guardando evaluaciones... {escritas} de {totales}"),
+                        cancelado=lambda: tarea.cancelada)
+                exportador = ExportadorEvaluaciones(
+                    compresion=compresion_por_extension(file_name), incluir_nota=True,
+                    progreso=lambda escritas, totales:
+                        tarea.informar(f"Guardando evaluaciones... {escritas} de {totales}"),
+                    cancelado=lambda: tarea.cancelada)
+                return exportador.exportar(self.gestor.evaluaciones, file_name)
+
+            self._refresco_pendiente = True  # La tabla debe mostrar las páginas leídas para el guardado
+            self._ejecutar_modificacion(
+                exportar, cancelable=True, descripcion=f"Guardando '{file_name}'...",
+                al_terminar=lambda resumen: self._archivo_guardado(file_name, resumen),
+                al_fallar=lambda e: QMessageBox.critical(self, "Error al guardar", f"Ocurrió un error al guardar el archivo: {e}"))
+
+    def _archivo_guardado(self, file_name, resumen):
+        if resumen['cancelada']:
+            self.ui.statusbar.showMessage("Guardado cancelado; el archivo no se modificó.", 5000)
+        else:
+            QMessageBox.information(self, "Guardar Archivo", f"{resumen['exportadas']} evaluaciones guardadas en '{file_name}'.")
 
     def mostrar_acerca_de(self):
         QMessageBox.about(self, "Acerca de Sistema de Gestión de Evaluaciones",
@@ -0,0 +1,144 @@
+# src/servicio/tareas.py
+#nombre participante [ADRIANA BETANCOURTH, LISSETTE DANIELA MERO, WILLIAM VELEZ BARRE]
+import inspect
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class TareaCancelada(Exception):
+    """La tarea se detuvo porque el usuario la canceló."""
+
+
+class SenalesTarea(QObject):
+    """
+    Señales de una tarea. El objeto vive en el hilo de la interfaz, así que las conexiones
+    hechas desde la ventana se entregan en ese hilo aunque la tarea emita desde el pool.
+    """
+    terminada = Signal(object)   # resultado de la función
+    fallida = Signal(object)     # excepción levantada
+    progreso = Signal(str)       # mensaje para la barra de estado
+    finalizada = Signal()        # siempre, al acabar (con éxito, error o cancelación)
+
+
+class Tarea(QRunnable):
+    """
+    Ejecuta funcion(*args, **kwargs) en un hilo del pool. Si la función acepta un parámetro
+    'tarea', recibe esta misma instancia para consultar tarea.cancelada o llamar a
+    tarea.informar(mensaje) mientras trabaja.
+    """
+    def __init__(self, funcion, *args, descripcion="", cancelable=False, **kwargs):
+        super().__init__()
+        self.setAutoDelete(False)  # La referencia la mantiene EjecutorTareas hasta que termina
+        self.funcion = funcion
+        self.args = args
+        self.kwargs = kwargs
+        self.descripcion = descripcion
+        self.cancelable = cancelable
+        self.senales = SenalesTarea()
+        self._cancelada = threading.Event()
+        if self._acepta_tarea(funcion):
+            self.kwargs['tarea'] = self
+
+    @property
+    def cancelada(self):
+        return self._cancelada.is_set()
+
+    def cancelar(self):
+        """Pide la cancelación; la función la atiende en su siguiente punto de control."""
+        if self.cancelable:
+            self._cancelada.set()
+
+    def comprobar_cancelacion(self):
+        """Levanta TareaCancelada si se pidió cancelar la tarea."""
+        if self.cancelada:
+            raise TareaCancelada(f"Operación cancelada: {self.descripcion}")
+
+    def informar(self, mensaje):
+        self.senales.progreso.emit(mensaje)
+
+    def run(self):
+        try:
+            self.comprobar_cancelacion()  # Pudo cancelarse mientras esperaba en la cola
+            resultado = self.funcion(*self.args, **self.kwargs)
+        except Exception as e:
+            self.senales.fallida.emit(e)
+        else:
+            self.senales.terminada.emit(resultado)
+        finally:
+            self.senales.finalizada.emit()
+
+    @staticmethod
+    def _acepta_tarea(funcion):
+        try:
+            return 'tarea' in inspect.signature(funcion).parameters
+        except (TypeError, ValueError):
+            return False
+
+
+class EjecutorTareas(QObject):
+    """
+    Ejecuta operaciones del gestor fuera del hilo de la interfaz.
+    Las escrituras (todo lo que toca la base de datos o la colección en memoria) pasan por un
+    pool de un solo hilo, así que se ejecutan de una en una y en el orden en que se pidieron;
+    las lecturas independientes usan el pool global de Qt.
+    """
+    ocupado_cambiado = Signal(bool)   # True mientras haya alguna tarea pendiente
+    mensaje = Signal(str)             # descripción/progreso de la tarea en curso
+    cancelable_cambiado = Signal(bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._escritura = QThreadPool(self)
+        self._escritura.setMaxThreadCount(1)
+        self._lectura = QThreadPool.globalInstance()
+        self._activas = []
+
+    @property
+    def ocupado(self):
+        return bool(self._activas)
+
+    def ejecutar(self, funcion, *args, al_terminar=None, al_fallar=None, al_finalizar=None,
+                 escritura=True, cancelable=False, descripcion="", **kwargs):
+        """
+        Encola funcion(*args, **kwargs) y retorna la Tarea creada.
+        al_terminar(resultado), al_fallar(excepcion) y al_finalizar() se llaman en el hilo
+        de la interfaz; al_finalizar se llama siempre, después de cualquiera de los otros dos.
+        """
+        tarea = Tarea(funcion, *args, descripcion=descripcion, cancelable=cancelable, **kwargs)
+        if al_terminar:
+            tarea.senales.terminada.connect(al_terminar)
+        if al_fallar:
+            tarea.senales.fallida.connect(al_fallar)
+        if al_finalizar:
+            tarea.senales.finalizada.connect(al_finalizar)
+        tarea.senales.progreso.connect(self.mensaje)
+        tarea.senales.finalizada.connect(lambda: self._finalizar(tarea))
+
+        self._activas.append(tarea)
+        if len(self._activas) == 1:
+            self.ocupado_cambiado.emit(True)
+        self._notificar_estado()
+        (self._escritura if escritura else self._lectura).start(tarea)
+        return tarea
+
+    def cancelar_todas(self):
+        for tarea in self._activas:
+            tarea.cancelar()
+        self._notificar_estado()
+
+    def esperar(self, milisegundos=-1):
+        """Bloquea hasta que terminen las escrituras pendientes (p. ej. al cerrar la ventana)."""
+        return self._escritura.waitForDone(milisegundos)
+
+    def _finalizar(self, tarea):
+        if tarea in self._activas:
+            self._activas.remove(tarea)
+        if not self._activas:
+            self.ocupado_cambiado.emit(False)
+        self._notificar_estado()
+
+    def _notificar_estado(self):
+        if self._activas:
+            self.mensaje.emit(self._activas[0].descripcion)
+        self.cancelable_cambiado.emit(any(t.cancelable and not t.cancelada for t in self._activas))
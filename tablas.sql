@@ -1,9 +1,10 @@
 CREATE TABLE Evaluaciones (
     EvaluacionID INT PRIMARY KEY IDENTITY(1,1), -- Clave primaria autoincremental
-    Nombre VARCHAR(255) NOT NULL UNIQUE,       -- Nombre de la evaluacin (aadido UNIQUE para evitar duplicados por nombre)
+    Nombre NVARCHAR(255) NOT NULL UNIQUE,      -- Nombre de la evaluacin (aadido UNIQUE para evitar duplicados por nombre)
     Fecha DATE NOT NULL,                       -- Fecha de la evaluacin
     Puntaje DECIMAL(5, 2) NOT NULL,            -- Puntaje de la evaluacin (ej. 95.50)
     TipoEvaluacion VARCHAR(50) NOT NULL,       -- Para identificar el tipo (Examen, Trabajo, Presentacion)
+    Version ROWVERSION,                        -- Cambia en cada INSERT/UPDATE: marca de agua de la cach local
     CONSTRAINT CK_Puntaje CHECK (Puntaje >= 0.00 AND Puntaje <= 100.00) -- Restriccin para el puntaje
 );
 
@@ -14,6 +15,7 @@ CREATE TABLE Examenes (
     EvaluacionID INT UNIQUE NOT NULL,          -- Clave fornea, debe ser nica para cada evaluacin
     Duracion INT NOT NULL,                     -- Duracin del examen en minutos (Corregido a PascalCase)
     NumPreguntas INT NOT NULL,                 -- Nmero de preguntas (Corregido a PascalCase)
+    Version ROWVERSION,
     CONSTRAINT FK_Examenes_Evaluaciones FOREIGN KEY (EvaluacionID)
         REFERENCES Evaluaciones(EvaluacionID)
         ON DELETE CASCADE,                      -- Si se borra la evaluacin, se borra el examen
@@ -27,7 +29,8 @@ CREATE TABLE Trabajos (
     TrabajoID INT PRIMARY KEY IDENTITY(1,1),
     EvaluacionID INT UNIQUE NOT NULL,          -- Clave fornea, debe ser nica para cada evaluacin
     NumPaginas INT NOT NULL,                   -- Nmero de pginas del trabajo (Aadido y en PascalCase)
-    Tema VARCHAR(500) NOT NULL,                -- Tema del trabajo (Aadido y en PascalCase)
+    Tema NVARCHAR(500) NOT NULL,               -- Tema del trabajo (Aadido y en PascalCase)
+    Version ROWVERSION,
     CONSTRAINT FK_Trabajos_Evaluaciones FOREIGN KEY (EvaluacionID)
         REFERENCES Evaluaciones(EvaluacionID)
         ON DELETE CASCADE,
@@ -41,10 +44,145 @@ CREATE TABLE Presentaciones (
     EvaluacionID INT UNIQUE NOT NULL,          -- Clave fornea, debe ser nica para cada evaluacin
     Duracion INT NOT NULL,                     -- Duracin de la presentacin en minutos (Aadido y en PascalCase)
     TamanoAudiencia INT NOT NULL,              -- Tamao de la audiencia (Aadido y en PascalCase)
+    Version ROWVERSION,
     CONSTRAINT FK_Presentaciones_Evaluaciones FOREIGN KEY (EvaluacionID)
         REFERENCES Evaluaciones(EvaluacionID)
         ON DELETE CASCADE,
     CONSTRAINT CK_DuracionPresentacion CHECK (Duracion > 0),
     CONSTRAINT CK_TamanoAudiencia CHECK (TamanoAudiencia > 0)
 );
-GO
\ No newline at end of file
+GO
+
+-- Nombre y Tema son NVARCHAR, igual que los parmetros de la aplicacin (pyodbc enva los str como
+-- NVARCHAR, y #LoteEvaluaciones y OPENJSON declaran NVARCHAR): los caracteres fuera de la pgina de
+-- cdigos no se guardan como '?' y las comparaciones no tienen que convertir la columna.
+-- Para una base de datos ya creada con VARCHAR, antes se borran las vistas VW_Notas* de la seccin 6
+-- (dependen de Nombre con SCHEMABINDING) y la restriccin UNIQUE de Nombre (su nombre lo gener el servidor):
+-- ALTER TABLE Evaluaciones ALTER COLUMN Nombre NVARCHAR(255) NOT NULL;
+-- ALTER TABLE Evaluaciones ADD CONSTRAINT UQ_Evaluaciones_Nombre UNIQUE (Nombre);
+-- ALTER TABLE Trabajos ALTER COLUMN Tema NVARCHAR(500) NOT NULL;
+-- (y a continuacin se vuelven a crear las vistas y sus ndices)
+
+-- 5. Seguimiento de cambios para la cach local
+-- La aplicacin guarda una copia local con la marca de agua (MIN_ACTIVE_ROWVERSION) de su ltima
+-- lectura y al iniciar solo pide las filas con Version mayor o igual a esa marca. Los borrados no
+-- dejan fila, as que un trigger anota el EvaluacionID eliminado con su propia Version.
+-- Esas anotaciones se purgan pasado un plazo (ver PurgarEvaluacionesEliminadas); la Version ms
+-- alta purgada queda en HorizonteEliminadas, y una copia local con una marca que no la supera
+-- puede haber perdido borrados, as que la aplicacin la descarta y hace una carga completa.
+CREATE INDEX IX_Evaluaciones_Version ON Evaluaciones (Version);
+CREATE INDEX IX_Examenes_Version ON Examenes (Version);
+CREATE INDEX IX_Trabajos_Version ON Trabajos (Version);
+CREATE INDEX IX_Presentaciones_Version ON Presentaciones (Version);
+
+CREATE TABLE EvaluacionesEliminadas (
+    EvaluacionID INT NOT NULL,                 -- ID de la evaluacin borrada
+    Version ROWVERSION,                        -- Momento del borrado en la misma escala que las tablas
+    Eliminada DATETIME2 NOT NULL               -- Fecha del borrado (UTC), para la retencin
+        CONSTRAINT DF_EvaluacionesEliminadas_Eliminada DEFAULT SYSUTCDATETIME(),
+    CONSTRAINT PK_EvaluacionesEliminadas PRIMARY KEY (Version)
+);
+CREATE INDEX IX_EvaluacionesEliminadas_Eliminada ON EvaluacionesEliminadas (Eliminada);
+
+-- Una sola fila: la Version ms alta de las anotaciones ya purgadas
+CREATE TABLE HorizonteEliminadas (
+    Id TINYINT NOT NULL CONSTRAINT PK_HorizonteEliminadas PRIMARY KEY CONSTRAINT CK_HorizonteEliminadas_Id CHECK (Id = 1),
+    Version BINARY(8) NOT NULL
+);
+INSERT INTO HorizonteEliminadas (Id, Version) VALUES (1, 0x0000000000000000);
+GO
+
+-- Con este trigger, un DELETE sobre Evaluaciones solo admite OUTPUT ... INTO (variable o tabla)
+CREATE TRIGGER TR_Evaluaciones_Eliminadas ON Evaluaciones
+AFTER DELETE
+AS
+BEGIN
+    SET NOCOUNT ON;
+    INSERT INTO EvaluacionesEliminadas (EvaluacionID) SELECT EvaluacionID FROM deleted;
+END;
+GO
+
+-- Retencin: borra las anotaciones con ms de @DiasRetencion das y adelanta el horizonte en la
+-- misma transaccin. Se programa con un trabajo del Agente SQL Server, p. ej. cada noche:
+--   EXEC dbo.PurgarEvaluacionesEliminadas @DiasRetencion = 30;
+-- Una copia local sin abrir durante ms de ese plazo se vuelve a cargar completa.
+CREATE PROCEDURE dbo.PurgarEvaluacionesEliminadas @DiasRetencion INT = 30
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SET XACT_ABORT ON;
+    DECLARE @Horizonte BINARY(8);
+    BEGIN TRANSACTION;
+    SELECT @Horizonte = MAX(Version)
+    FROM EvaluacionesEliminadas
+    WHERE Eliminada < DATEADD(DAY, -@DiasRetencion, SYSUTCDATETIME());
+    IF @Horizonte IS NOT NULL
+    BEGIN
+        DELETE FROM EvaluacionesEliminadas WHERE Version <= @Horizonte;
+        UPDATE HorizonteEliminadas SET Version = @Horizonte WHERE Id = 1 AND Version < @Horizonte;
+    END;
+    COMMIT TRANSACTION;
+END;
+GO
+
+-- Para una base de datos ya creada con el esquema anterior:
+-- ALTER TABLE Evaluaciones ADD Version ROWVERSION;
+-- ALTER TABLE Examenes ADD Version ROWVERSION;
+-- ALTER TABLE Trabajos ADD Version ROWVERSION;
+-- ALTER TABLE Presentaciones ADD Version ROWVERSION;
+-- (y a continuacin los ndices, las tablas, el trigger y el procedimiento de esta seccin)
+-- Si EvaluacionesEliminadas ya existe, sin la columna de retencin:
+-- ALTER TABLE EvaluacionesEliminadas ADD Eliminada DATETIME2 NOT NULL
+--     CONSTRAINT DF_EvaluacionesEliminadas_Eliminada DEFAULT SYSUTCDATETIME();
+-- (y a continuacin su ndice, HorizonteEliminadas y el procedimiento)
+
+-- 6. Notas calculadas en el servidor para las estadsticas
+-- Una vista indexada por subtipo materializa la nota con la misma frmula (y el mismo orden de
+-- operaciones en FLOAT) que calcular_nota(), as que cada nota coincide con la de Python.
+-- Nota es FLOAT (impreciso), as que no puede ser clave de un ndice de la vista: la mejor
+-- evaluacin de cada tipo sale de un TOP (1) que recorre el ndice agrupado sin ordenar la vista.
+-- Las vistas indexadas exigen estas opciones al crearlas y al modificar las tablas.
+SET ANSI_NULLS ON;
+SET QUOTED_IDENTIFIER ON;
+GO
+
+CREATE VIEW dbo.VW_NotasExamenes WITH SCHEMABINDING AS
+SELECT e.EvaluacionID, e.Nombre,
+       (CAST(e.Puntaje AS FLOAT) * x.NumPreguntas / 100) / (CAST(x.Duracion AS FLOAT) / 60) AS Nota
+FROM dbo.Evaluaciones AS e
+JOIN dbo.Examenes AS x ON x.EvaluacionID = e.EvaluacionID
+WHERE e.TipoEvaluacion = 'Examen';
+GO
+CREATE UNIQUE CLUSTERED INDEX IX_VW_NotasExamenes ON dbo.VW_NotasExamenes (EvaluacionID);
+GO
+
+CREATE VIEW dbo.VW_NotasTrabajos WITH SCHEMABINDING AS
+SELECT e.EvaluacionID, e.Nombre,
+       CAST(e.Puntaje AS FLOAT) * (1 + (CAST(t.NumPaginas AS FLOAT) / 100)) AS Nota
+FROM dbo.Evaluaciones AS e
+JOIN dbo.Trabajos AS t ON t.EvaluacionID = e.EvaluacionID
+WHERE e.TipoEvaluacion = 'Trabajo';
+GO
+CREATE UNIQUE CLUSTERED INDEX IX_VW_NotasTrabajos ON dbo.VW_NotasTrabajos (EvaluacionID);
+GO
+
+CREATE VIEW dbo.VW_NotasPresentaciones WITH SCHEMABINDING AS
+SELECT e.EvaluacionID, e.Nombre,
+       CAST(e.Puntaje AS FLOAT) * (1 + (CAST(p.TamanoAudiencia AS FLOAT) / 200)) AS Nota
+FROM dbo.Evaluaciones AS e
+JOIN dbo.Presentaciones AS p ON p.EvaluacionID = e.EvaluacionID
+WHERE e.TipoEvaluacion = 'Presentacion';
+GO
+CREATE UNIQUE CLUSTERED INDEX IX_VW_NotasPresentaciones ON dbo.VW_NotasPresentaciones (EvaluacionID);
+GO
+
+-- Todas las notas con su tipo. NOEXPAND hace que se lean los ndices de las vistas tambin
+-- en las ediciones que no las usan por s solas; el tipo constante de cada rama permite
+-- descartar las otras dos cuando se filtra por TipoEvaluacion.
+CREATE VIEW dbo.VW_NotasEvaluaciones AS
+SELECT 'Examen' AS TipoEvaluacion, EvaluacionID, Nombre, Nota FROM dbo.VW_NotasExamenes WITH (NOEXPAND)
+UNION ALL
+SELECT 'Trabajo', EvaluacionID, Nombre, Nota FROM dbo.VW_NotasTrabajos WITH (NOEXPAND)
+UNION ALL
+SELECT 'Presentacion', EvaluacionID, Nombre, Nota FROM dbo.VW_NotasPresentaciones WITH (NOEXPAND);
+GO